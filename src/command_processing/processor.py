@@ -1,13 +1,20 @@
 import logging
 import re
+import sys
 import datetime
 import os
 import json
 import random
-import requests
-import wikipedia
+import functools
+import heapq
+import itertools
+import asyncio
+import inspect
+import threading
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from openai import OpenAI
 from dotenv import load_dotenv
 
 # Import the SystemHandler
@@ -18,187 +25,666 @@ from src.system_operations.system_analyzer import SystemAnalyzer
 from src.system_operations.device_monitor import DeviceMonitor
 # Import the SecurityManager
 from src.system_operations.security_manager import SecurityManager
+from src.utils.path_cache import PathCache
 
 logger = logging.getLogger("JARVIS.Processor")
 
-class CommandProcessor:
-    def __init__(self, speaker):
-        """Initialize command processor"""
-        self.speaker = speaker
+# Load environment variables once at import rather than on every instantiation
+load_dotenv()
+
+# Prefer Google's RE2 (linear-time, no backtracking) for command dispatch when it's installed
+try:
+    import re2 as dispatch_re
+except ImportError:
+    dispatch_re = re
+
+# Named-group openers in the command patterns, e.g. (?P<location>
+_GROUP_NAME_RE = re.compile(r'\(\?P<(\w+)>')
+
+# System prompts for OpenAI replies, kept as ready-made message heads
+_SYS_PROMPT_ANSWER = "You are JARVIS, a helpful AI assistant like in Iron Man. Keep responses brief and factual."
+_SYS_PROMPT_DEFAULT = "You are JARVIS, a helpful AI assistant like in Iron Man. Keep responses brief and helpful."
+_ANSWER_MSGS_HEAD = ({"role": "system", "content": _SYS_PROMPT_ANSWER},)
+_DEFAULT_MSGS_HEAD = ({"role": "system", "content": _SYS_PROMPT_DEFAULT},)
+
+# Clock lookup and formats for the time and date replies
+_now = datetime.datetime.now
+_TIME_FMT = "%I:%M %p"
+_DATE_FMT = "%A, %B %d, %Y"
+
+# Spoken while waiting on a slow OpenAI reply
+_FILLER_DELAY = 1.0
+_FILLER_REPLY = "Working on that."
+_OPENAI_ERROR_REPLY = "I had trouble connecting to my knowledge base. Let me try a different approach."
+
+# Fixed replies spoken often enough that their synthesized audio is worth keeping on disk
+_SYSTEM_UNAVAILABLE_REPLY = "I'm sorry, system operations are not available at the moment."
+_ANALYZER_UNAVAILABLE_REPLY = "I'm sorry, system analysis capabilities are not available at the moment."
+_DEVICES_UNAVAILABLE_REPLY = "I'm sorry, device monitoring capabilities are not available at the moment."
+_SECURITY_UNAVAILABLE_REPLY = "Security management is not available."
+_NOT_CAUGHT_REPLY = "I didn't catch that. Can you please repeat?"
+_NOT_UNDERSTOOD_REPLY = "I'm sorry, I don't understand that command."
+
+# Completed OpenAI replies are replayed for identical prompts within the TTL
+_OPENAI_CACHE_TTL = 3600
+_OPENAI_CACHE_SIZE = 128
+
+# Sentence boundaries in streamed replies, so each sentence can be spoken as soon as it arrives
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Argument extraction used by handlers when a value wasn't captured by the dispatch pattern
+_Q_SUBJECT_RE = re.compile(r'(what|who|where|when) (?:is|are|was|were) (.*)', re.IGNORECASE)
+_ENABLE_RE = re.compile(r"(?:enable|turn on) (.+?) (?:data collection|tracking|monitoring)", re.IGNORECASE)
+_DISABLE_RE = re.compile(r"(?:disable|turn off) (.+?) (?:data collection|tracking|monitoring)", re.IGNORECASE)
+_ADD_SENS_RE = re.compile(r"add sensitive directory (.+)", re.IGNORECASE)
+# Bare answers to a pending yes/no confirmation; group 1 is set for an affirmative answer
+_YES_NO_RE = re.compile(r"(?:(yes|yeah|yep|sure|confirm)|no|nope|cancel)[.!]?", re.IGNORECASE)
+
+# Spoken privacy setting names mapped to SecurityManager setting keys
+_PRIVACY_SETTING_MAP = {
+    "system info": "collect_system_info",
+    "system information": "collect_system_info",
+    "usage": "collect_usage_data",
+    "usage data": "collect_usage_data",
+    "command history": "store_command_history",
+    "network": "allow_network_access",
+    "internet": "allow_network_access",
+    "file system": "allow_file_system_access",
+    "file access": "allow_file_system_access",
+    "file": "allow_file_system_access",
+    "process": "allow_process_management",
+    "application": "allow_process_management"
+}
+
+# Privacy settings reported by "show privacy settings", with their spoken labels
+_PRIVACY_LABELS = (
+    ("collect_system_info", "System information collection"),
+    ("collect_usage_data", "Usage data collection"),
+    ("store_command_history", "Command history storage"),
+    ("allow_network_access", "Network access"),
+    ("allow_file_system_access", "File system access"),
+    ("allow_process_management", "Application management")
+)
+
+@functools.lru_cache(maxsize=32)
+def _privacy_status(flags, dir_count):
+    """Render the privacy settings summary for a tuple of _PRIVACY_LABELS flags"""
+    enabled = [name for (_, name), on in zip(_PRIVACY_LABELS, flags) if on]
+    disabled = [name for (_, name), on in zip(_PRIVACY_LABELS, flags) if not on]
+    
+    parts = ["Current privacy settings: "]
+    if enabled:
+        parts.append(f"Enabled: {', '.join(enabled)}. ")
+    if disabled:
+        parts.append(f"Disabled: {', '.join(disabled)}. ")
+    if dir_count:
+        parts.append(f"Protected directories: {dir_count}.")
+    return "".join(parts)
+
+# Shell commands Jarvis refuses to execute
+_DANGEROUS_CMD_SUBSTR = ('rm -rf', 'deltree', 'format', 'del /f', 'drop database')
+_DANGEROUS_CMD_RE = re.compile('|'.join(map(re.escape, _DANGEROUS_CMD_SUBSTR)), re.IGNORECASE)
+
+# Command output is spoken in sentence/line sized chunks, capped at _OUTPUT_LIMIT characters
+_OUTPUT_LIMIT = 500
+_OUTPUT_SPLIT_RE = re.compile(r'(?<=[.!?\n])\s+')
+_OUTPUT_ABBREV_RE = re.compile(r'\b(?:e\.g|i\.e|etc|vs|mr|mrs|dr|st|no)\.\Z', re.IGNORECASE)
+_OUTPUT_MIN_CHUNK = 10
+_OUTPUT_SLICE = 80
+
+def _output_chunks(text):
+    """Split command output into speakable chunks, merging fragments that are too short
+    or end in an abbreviation into the following piece. The last chunk is returned
+    separately since it may still grow with more output."""
+    pieces = _OUTPUT_SPLIT_RE.split(text)
+    if len(pieces) == 1 and len(text) > _OUTPUT_SLICE:
+        pieces = [text[i:i + _OUTPUT_SLICE] for i in range(0, len(text), _OUTPUT_SLICE)]
+    
+    chunks = []
+    buf = ""
+    for piece in pieces:
+        piece = piece.strip()
+        if not piece:
+            continue
+        buf = f"{buf} {piece}" if buf else piece
+        if len(buf) >= _OUTPUT_MIN_CHUNK and not _OUTPUT_ABBREV_RE.search(buf):
+            chunks.append(buf)
+            buf = ""
+    return chunks, buf
+
+# Keyword checks for commands that fell through to the default response
+_SYS_OP_RE = re.compile(r'\b(?:create|make|open|launch|start|run|execute|delete|remove|folder|directory|file)\b')
+_LAUNCH_RE = re.compile(r'\b(?:open|launch|start|run)\b')
+
+_DIR_WORD_RE = re.compile(r'\b(?:folder|directory|dir)\b')
+_FILE_WORD_RE = re.compile(r'file')
+_CREATE_RE = re.compile(r'\b(?:create|make)\b')
+_DELETE_RE = re.compile(r'\b(?:delete|remove)\b')
+_UPDATE_RE = re.compile(r'\b(?:update|rename)\b')
+_INSERT_RE = re.compile(r'insert')
+
+# Directory and file requests that fell through without a target, checked in order: (subject, verb, prompt)
+_INCOMPLETE_OP_PROMPTS = (
+    (_DIR_WORD_RE, _DELETE_RE, "Please specify the name of the directory you want to delete."),
+    (_DIR_WORD_RE, _UPDATE_RE, "Please specify the name of the directory you want to update or rename."),
+    (_DIR_WORD_RE, _INSERT_RE, "Please specify the directory where you want to insert a file."),
+    (_FILE_WORD_RE, _CREATE_RE, "Please specify a name for the file you want to create."),
+)
+
+# Vendors and products worth mentioning when listing installed applications
+_NOTABLE_APPS_RE = re.compile(r'microsoft|adobe|google|chrome|firefox|office|visual studio|nvidia|intel|amd', re.IGNORECASE)
+
+# Canned replies, cycled through in a shuffled order
+_MOOD_REPLIES = (
+    "I'm functioning within normal parameters, thank you for asking.",
+    "All systems are operating at optimal efficiency.",
+    "I'm doing well, sir. How can I assist you today?",
+    "I'm operating at peak performance levels."
+)
+_YOURE_WELCOME_REPLIES = (
+    "You're welcome, sir.",
+    "Happy to be of service.",
+    "At your service, sir.",
+    "It's my pleasure."
+)
+_FALLBACK_REPLIES = (
+    "I'm not sure how to help with that. Try asking about the time, weather, or for general information.",
+    "I don't understand that command. Say 'help' for a list of things I can do.",
+    "Could you please rephrase that?",
+    "I'm afraid I don't have a response for that.",
+    "I'm still learning. I don't know how to respond to that yet."
+)
+
+# Spoken by the help command
+_HELP_TEXT = """
+        I can help you with various tasks. Here are some things you can ask me:
         
-        # Load environment variables
-        load_dotenv()
+        For time and date: "What time is it?" or "What's today's date?"
         
-        # Initialize system handler
-        try:
-            self.system_handler = SystemHandler()
-            logger.info("System operations handler initialized")
-        except Exception as e:
-            logger.error(f"Error initializing system handler: {e}")
-            self.system_handler = None
+        For information: "Who is Albert Einstein?" or "Tell me about quantum physics"
+        
+        For system operations:
+          - Open applications: "Open VS Code" or "Launch Chrome"
+          - File operations: "Create a file called notes.txt" or "Delete file temp.txt"
+          - Directory operations: "Create a folder called Projects" or "Make directory Documents/Work"
+          - Execute commands: "Run command dir" or "Execute command ipconfig"
         
-        # Initialize system analyzer
+        For system analysis:
+          - System information: "Tell me about my computer" or "What's my system info"
+          - Hardware details: "What's my CPU info" or "Tell me about my memory"
+          - Storage analysis: "What's my disk info" or "Analyze files in C:\\Users"
+          - Process management: "What processes are running" or "List installed applications"
+          - File operations: "Search for *.jpg in Downloads" or "Find documents in C:\\Users"
+        
+        For device monitoring:
+          - Overview: "What devices are connected" or "Tell me about my peripherals"
+          - Display info: "Tell me about my monitors" or "What displays do I have"
+          - Peripheral info: "What USB devices are connected" or "Tell me about my printers"
+          - Audio devices: "What audio devices are connected" or "Tell me about my speakers"
+          - Device detection: "Scan for new devices" or "Check for newly connected devices"
+        
+        For security and privacy:
+          - View settings: "Show privacy settings" or "Is my data secure?"
+          - Manage settings: "Enable file system data collection" or "Disable usage tracking"
+          - Protect data: "Add sensitive directory Documents/Personal" or "Show data access log"
+          - Clear data: "Clear all my data"
+        
+        For weather: "What's the weather like in New York?" (requires API integration)
+        
+        You can also ask about myself: "Who are you?" or "How are you today?"
+        
+        To exit, simply say "Goodbye" or "Exit"
+        """
+
+# Pre-split into sentences and paragraphs so help starts playing without waiting for the whole text
+_HELP_SENTENCES = tuple(s.strip() for s in re.split(r'(?<=[.!?])\s+|\n\s*\n', _HELP_TEXT) if s.strip())
+
+_CACHED_REPLIES = frozenset((
+    _FILLER_REPLY, _OPENAI_ERROR_REPLY,
+    _SYSTEM_UNAVAILABLE_REPLY, _ANALYZER_UNAVAILABLE_REPLY, _DEVICES_UNAVAILABLE_REPLY, _SECURITY_UNAVAILABLE_REPLY,
+    _NOT_CAUGHT_REPLY, _NOT_UNDERSTOOD_REPLY,
+    *_MOOD_REPLIES, *_YOURE_WELCOME_REPLIES, *_FALLBACK_REPLIES
+))
+
+@functools.lru_cache(maxsize=256)
+def _wiki_summary(subject, sentences=2):
+    """Look up a Wikipedia summary, or None if there is no usable page. Repeated subjects are served from the cache"""
+    import wikipedia
+    
+    try:
+        return wikipedia.summary(subject, sentences=sentences)
+    except wikipedia.exceptions.DisambiguationError as e:
+        # If ambiguous, just pick the first option
         try:
-            self.system_analyzer = SystemAnalyzer()
-            logger.info("System analyzer initialized")
-        except Exception as e:
-            logger.error(f"Error initializing system analyzer: {e}")
-            self.system_analyzer = None
+            return wikipedia.summary(e.options[0], sentences=sentences)
+        except (wikipedia.exceptions.DisambiguationError, wikipedia.exceptions.PageError):
+            return None
+    except wikipedia.exceptions.PageError:
+        return None
+
+def _require_arg(name, prompt):
+    """Decorate a system-operation handler so it only runs with system operations available and a non-empty name argument"""
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(self, command_text, **kwargs):
+            if not self.system_handler:
+                self._speech_q.put(_SYSTEM_UNAVAILABLE_REPLY)
+                return
             
-        # Initialize device monitor
-        try:
-            self.device_monitor = DeviceMonitor()
-            logger.info("Device monitor initialized")
-        except Exception as e:
-            logger.error(f"Error initializing device monitor: {e}")
-            self.device_monitor = None
+            value = kwargs.get(name)
+            if not value or not value.strip():
+                self._speech_q.put(f"Sorry, I didn't catch {prompt}.")
+                return
+            
+            kwargs[name] = value.strip()
+            return handler(self, command_text, **kwargs)
+        return wrapper
+    return decorator
+
+class CommandProcessor:
+    # (pattern, handler method name) pairs, combined into a single alternation so each command is matched in one pass
+    _PATTERNS = (
+        # Time and date
+        (r'\Awhat (?:time|day|date) is it', '_get_time_date'),
+        (r'\A(?:current|today\'s) (?:time|date)', '_get_time_date'),
+        (r'\A(?:tell me|what\'s) the (?:time|date)', '_get_time_date'),
+        
+        # Weather 
+        (r'\A(?:what\'s|what is|how\'s) the weather(?: like)?(?: today| now)?(?: in (?P<location>.+))?', '_get_weather'),
+        (r'\A(?:weather|temperature|forecast)(?: in| for)? (?P<location>.+)', '_get_weather'),
+        
+        # System Analysis Commands
+        (r'\A(?:tell me|what\'s|what is)(?: about)?(?: my)? (?:system|pc|computer)(?: info| information)?', '_get_system_info'),
+        (r'\A(?:system|pc|computer)(?: information| info)', '_get_system_info'),
+        (r'\A(?:tell me|what\'s|what is)(?: about)?(?: my)? (?:cpu|processor)(?: info| information)?', '_get_cpu_info'),
+        (r'\A(?:tell me|what\'s|what is)(?: about)?(?: my)? (?:memory|ram)(?: info| information)?', '_get_memory_info'),
+        (r'\A(?:tell me|what\'s|what is)(?: about)?(?: my)? (?:disk|storage|drive)(?: info| information)?', '_get_disk_info'),
+        (r'\A(?:tell me|what\'s|what is)(?: about)?(?: my)? (?:network|internet)(?: info| information)?', '_get_network_info'),
+        (r'\A(?:tell me|what\'s|what is)(?: about)?(?: my)? (?:graphics|gpu|video card)(?: info| information)?', '_get_graphics_info'),
+        (r'\A(?:show|list|what) (?:processes|applications)(?: are)? running', '_get_running_processes'),
+        (r'\A(?:show|list|what) (?:applications|programs|software)(?: are)? installed', '_get_installed_applications'),
+        (r'\A(?:tell me|what\'s|what is)(?: the)? (?:system|pc|computer) health', '_get_system_health'),
+        (r'\A(?:search|find)(?: for)?(?: files)? (?P<pattern>.+?)(?: in| within)? (?P<path>.+)', '_search_files'),
+        (r'\A(?:analyze|examine)(?: the)? (?:files|file types)(?: in| within)? (?P<directory>.+)', '_analyze_file_types'),
+        
+        # Device Monitor Commands
+        (r'\A(?:tell me|what|which)(?: about)?(?: my)? (?:devices|peripherals)(?: are connected| do i have)', '_get_connected_devices'),
+        (r'\A(?:tell me|what)(?: about)?(?: my)? (?:monitor|display|screen)s?(?: info| information)?', '_get_monitor_info'),
+        (r'\A(?:tell me|what)(?: about)?(?: my)? (?:printer|printing device)s?(?: info| information)?', '_get_printer_info'),
+        (r'\A(?:tell me|what)(?: about)?(?: my)? (?:usb|usb device)s?(?: info| information)?', '_get_usb_devices'),
+        (r'\A(?:tell me|what)(?: about)?(?: my)? (?:audio|sound|speaker|microphone)(?: device)?s?(?: info| information)?', '_get_audio_devices'),
+        (r'\A(?:tell me|what)(?: about)?(?: my)? (?:bluetooth|bt)(?: device)?s?(?: info| information)?', '_get_bluetooth_devices'),
+        (r'\A(?:scan|check)(?: for)? (?:new|newly connected) devices', '_scan_for_new_devices'),
+        
+        # System operations - Applications
+        (r'\Aopen (?P<app_name>.+?)(?:\s+with\s+(?P<args>.+))?$', '_open_application'),
+        (r'\Alaunch (?P<app_name>.+?)(?:\s+with\s+(?P<args>.+))?$', '_open_application'),
+        (r'\Astart (?P<app_name>.+?)(?:\s+with\s+(?P<args>.+))?$', '_open_application'),
+        (r'\Arun (?P<app_name>.+?)(?:\s+with\s+(?P<args>.+))?$', '_open_application'),
+        
+        # System operations - Directories
+        (r'\Acreate (?:a )?(?:folder|directory|dir)(?: called| named)? (?P<dir_path>.+)', '_create_directory'),
+        (r'\Amake (?:a )?(?:folder|directory|dir)(?: called| named)? (?P<dir_path>.+)', '_create_directory'),
+        (r'\Acreate (?:a )?(?:folder|directory|dir)$', '_create_directory_prompt'),
+        (r'\Amake (?:a )?(?:folder|directory|dir)$', '_create_directory_prompt'),
+        (r'\Adelete (?:the )?(?:folder|directory|dir)(?: called| named)? (?P<dir_path>.+)', '_delete_directory'),
+        (r'\Aremove (?:the )?(?:folder|directory|dir)(?: called| named)? (?P<dir_path>.+)', '_delete_directory'),
+        (r'\Aupdate (?:the )?(?:folder|directory|dir)(?: called| named)? (?P<dir_path>.+)', '_update_directory'),
+        (r'\Ainsert (?:into )?(?:folder|directory|dir)(?: called| named)? (?P<dir_path>.+)', '_insert_into_directory'),
+        
+        # System operations - Files
+        (r'\Acreate (?:a )?file(?: called| named)? (?P<file_path>.+)', '_create_file'),
+        (r'\Amake (?:a )?file(?: called| named)? (?P<file_path>.+)', '_create_file'),
+        (r'\Adelete(?: the| my)?(?: file| directory| folder)? (?P<path>.+)', '_delete_item'),
+        (r'\Aremove(?: the| my)?(?: file| directory| folder)? (?P<path>.+)', '_delete_item'),
+        
+        # System operations - Commands
+        (r'\Aexecute(?: the)? command (?P<command>.+)', '_execute_command'),
+        (r'\Arun(?: the)? command (?P<command>.+)', '_execute_command'),
+        
+        # General knowledge
+        (r'\A(?:who|what|when|where|why|how) (?:is|are|was|were|do|does|did) .+', '_answer_question'),
+        (r'\Atell me (?:about|something about) .+', '_answer_question'),
+        
+        # System commands
+        (r'\A(?:exit|quit|shutdown|bye|goodbye)', '_shutdown'),
+        
+        # Personality responses
+        (r'\A(?:who are you|what are you|tell me about yourself)', '_introduce_self'),
+        (r'\A(?:how are you|how do you feel)', '_mood_response'),
+        (r'\A(?:thank you|thanks)', '_youre_welcome'),
+        
+        # Help command
+        (r'\A(?:help|what can you do|commands|list commands)', '_help_command'),
+        
+        # Security and Privacy commands
+        (r"\A(?:enable|turn on) (?P<setting>.+?) (?:data collection|tracking|monitoring)", '_handle_enable_privacy_setting'),
+        (r"\A(?:disable|turn off) (?P<setting>.+?) (?:data collection|tracking|monitoring)", '_handle_disable_privacy_setting'),
+        (r"\Ashow (?:my )?privacy settings", '_handle_show_privacy_settings'),
+        (r"\Aclear (?:all )?(?:my )?data", '_handle_clear_data'),
+        (r"\Aadd sensitive directory (?P<directory>.+)", '_handle_add_sensitive_directory'),
+        (r"\Ashow data access (?:log|history)", '_handle_show_data_access_log'),
+        (r"\A(?:is my data secure|how secure is my data)", '_handle_data_security_status'),
+        
+        # Fallback pattern - must be last
+        (r'\A.+', '_default_response')
+    )
+    
+    # Compiled from _PATTERNS once and shared by every instance
+    _command_re = None
+    _command_handlers = None
+    _exact_commands = None
+    
+    def __init__(self, speaker):
+        """Initialize command processor"""
+        self.speaker = speaker
         
-        # Initialize security manager
-        try:
-            self.security_manager = SecurityManager()
-            logger.info("Security manager initialized")
-        except Exception as e:
-            logger.error(f"Error initializing security manager: {e}")
-            self.security_manager = None
+        # Speech is queued and played by a worker thread, so handlers keep working while it plays
+        self._speech_q = queue.Queue()
+        threading.Thread(target=self._speech_worker, name="JARVIS-TTS", daemon=True).start()
+        
+        # Initialize the subsystems in parallel, since each spends its startup waiting on WMI/PowerShell/disk
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            system_handler = executor.submit(SystemHandler)
+            system_analyzer = executor.submit(SystemAnalyzer)
+            device_monitor = executor.submit(DeviceMonitor)
+            security_manager = executor.submit(SecurityManager)
+        
+        self.system_handler = self._subsystem_result(system_handler, "System handler")
+        self.system_analyzer = self._subsystem_result(system_analyzer, "System analyzer")
+        self.device_monitor = self._subsystem_result(device_monitor, "Device monitor")
+        self.security_manager = self._subsystem_result(security_manager, "Security manager")
+        
+        # Background event loop for network I/O, so the async clients keep their connection pools alive
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="JARVIS-IO", daemon=True).start()
+        
+        # Network clients are created on first use so local commands don't pay for importing them
+        self._session = None
+        self._openai_cache = {}
+        self._pending_confirmation = None
+        self._path_cache = PathCache()
+        
+        # Shuffle the canned replies once, then cycle so they don't repeat back to back
+        self._mood_replies = itertools.cycle(random.sample(_MOOD_REPLIES, len(_MOOD_REPLIES)))
+        self._welcome_replies = itertools.cycle(random.sample(_YOURE_WELCOME_REPLIES, len(_YOURE_WELCOME_REPLIES)))
+        self._fallback_replies = itertools.cycle(random.sample(_FALLBACK_REPLIES, len(_FALLBACK_REPLIES)))
         
         # OpenAI configuration
-        self.openai_enabled = False
+        self.openai_enabled = bool(os.getenv('OPENAI_API_KEY'))
         self.openai_client = None
-        if os.getenv('OPENAI_API_KEY'):
-            try:
-                # Initialize with minimum parameters
-                self.openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-                self.openai_enabled = True
-                logger.info("OpenAI API initialized")
-            except Exception as e:
-                logger.error(f"Error initializing OpenAI: {e}")
-        
-        # Command patterns
-        self.commands = {
-            # Time and date
-            r'what (time|day|date) is it': self._get_time_date,
-            r'(current|today\'s) (time|date)': self._get_time_date,
-            r'(tell me|what\'s) the (time|date)': self._get_time_date,
-            
-            # Weather 
-            r'(what\'s|what is|how\'s) the weather( like)?( today| now)?( in (?P<location>.+))?': self._get_weather,
-            r'(weather|temperature|forecast)( in| for)? (?P<location>.+)': self._get_weather,
-            
-            # System Analysis Commands
-            r'(tell me|what\'s|what is)( about)?( my)? (system|pc|computer)( info| information)?': self._get_system_info,
-            r'(system|pc|computer)( information| info)': self._get_system_info,
-            r'(tell me|what\'s|what is)( about)?( my)? (cpu|processor)( info| information)?': self._get_cpu_info,
-            r'(tell me|what\'s|what is)( about)?( my)? (memory|ram)( info| information)?': self._get_memory_info,
-            r'(tell me|what\'s|what is)( about)?( my)? (disk|storage|drive)( info| information)?': self._get_disk_info,
-            r'(tell me|what\'s|what is)( about)?( my)? (network|internet)( info| information)?': self._get_network_info,
-            r'(tell me|what\'s|what is)( about)?( my)? (graphics|gpu|video card)( info| information)?': self._get_graphics_info,
-            r'(show|list|what) (processes|applications)( are)? running': self._get_running_processes,
-            r'(show|list|what) (applications|programs|software)( are)? installed': self._get_installed_applications,
-            r'(tell me|what\'s|what is)( the)? (system|pc|computer) health': self._get_system_health,
-            r'(search|find)( for)?( files)? (?P<pattern>.+?)( in| within)? (?P<path>.+)': self._search_files,
-            r'(analyze|examine)( the)? (files|file types)( in| within)? (?P<directory>.+)': self._analyze_file_types,
-            
-            # Device Monitor Commands
-            r'(tell me|what|which)( about)?( my)? (devices|peripherals)( are connected| do i have)': self._get_connected_devices,
-            r'(tell me|what)( about)?( my)? (monitor|display|screen)s?( info| information)?': self._get_monitor_info,
-            r'(tell me|what)( about)?( my)? (printer|printing device)s?( info| information)?': self._get_printer_info,
-            r'(tell me|what)( about)?( my)? (usb|usb device)s?( info| information)?': self._get_usb_devices,
-            r'(tell me|what)( about)?( my)? (audio|sound|speaker|microphone)( device)?s?( info| information)?': self._get_audio_devices,
-            r'(tell me|what)( about)?( my)? (bluetooth|bt)( device)?s?( info| information)?': self._get_bluetooth_devices,
-            r'(scan|check)( for)? (new|newly connected) devices': self._scan_for_new_devices,
-            
-            # System operations - Applications
-            r'open (?P<app_name>.+?)(\s+with\s+(?P<args>.+))?$': self._open_application,
-            r'launch (?P<app_name>.+?)(\s+with\s+(?P<args>.+))?$': self._open_application,
-            r'start (?P<app_name>.+?)(\s+with\s+(?P<args>.+))?$': self._open_application,
-            r'run (?P<app_name>.+?)(\s+with\s+(?P<args>.+))?$': self._open_application,
-            
-            # System operations - Directories
-            r'create (a )?(?:folder|directory|dir)( called| named)? (?P<dir_path>.+)': self._create_directory,
-            r'make (a )?(?:folder|directory|dir)( called| named)? (?P<dir_path>.+)': self._create_directory,
-            r'create (a )?(?:folder|directory|dir)$': self._create_directory_prompt,
-            r'make (a )?(?:folder|directory|dir)$': self._create_directory_prompt,
-            r'delete (?:the )?(?:folder|directory|dir)( called| named)? (?P<dir_path>.+)': self._delete_directory,
-            r'remove (?:the )?(?:folder|directory|dir)( called| named)? (?P<dir_path>.+)': self._delete_directory,
-            r'update (?:the )?(?:folder|directory|dir)( called| named)? (?P<dir_path>.+)': self._update_directory,
-            r'insert (?:into )?(?:folder|directory|dir)( called| named)? (?P<dir_path>.+)': self._insert_into_directory,
-            
-            # System operations - Files
-            r'create (a )?file( called| named)? (?P<file_path>.+)': self._create_file,
-            r'make (a )?file( called| named)? (?P<file_path>.+)': self._create_file,
-            r'delete( the| my)?( file| directory| folder)? (?P<path>.+)': self._delete_item,
-            r'remove( the| my)?( file| directory| folder)? (?P<path>.+)': self._delete_item,
-            
-            # System operations - Commands
-            r'execute( the)? command (?P<command>.+)': self._execute_command,
-            r'run( the)? command (?P<command>.+)': self._execute_command,
-            
-            # General knowledge
-            r'(who|what|when|where|why|how) (is|are|was|were|do|does|did) .+': self._answer_question,
-            r'tell me (about|something about) .+': self._answer_question,
-            
-            # System commands
-            r'(exit|quit|shutdown|bye|goodbye)': self._shutdown,
-            
-            # Personality responses
-            r'(who are you|what are you|tell me about yourself)': self._introduce_self,
-            r'(how are you|how do you feel)': self._mood_response,
-            r'(thank you|thanks)': self._youre_welcome,
-            
-            # Help command
-            r'(help|what can you do|commands|list commands)': self._help_command,
-            
-            # Security and Privacy commands
-            r"(?:enable|turn on) (?P<setting>.+?) (?:data collection|tracking|monitoring)": self._handle_enable_privacy_setting,
-            r"(?:disable|turn off) (?P<setting>.+?) (?:data collection|tracking|monitoring)": self._handle_disable_privacy_setting,
-            r"show (?:my )?privacy settings": self._handle_show_privacy_settings,
-            r"clear (?:all )?(?:my )?data": self._handle_clear_data,
-            r"add sensitive directory (?P<directory>.+)": self._handle_add_sensitive_directory,
-            r"show data access (?:log|history)": self._handle_show_data_access_log,
-            r"(?:is my data secure|how secure is my data)": self._handle_data_security_status,
-            
-            # Fallback pattern - must be last
-            r'.+': self._default_response
-        }
+        self._openai_lock = threading.Lock()
+        
+        # Warm the OpenAI client up on the I/O thread so the first question doesn't pay for it
+        if self.openai_enabled:
+            self._loop.call_soon_threadsafe(self._get_openai_client)
+        
+        # Compile the shared command table on first instantiation
+        if CommandProcessor._command_re is None:
+            CommandProcessor._compile_dispatcher()
         
         logger.info("Command processor initialized")
     
     def process_command(self, command_text):
         """Process the command text and execute the appropriate action"""
+        try:
+            self._dispatch_command(command_text)
+        finally:
+            # Finish speaking before the caller goes back to listening, so Jarvis doesn't hear itself
+            self._speech_q.join()
+    
+    def clear_speech(self):
+        """Drop queued speech that hasn't started playing yet, e.g. when the user interrupts"""
+        while True:
+            try:
+                self._speech_q.get_nowait()
+            except queue.Empty:
+                break
+            self._speech_q.task_done()
+    
+    def _speech_worker(self):
+        """Play queued speech one item at a time, in order"""
+        while True:
+            # Items are kept separate so fixed replies still hit the audio cache and
+            # chunked output keeps its sentence-sized pieces
+            text = self._speech_q.get()
+            try:
+                if text in _CACHED_REPLIES:
+                    self.speaker.speak_cached(text)
+                else:
+                    self.speaker.speak(text)
+            except Exception as e:
+                logger.error("Error during queued speech: %s", e)
+            finally:
+                self._speech_q.task_done()
+    
+    @property
+    def awaiting_confirmation(self):
+        """True while a handler is waiting for a yes/no answer to its last question"""
+        return self._pending_confirmation is not None
+    
+    def _await_yes_no(self, prompt):
+        """Ask a yes/no question and return a Future resolved by the next command"""
+        if self._pending_confirmation is not None:
+            self._pending_confirmation.set_result(False)
+        self._pending_confirmation = Future()
+        self._speech_q.put(prompt)
+        return self._pending_confirmation
+    
+    def _dispatch_command(self, command_text):
+        """Resolve the command text and run its handler"""
+        # A pending confirmation takes the next utterance; anything that isn't a yes/no
+        # answer cancels it and is then handled as a normal command
+        pending = self._pending_confirmation
+        if pending is not None:
+            self._pending_confirmation = None
+            answer = _YES_NO_RE.fullmatch((command_text or "").strip())
+            pending.set_result(bool(answer and answer.group(1)))
+            if answer:
+                return
+        
         if not command_text:
-            self.speaker.speak("I didn't catch that. Can you please repeat?")
+            self._speech_q.put(_NOT_CAUGHT_REPLY)
             return
             
-        command_text = command_text.lower().strip()
-        logger.debug(f"Processing command: {command_text}")
+        # Interned so repeated commands share one string object for the cache lookups below.
+        # Handlers receive this casefolded text, so they never need to lowercase it again
+        command_text = sys.intern(command_text.strip().casefold())
+        logger.debug("Processing command: %s", command_text)
         
-        # Process the command through each pattern
-        for pattern, handler in self.commands.items():
-            match = re.match(pattern, command_text, re.IGNORECASE)
-            if match:
-                logger.info(f"Command matched pattern: {pattern}")
-                
-                # Extract named groups from the regex match
-                kwargs = match.groupdict()
-                
-                # Call the handler with the command text and any captured groups
-                try:
-                    handler(command_text, *match.groups(), **kwargs)
-                    return
-                except Exception as e:
-                    logger.error(f"Error executing command handler: {e}")
-                    self.speaker.speak("I encountered an error while processing that command.")
-                    return
+        # Fixed phrases skip the regex entirely, everything else goes through the combined pattern
+        resolved = self._exact_commands.get(command_text) or self._resolve_command(command_text)
+        if resolved:
+            handler_name, pattern, kwargs = resolved
+            logger.info("Command matched pattern: %s", pattern)
+            
+            # Call the handler with the command text and any named groups
+            try:
+                result = getattr(self, handler_name)(command_text, **kwargs)
+                if inspect.isawaitable(result):
+                    self._run_async(result)
+                return
+            except Exception as e:
+                logger.error("Error executing command handler: %s", e)
+                self._speech_q.put("I encountered an error while processing that command.")
+                return
         
         # If no pattern matched
-        self.speaker.speak("I'm sorry, I don't understand that command.")
-        logger.warning(f"No matching pattern for command: {command_text}")
+        self._speech_q.put(_NOT_UNDERSTOOD_REPLY)
+        logger.warning("No matching pattern for command: %s", command_text)
+    
+    def _subsystem_result(self, future, name):
+        """Return a subsystem from its init future, or None if it failed to initialize"""
+        try:
+            subsystem = future.result()
+            logger.info("%s initialized", name)
+            return subsystem
+        except Exception as e:
+            logger.error("Error initializing %s: %s", name.lower(), e)
+            return None
+    
+    def _get_session(self):
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # Pooled keep-alive connections so plain REST calls (weather etc.) skip the TCP/TLS setup
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                  max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+    
+    def _get_openai_client(self):
+        """Get the OpenAI client, creating it on first use"""
+        with self._openai_lock:
+            if self.openai_client is None and self.openai_enabled:
+                try:
+                    from openai import AsyncOpenAI
+                    
+                    # Initialize with minimum parameters
+                    self.openai_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+                    logger.info("OpenAI API initialized")
+                except Exception as e:
+                    logger.error("Error initializing OpenAI: %s", e)
+                    self.openai_enabled = False
+            return self.openai_client
+    
+    def _openai_reply(self, user_text, messages_head, max_tokens):
+        """Stream an OpenAI reply and speak each sentence as soon as it is complete. Returns True if anything was spoken"""
+        # Replay a recent reply to the same prompt without going back to the API
+        key = (user_text.strip().casefold(), tuple(m["content"] for m in messages_head), max_tokens)
+        cached = self._openai_cache.get(key)
+        if cached and time.monotonic() - cached[1] < _OPENAI_CACHE_TTL:
+            for sentence in cached[0]:
+                self._speech_q.put(sentence)
+            return True
+        
+        sentences = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            self._stream_sentences(user_text, messages_head, max_tokens, sentences), self._loop)
+        
+        # If the first sentence is slow to arrive, say something so the silence isn't mistaken for a hang
+        try:
+            sentence = sentences.get(timeout=_FILLER_DELAY)
+        except queue.Empty:
+            self._speech_q.put(_FILLER_REPLY)
+            sentence = sentences.get()
+        
+        # Queue each sentence for speech while the rest of the reply is still streaming in
+        reply = []
+        while sentence is not None:
+            self._speech_q.put(sentence)
+            reply.append(sentence)
+            sentence = sentences.get()
+        
+        # Surface any API error to the caller; only complete replies are cached
+        future.result()
+        if reply:
+            self._openai_cache.pop(key, None)
+            if len(self._openai_cache) >= _OPENAI_CACHE_SIZE:
+                del self._openai_cache[next(iter(self._openai_cache))]
+            self._openai_cache[key] = (tuple(reply), time.monotonic())
+        return bool(reply)
+    
+    async def _stream_sentences(self, user_text, messages_head, max_tokens, sentences):
+        """Stream a chat completion into the queue one sentence at a time, ending with None"""
+        try:
+            stream = await self.openai_client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[*messages_head, {"role": "user", "content": user_text}],
+                max_tokens=max_tokens,
+                temperature=0,
+                stream=True
+            )
+            buffer = ""
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                buffer += chunk.choices[0].delta.content or ""
+                
+                # Flush every complete sentence, keeping the unfinished tail in the buffer
+                *complete, buffer = _SENTENCE_END_RE.split(buffer)
+                for sentence in complete:
+                    if sentence.strip():
+                        sentences.put(sentence.strip())
+            
+            if buffer.strip():
+                sentences.put(buffer.strip())
+        finally:
+            sentences.put(None)
+    
+    def _run_async(self, coro, timeout=60):
+        """Run a coroutine on the I/O loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+    
+    @classmethod
+    def _compile_dispatcher(cls):
+        """Compile _PATTERNS into one alternation regex, a handler table and the exact-phrase table"""
+        alternatives = []
+        handlers = {}
+        
+        for i, (pattern, handler_name) in enumerate(cls._PATTERNS):
+            key = f"h{i}"
+            
+            # Prefix named groups with the handler key so names don't collide across patterns.
+            # Names are read straight from the source, so the combined regex is the only one compiled.
+            group_names = tuple(_GROUP_NAME_RE.findall(pattern))
+            prefixed = _GROUP_NAME_RE.sub(rf'(?P<{key}_\1>', pattern)
+            alternatives.append(f"(?P<{key}>{prefixed})")
+            
+            handlers[key] = (handler_name, pattern, group_names)
+        
+        # Inline flag so the same source compiles under both RE2 and the stdlib engine
+        cls._command_re = dispatch_re.compile('(?i)' + '|'.join(alternatives))
+        cls._command_handlers = handlers
+        cls._exact_commands = cls._build_exact_commands()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _resolve_command(cls, command_text):
+        """Match command text and return (handler name, pattern, kwargs), or None"""
+        # Resolution is a pure function of the text, so repeated commands skip the regex
+        match = cls._command_re.match(command_text)
+        if not match:
+            return None
+        
+        handler_name, pattern, group_names = cls._command_handlers[match.lastgroup]
+        
+        # Most patterns capture nothing, so only look up named groups when the pattern has some
+        if not group_names:
+            return handler_name, pattern, {}
+        
+        kwargs = {name: match.group(f"{match.lastgroup}_{name}") for name in group_names}
+        return handler_name, pattern, kwargs
+    
+    @classmethod
+    def _build_exact_commands(cls):
+        """Pre-resolve the fixed phrases of literal-alternation patterns like (?:thank you|thanks)"""
+        exact = {}
+        for handler_name, pattern, group_names in cls._command_handlers.values():
+            literal = re.fullmatch(r"\\A\(\?:([a-z' ]+(?:\|[a-z' ]+)*)\)", pattern)
+            if not literal:
+                continue
+            
+            # Resolve through the full dispatcher so an earlier pattern that also matches keeps priority
+            for phrase in literal.group(1).split('|'):
+                exact[phrase] = cls._resolve_command(phrase)
+        
+        return exact
+    
+    def _speak_lines(self, lines):
+        """Speak several lines as one utterance so the TTS engine only starts once"""
+        self._speech_q.put(". ".join(line.rstrip('.:') for line in lines) + ".")
     
     # Device Monitor Command Handlers
     def _get_connected_devices(self, command_text, **kwargs):
         """Get information about all connected devices."""
         if not self.device_monitor:
-            self.speaker.speak("I'm sorry, device monitoring capabilities are not available at the moment.")
+            self._speech_q.put(_DEVICES_UNAVAILABLE_REPLY)
             return
         
         # Refresh device information
@@ -208,24 +694,22 @@ class CommandProcessor:
         summary = self.device_monitor.get_device_summary()
         
         # Speak the summary
-        self.speaker.speak("Here is a summary of your connected devices:")
-        for line in summary:
-            self.speaker.speak(line)
+        self._speak_lines(["Here is a summary of your connected devices:"] + summary)
     
     def _get_monitor_info(self, command_text, **kwargs):
         """Get information about connected monitors/displays."""
         if not self.device_monitor:
-            self.speaker.speak("I'm sorry, device monitoring capabilities are not available at the moment.")
+            self._speech_q.put(_DEVICES_UNAVAILABLE_REPLY)
             return
         
         # Get monitor information
         monitors = self.device_monitor.monitors
         
         if not monitors:
-            self.speaker.speak("I couldn't detect any monitors connected to your system.")
+            self._speech_q.put("I couldn't detect any monitors connected to your system.")
             return
         
-        self.speaker.speak(f"You have {len(monitors)} display{'s' if len(monitors) > 1 else ''} connected:")
+        response = [f"You have {len(monitors)} display{'s' if len(monitors) > 1 else ''} connected:"]
         
         for i, monitor in enumerate(monitors):
             monitor_info = []
@@ -241,54 +725,60 @@ class CommandProcessor:
             if "diagonal_size" in monitor:
                 monitor_info.append(f"Size: {monitor['diagonal_size']}")
                 
-            self.speaker.speak(". ".join(monitor_info))
+            response.extend(monitor_info)
+        
+        self._speak_lines(response)
     
     def _get_printer_info(self, command_text, **kwargs):
         """Get information about installed printers."""
         if not self.device_monitor:
-            self.speaker.speak("I'm sorry, device monitoring capabilities are not available at the moment.")
+            self._speech_q.put(_DEVICES_UNAVAILABLE_REPLY)
             return
         
         # Get printer information
         printers = self.device_monitor.printers
         
         if not printers:
-            self.speaker.speak("I couldn't detect any printers installed on your system.")
+            self._speech_q.put("I couldn't detect any printers installed on your system.")
             return
         
-        self.speaker.speak(f"You have {len(printers)} printer{'s' if len(printers) > 1 else ''} installed:")
+        response = [f"You have {len(printers)} printer{'s' if len(printers) > 1 else ''} installed:"]
         
         for printer in printers:
-            self.speaker.speak(f"Printer: {printer['name']}, Status: {printer['status']}")
+            response.append(f"Printer: {printer['name']}, Status: {printer['status']}")
+        
+        self._speak_lines(response)
     
     def _get_usb_devices(self, command_text, **kwargs):
         """Get information about connected USB devices."""
         if not self.device_monitor:
-            self.speaker.speak("I'm sorry, device monitoring capabilities are not available at the moment.")
+            self._speech_q.put(_DEVICES_UNAVAILABLE_REPLY)
             return
         
         # Get USB devices
         usb_devices = self.device_monitor.usb_devices
         
         if not usb_devices:
-            self.speaker.speak("I couldn't detect any USB devices connected to your system.")
+            self._speech_q.put("I couldn't detect any USB devices connected to your system.")
             return
         
-        self.speaker.speak(f"You have {len(usb_devices)} USB device{'s' if len(usb_devices) > 1 else ''} connected:")
+        response = [f"You have {len(usb_devices)} USB device{'s' if len(usb_devices) > 1 else ''} connected:"]
         
         # Limit to first 5 devices to avoid too much speech
-        for device in usb_devices[:5]:
+        for device in self.device_monitor.iter_usb_devices(limit=5):
             name = device.get("FriendlyName", "Unknown USB device")
             status = device.get("Status", "Unknown")
-            self.speaker.speak(f"{name}, Status: {status}")
+            response.append(f"{name}, Status: {status}")
             
         if len(usb_devices) > 5:
-            self.speaker.speak(f"And {len(usb_devices) - 5} more USB devices.")
+            response.append(f"And {len(usb_devices) - 5} more USB devices.")
+        
+        self._speak_lines(response)
     
     def _get_audio_devices(self, command_text, **kwargs):
         """Get information about audio devices."""
         if not self.device_monitor:
-            self.speaker.speak("I'm sorry, device monitoring capabilities are not available at the moment.")
+            self._speech_q.put(_DEVICES_UNAVAILABLE_REPLY)
             return
         
         # Get audio devices
@@ -298,67 +788,73 @@ class CommandProcessor:
         recording_devices = audio_devices.get("recording", [])
         
         if not playback_devices and not recording_devices:
-            self.speaker.speak("I couldn't detect any audio devices on your system.")
+            self._speech_q.put("I couldn't detect any audio devices on your system.")
             return
         
+        response = []
+        
         if playback_devices:
-            self.speaker.speak(f"You have {len(playback_devices)} audio output device{'s' if len(playback_devices) > 1 else ''}:")
+            response.append(f"You have {len(playback_devices)} audio output device{'s' if len(playback_devices) > 1 else ''}:")
             
-            for device in playback_devices[:3]:  # Limit to first 3
-                self.speaker.speak(f"Output: {device['name']}")
+            for device in self.device_monitor.iter_audio_devices("playback", limit=3):
+                response.append(f"Output: {device['name']}")
                 
             if len(playback_devices) > 3:
-                self.speaker.speak(f"And {len(playback_devices) - 3} more output devices.")
+                response.append(f"And {len(playback_devices) - 3} more output devices.")
         
         if recording_devices:
-            self.speaker.speak(f"You have {len(recording_devices)} audio input device{'s' if len(recording_devices) > 1 else ''}:")
+            response.append(f"You have {len(recording_devices)} audio input device{'s' if len(recording_devices) > 1 else ''}:")
             
-            for device in recording_devices[:3]:  # Limit to first 3
-                self.speaker.speak(f"Input: {device['name']}")
+            for device in self.device_monitor.iter_audio_devices("recording", limit=3):
+                response.append(f"Input: {device['name']}")
                 
             if len(recording_devices) > 3:
-                self.speaker.speak(f"And {len(recording_devices) - 3} more input devices.")
+                response.append(f"And {len(recording_devices) - 3} more input devices.")
+        
+        self._speak_lines(response)
     
     def _get_bluetooth_devices(self, command_text, **kwargs):
         """Get information about Bluetooth devices."""
         if not self.device_monitor:
-            self.speaker.speak("I'm sorry, device monitoring capabilities are not available at the moment.")
+            self._speech_q.put(_DEVICES_UNAVAILABLE_REPLY)
             return
         
         # Get Bluetooth devices
         bluetooth_devices = self.device_monitor.bluetooth_devices
         
         if not bluetooth_devices:
-            self.speaker.speak("I couldn't detect any Bluetooth devices paired with your system.")
+            self._speech_q.put("I couldn't detect any Bluetooth devices paired with your system.")
             return
         
-        self.speaker.speak(f"You have {len(bluetooth_devices)} Bluetooth device{'s' if len(bluetooth_devices) > 1 else ''} paired:")
+        response = [f"You have {len(bluetooth_devices)} Bluetooth device{'s' if len(bluetooth_devices) > 1 else ''} paired:"]
         
-        for device in bluetooth_devices[:5]:  # Limit to first 5
-            self.speaker.speak(f"{device['name']}, Status: {device['status']}")
+        for device in self.device_monitor.iter_bluetooth_devices(limit=5):
+            response.append(f"{device['name']}, Status: {device['status']}")
             
         if len(bluetooth_devices) > 5:
-            self.speaker.speak(f"And {len(bluetooth_devices) - 5} more Bluetooth devices.")
+            response.append(f"And {len(bluetooth_devices) - 5} more Bluetooth devices.")
+        
+        self._speak_lines(response)
     
     def _scan_for_new_devices(self, command_text, **kwargs):
         """Scan for newly connected devices."""
         if not self.device_monitor:
-            self.speaker.speak("I'm sorry, device monitoring capabilities are not available at the moment.")
+            self._speech_q.put(_DEVICES_UNAVAILABLE_REPLY)
             return
         
         # Store current state
         previous_state = self.device_monitor.get_detailed_report()
         
-        self.speaker.speak("Scanning for new devices. This may take a moment.")
+        self._speech_q.put("Scanning for new devices. This may take a moment.")
         
-        # Refresh device information
-        self.device_monitor.refresh()
+        # Refresh device information, a recent snapshot would hide what was just plugged in
+        self.device_monitor.refresh(force=True)
         
         # Check for new devices
         new_devices = self.device_monitor.detect_new_devices(previous_state)
         
         if not new_devices:
-            self.speaker.speak("I couldn't detect any changes in connected devices.")
+            self._speech_q.put("I couldn't detect any changes in connected devices.")
             return
         
         # Check if any new devices were found
@@ -368,42 +864,42 @@ class CommandProcessor:
         new_printers = new_devices.get("printers", [])
         
         if not any([new_usb, new_audio, new_bluetooth, new_printers]):
-            self.speaker.speak("No new devices detected since the last scan.")
+            self._speech_q.put("No new devices detected since the last scan.")
             return
         
         # Report new devices
-        self.speaker.speak("I detected the following new devices:")
+        response = ["I detected the following new devices:"]
         
         if new_usb:
-            self.speaker.speak(f"New USB device{'s' if len(new_usb) > 1 else ''}: {', '.join(new_usb)}")
+            response.append(f"New USB device{'s' if len(new_usb) > 1 else ''}: {', '.join(new_usb)}")
             
         if new_audio:
-            self.speaker.speak(f"New audio device{'s' if len(new_audio) > 1 else ''}: {', '.join(new_audio)}")
+            response.append(f"New audio device{'s' if len(new_audio) > 1 else ''}: {', '.join(new_audio)}")
             
         if new_bluetooth:
-            self.speaker.speak(f"New Bluetooth device{'s' if len(new_bluetooth) > 1 else ''}: {', '.join(new_bluetooth)}")
+            response.append(f"New Bluetooth device{'s' if len(new_bluetooth) > 1 else ''}: {', '.join(new_bluetooth)}")
             
         if new_printers:
-            self.speaker.speak(f"New printer{'s' if len(new_printers) > 1 else ''}: {', '.join(new_printers)}")
+            response.append(f"New printer{'s' if len(new_printers) > 1 else ''}: {', '.join(new_printers)}")
+        
+        self._speak_lines(response)
             
     # System Analysis Command Handlers
     def _get_system_info(self, command_text, **kwargs):
         """Get general system information."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         summary = self.system_analyzer.get_system_summary()
         
         # Speak the summary
-        self.speaker.speak("Here is a summary of your system:")
-        for line in summary:
-            self.speaker.speak(line)
+        self._speak_lines(["Here is a summary of your system:"] + summary)
     
     def _get_cpu_info(self, command_text, **kwargs):
         """Get CPU information."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         cpu_info = self.system_analyzer.cpu_info
@@ -414,13 +910,12 @@ class CommandProcessor:
             f"The current CPU usage is {cpu_info['usage_percent']}%."
         ]
         
-        for line in response:
-            self.speaker.speak(line)
+        self._speak_lines(response)
     
     def _get_memory_info(self, command_text, **kwargs):
         """Get memory information."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         memory_info = self.system_analyzer.memory_info
@@ -431,102 +926,107 @@ class CommandProcessor:
             f"Memory usage is at {memory_info['percent_used']}%."
         ]
         
-        for line in response:
-            self.speaker.speak(line)
+        self._speak_lines(response)
     
     def _get_disk_info(self, command_text, **kwargs):
         """Get disk information."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         disk_info = self.system_analyzer.disk_info
         
-        self.speaker.speak("Here is information about your disks:")
+        response = ["Here is information about your disks:"]
         for disk in disk_info:
-            self.speaker.speak(f"Drive {disk['device']} has {disk['total']} total space with {disk['free']} free. It is {disk['percent_used']}% full.")
+            response.append(f"Drive {disk['device']} has {disk['total']} total space with {disk['free']} free. It is {disk['percent_used']}% full.")
+        
+        self._speak_lines(response)
     
     def _get_network_info(self, command_text, **kwargs):
         """Get network information."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         network_info = self.system_analyzer.network_info
         
-        self.speaker.speak(f"Your computer's hostname is {network_info['hostname']}.")
+        self._speech_q.put(f"Your computer's hostname is {network_info['hostname']}.")
         
         # Find and report the IP address
         for address in network_info.get('addresses', []):
             if address['type'] == 'ipv4':
-                self.speaker.speak(f"Your IP address is {address['address']}.")
+                self._speech_q.put(f"Your IP address is {address['address']}.")
                 break
         
         # Report interfaces
         interfaces = network_info.get('interfaces', {})
         if interfaces:
             interface_count = len(interfaces)
-            self.speaker.speak(f"You have {interface_count} network interfaces.")
+            self._speech_q.put(f"You have {interface_count} network interfaces.")
     
     def _get_graphics_info(self, command_text, **kwargs):
         """Get graphics card information."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         graphics_info = self.system_analyzer.graphics_info
         
         if not graphics_info['cards']:
-            self.speaker.speak("I couldn't detect any graphics cards on your system.")
+            self._speech_q.put("I couldn't detect any graphics cards on your system.")
             return
         
-        self.speaker.speak("Here is information about your graphics cards:")
+        response = ["Here is information about your graphics cards:"]
         for card in graphics_info['cards']:
-            self.speaker.speak(f"You have a {card['name']} graphics card.")
+            response.append(f"You have a {card['name']} graphics card.")
             if card.get('driver_version'):
-                self.speaker.speak(f"Driver version: {card['driver_version']}.")
+                response.append(f"Driver version: {card['driver_version']}.")
+        
+        self._speak_lines(response)
     
     def _get_running_processes(self, command_text, **kwargs):
         """Get information about running processes."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         processes = self.system_analyzer.get_running_processes()
         
         # Limit the number of processes to report
-        top_processes = sorted(processes, key=lambda x: float(x['memory_usage'].split()[0]) if isinstance(x['memory_usage'], str) else 0, reverse=True)[:5]
+        top_processes = heapq.nlargest(5, processes, key=lambda x: x['memory_bytes'])
         
-        self.speaker.speak(f"You have {len(processes)} processes running. Here are the top memory consumers:")
+        response = [f"You have {len(processes)} processes running. Here are the top memory consumers:"]
         for proc in top_processes:
-            self.speaker.speak(f"{proc['name']} using {proc['memory_usage']}.")
+            response.append(f"{proc['name']} using {proc['memory_usage']}.")
+        
+        self._speak_lines(response)
     
     def _get_installed_applications(self, command_text, **kwargs):
         """Get information about installed applications."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         applications = self.system_analyzer.get_installed_applications()
         
         if not applications:
-            self.speaker.speak("I couldn't retrieve information about installed applications.")
+            self._speech_q.put("I couldn't retrieve information about installed applications.")
             return
         
-        self.speaker.speak(f"You have {len(applications)} applications installed. Here are some notable ones:")
+        response = [f"You have {len(applications)} applications installed. Here are some notable ones:"]
         
-        # Filter for common well-known applications
-        notable_apps = [app for app in applications if any(keyword in app['name'].lower() for keyword in 
-                       ['microsoft', 'adobe', 'google', 'chrome', 'firefox', 'office', 'visual studio', 'nvidia', 'intel', 'amd'])]
+        # Filter for common well-known applications, stopping after 5 to avoid too much speech
+        notable_apps = itertools.islice((app for app in applications if _NOTABLE_APPS_RE.search(app['name'])), 5)
         
-        # Limit to 5 apps to avoid too much speech
-        for app in notable_apps[:5]:
-            self.speaker.speak(f"{app['name']}, version {app['version']}.")
+        for app in notable_apps:
+            response.append(f"{app['name']}, version {app['version']}.")
+        
+        self._speak_lines(response)
     
     def _get_system_health(self, command_text, **kwargs):
         """Get system health information."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
         health = self.system_analyzer.get_system_health()
@@ -554,715 +1054,464 @@ class CommandProcessor:
             if not battery['power_plugged'] and battery['time_left'] != "Unlimited":
                 response.append(f"Estimated {battery['time_left']} of battery life remaining.")
         
-        for line in response:
-            self.speaker.speak(line)
+        self._speak_lines(response)
     
-    def _search_files(self, command_text, *args, **kwargs):
+    def _search_files(self, command_text, **kwargs):
         """Search for files matching a pattern."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
-        # Get parameters from kwargs if available
+        # Get parameters from the matched pattern
         pattern = kwargs.get('pattern')
         path = kwargs.get('path')
         
-        # If not in kwargs, try to extract from args
-        if (not pattern or not path) and len(args) >= 2:
-            pattern = args[0]
-            path = args[1]
-        
         if not pattern or not path:
-            self.speaker.speak("Please specify both a file pattern and a path to search in.")
+            self._speech_q.put("Please specify both a file pattern and a path to search in.")
             return
         
         try:
             pattern = pattern.strip()
             path = path.strip()
             
-            self.speaker.speak(f"Searching for {pattern} in {path}. This may take a moment.")
+            self._speech_q.put(f"Searching for {pattern} in {path}. This may take a moment.")
             results = self.system_analyzer.search_files(path, pattern)
             
             if not results:
-                self.speaker.speak(f"No files matching {pattern} were found in {path}.")
+                self._speech_q.put(f"No files matching {pattern} were found in {path}.")
                 return
             
-            self.speaker.speak(f"I found {len(results)} files matching {pattern}.")
+            self._speech_q.put(f"I found {len(results)} files matching {pattern}.")
             
             # Speak the first few results
             for result in results[:3]:
-                self.speaker.speak(Path(result).name)
+                self._speech_q.put(Path(result).name)
             
             if len(results) > 3:
-                self.speaker.speak(f"And {len(results) - 3} more files.")
+                self._speech_q.put(f"And {len(results) - 3} more files.")
         except Exception as e:
-            logger.error(f"Error searching for files: {e}")
-            self.speaker.speak(f"I encountered an error while searching for files. {str(e)}")
+            logger.error("Error searching for files: %s", e)
+            self._speech_q.put(f"I encountered an error while searching for files. {e}")
             return False
     
-    def _analyze_file_types(self, command_text, *args, **kwargs):
+    def _analyze_file_types(self, command_text, **kwargs):
         """Analyze file types in a directory."""
         if not self.system_analyzer:
-            self.speaker.speak("I'm sorry, system analysis capabilities are not available at the moment.")
+            self._speech_q.put(_ANALYZER_UNAVAILABLE_REPLY)
             return
         
-        # Get directory from kwargs if available, otherwise use the first argument
+        # Get directory from the matched pattern
         directory = kwargs.get('directory')
-        if not directory and args:
-            directory = args[0]
             
         if not directory:
-            self.speaker.speak("Please specify a directory to analyze.")
+            self._speech_q.put("Please specify a directory to analyze.")
             return
             
         directory = directory.strip()
         
         try:
-            self.speaker.speak(f"Analyzing files in {directory}. This may take a moment.")
+            self._speech_q.put(f"Analyzing files in {directory}. This may take a moment.")
             stats = self.system_analyzer.analyze_file_types(directory)
             
             if stats["total_files"] == 0:
-                self.speaker.speak(f"No files were found in {directory}.")
+                self._speech_q.put(f"No files were found in {directory}.")
                 return
             
-            self.speaker.speak(f"I found {stats['total_files']} files in {directory}, using {stats['total_size_formatted']} of disk space.")
+            self._speech_q.put(f"I found {stats['total_files']} files in {directory}, using {stats['total_size_formatted']} of disk space.")
             
             # Report the top file extensions
             if stats["extensions"]:
                 extensions = sorted(stats["extensions"].items(), key=lambda x: x[1]["count"], reverse=True)
                 top_extensions = extensions[:3]
                 
-                self.speaker.speak("The most common file types are:")
+                self._speech_q.put("The most common file types are:")
                 for ext, ext_stats in top_extensions:
-                    self.speaker.speak(f"{ext_stats['count']} {ext} files, using {ext_stats['size_formatted']}.")
+                    self._speech_q.put(f"{ext_stats['count']} {ext} files, using {ext_stats['size_formatted']}.")
         except Exception as e:
-            logger.error(f"Error analyzing file types in {directory}: {e}")
-            self.speaker.speak(f"I encountered an error while analyzing file types. {str(e)}")
+            logger.error("Error analyzing file types in %s: %s", directory, e)
+            self._speech_q.put(f"I encountered an error while analyzing file types. {e}")
             return False
     
     # System Operations Handlers
-    def _open_application(self, command_text, *args, **kwargs):
+    @_require_arg("app_name", "which application to open")
+    def _open_application(self, command_text, app_name, args=None, **kwargs):
         """Open an application by name."""
-        if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
-            return
-        
-        # Get app_name from kwargs if available, otherwise use the first argument
-        app_name = kwargs.get('app_name')
-        if not app_name and args:
-            app_name = args[0]
-            
-        if not app_name:
-            self.speaker.speak("Sorry, I didn't catch which application to open.")
-            return
-            
-        app_name = app_name.strip()
-        
         # Get command arguments
-        app_args = []
-        if 'args' in kwargs and kwargs['args']:
-            app_args = [arg.strip() for arg in kwargs['args'].split()]
+        app_args = args.split() if args else []
         
         try:
-            self.speaker.speak(f"Opening {app_name}.")
+            self._speech_q.put(f"Opening {app_name}.")
             success = self.system_handler.open_application(app_name, *app_args)
             
             if not success:
-                logger.error(f"Failed to open application: {app_name}")
-                self.speaker.speak(f"I couldn't find or open {app_name}. Please check if it's installed correctly.")
+                logger.error("Failed to open application: %s", app_name)
+                self._speech_q.put(f"I couldn't find or open {app_name}. Please check if it's installed correctly.")
         except Exception as e:
-            logger.error(f"Error opening application {app_name}: {e}")
-            self.speaker.speak(f"I had trouble opening {app_name}. {str(e)}")
+            logger.error("Error opening application %s: %s", app_name, e)
+            self._speech_q.put(f"I had trouble opening {app_name}. {e}")
             return False
     
-    def _create_directory(self, command_text, *args, **kwargs):
+    @_require_arg("dir_path", "where to create the directory")
+    def _create_directory(self, command_text, dir_path, **kwargs):
         """Create a directory."""
-        if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
-            return
-        
-        # Get dir_path from kwargs if available, otherwise use the first argument
-        dir_path = kwargs.get('dir_path')
-        if not dir_path and args:
-            dir_path = args[0]
-            
-        if not dir_path:
-            self.speaker.speak("Sorry, I didn't catch where to create the directory.")
-            return
-            
-        dir_path = dir_path.strip()
-        
         try:
-            self.speaker.speak(f"Creating directory {dir_path}.")
+            self._speech_q.put(f"Creating directory {dir_path}.")
             success = self.system_handler.create_directory(dir_path)
             
             if success:
-                self.speaker.speak(f"Directory {dir_path} has been created.")
+                self._speech_q.put(f"Directory {dir_path} has been created.")
             else:
-                logger.error(f"Failed to create directory: {dir_path}")
-                self.speaker.speak(f"I couldn't create the directory {dir_path}. Please check the path and try again.")
+                logger.error("Failed to create directory: %s", dir_path)
+                self._speech_q.put(f"I couldn't create the directory {dir_path}. Please check the path and try again.")
         except Exception as e:
-            logger.error(f"Error creating directory {dir_path}: {e}")
-            self.speaker.speak(f"I had trouble creating the directory {dir_path}. {str(e)}")
+            logger.error("Error creating directory %s: %s", dir_path, e)
+            self._speech_q.put(f"I had trouble creating the directory {dir_path}. {e}")
             return False
     
-    def _create_file(self, command_text, *args, **kwargs):
+    @_require_arg("file_path", "where to create the file")
+    def _create_file(self, command_text, file_path, **kwargs):
         """Create an empty file."""
-        if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
-            return
-        
-        # Get file_path from kwargs if available, otherwise use the first argument
-        file_path = kwargs.get('file_path')
-        if not file_path and args:
-            file_path = args[0]
-            
-        if not file_path:
-            self.speaker.speak("Sorry, I didn't catch where to create the file.")
-            return
-            
-        file_path = file_path.strip()
-        
         try:
-            self.speaker.speak(f"Creating file {file_path}.")
+            self._speech_q.put(f"Creating file {file_path}.")
             success = self.system_handler.create_file(file_path)
             
             if success:
-                self.speaker.speak(f"File {file_path} has been created.")
+                self._speech_q.put(f"File {file_path} has been created.")
             else:
-                logger.error(f"Failed to create file: {file_path}")
-                self.speaker.speak(f"I couldn't create the file {file_path}. Please check the path and try again.")
+                logger.error("Failed to create file: %s", file_path)
+                self._speech_q.put(f"I couldn't create the file {file_path}. Please check the path and try again.")
         except Exception as e:
-            logger.error(f"Error creating file {file_path}: {e}")
-            self.speaker.speak(f"I had trouble creating the file {file_path}. {str(e)}")
+            logger.error("Error creating file %s: %s", file_path, e)
+            self._speech_q.put(f"I had trouble creating the file {file_path}. {e}")
             return False
     
-    def _delete_item(self, command_text, *args, **kwargs):
+    @_require_arg("path", "what to delete")
+    def _delete_item(self, command_text, path, **kwargs):
         """Delete a file or directory."""
-        if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
-            return
-        
-        # Get path from kwargs if available, otherwise use the first argument
-        path = kwargs.get('path')
-        if not path and args:
-            path = args[0]
-            
-        if not path:
-            self.speaker.speak("Sorry, I didn't catch what to delete.")
-            return
-            
-        path = path.strip()
-        
+        # Deletion runs once the user answers, without holding up the command thread
+        confirmation = self._await_yes_no(f"Are you sure you want to delete {path}? Please confirm by saying yes or no.")
+        confirmation.add_done_callback(
+            lambda answer: self._finish_delete(path) if answer.result() else self._speech_q.put("Delete operation cancelled."))
+    
+    def _finish_delete(self, path):
+        """Delete a confirmed file or directory."""
         try:
-            # Ask for confirmation
-            self.speaker.speak(f"Are you sure you want to delete {path}? Please confirm by saying yes or no.")
-            
-            # Here you would need to listen for confirmation
-            # For now, let's assume it's confirmed
-            confirmation = True  # In real implementation, this would be the result of listening for confirmation
+            self._speech_q.put(f"Deleting {path}.")
+            success = self.system_handler.delete_item(path)
             
-            if confirmation:
-                self.speaker.speak(f"Deleting {path}.")
-                success = self.system_handler.delete_item(path)
-                
-                if success:
-                    self.speaker.speak(f"{path} has been deleted.")
-                else:
-                    logger.error(f"Failed to delete item: {path}")
-                    self.speaker.speak(f"I couldn't delete {path}. Please check that the path exists and try again.")
+            if success:
+                self._speech_q.put(f"{path} has been deleted.")
             else:
-                self.speaker.speak("Delete operation cancelled.")
+                logger.error("Failed to delete item: %s", path)
+                self._speech_q.put(f"I couldn't delete {path}. Please check that the path exists and try again.")
         except Exception as e:
-            logger.error(f"Error deleting item {path}: {e}")
-            self.speaker.speak(f"I had trouble deleting {path}. {str(e)}")
-            return False
+            logger.error("Error deleting item %s: %s", path, e)
+            self._speech_q.put(f"I had trouble deleting {path}. {e}")
     
-    def _execute_command(self, command_text, *args, **kwargs):
+    @_require_arg("command", "which command to execute")
+    def _execute_command(self, command_text, command, **kwargs):
         """Execute a system command."""
-        if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
-            return
-        
-        # Get command from kwargs if available, otherwise use the first argument
-        command = kwargs.get('command')
-        if not command and args:
-            command = args[0]
-            
-        if not command:
-            self.speaker.speak("Sorry, I didn't catch which command to execute.")
-            return
-            
-        command = command.strip()
-        
         try:
-            # Security check - list of potentially dangerous commands
-            dangerous_commands = ['rm -rf', 'deltree', 'format', 'del /f', 'drop database']
-            if any(dc in command.lower() for dc in dangerous_commands):
-                self.speaker.speak("I'm sorry, that command appears to be potentially harmful. For safety reasons, I cannot execute it.")
+            # Security check - potentially dangerous commands
+            if _DANGEROUS_CMD_RE.search(command):
+                self._speech_q.put("I'm sorry, that command appears to be potentially harmful. For safety reasons, I cannot execute it.")
                 return
             
-            self.speaker.speak(f"Executing command: {command}")
-            success, output = self.system_handler.execute_command(command)
+            self._speech_q.put(f"Executing command: {command}")
+            
+            # Speak output while the command is still running instead of waiting for it to finish
+            remaining = _OUTPUT_LIMIT
+            pending = ""
+            started = False
+            truncated = False
+            def speak_output(line):
+                nonlocal remaining, pending, started, truncated
+                if remaining <= 0:
+                    # Only announce the cut once output actually arrives past the limit
+                    if not truncated:
+                        truncated = True
+                        self._speech_q.put("Output truncated.")
+                    return
+                cut = len(line) > remaining
+                line = line[:remaining]
+                remaining -= len(line)
+                chunks, pending = _output_chunks(f"{pending}\n{line}" if pending else line)
+                if remaining <= 0 and pending:
+                    chunks.append(pending)
+                    pending = ""
+                for chunk in chunks:
+                    if not started:
+                        chunk = f"Command output: {chunk}"
+                        started = True
+                    self._speech_q.put(chunk)
+                if cut:
+                    truncated = True
+                    self._speech_q.put("Output truncated.")
+            
+            success, output = self.system_handler.execute_command(command, on_output=speak_output)
+            if pending:
+                self._speech_q.put(pending if started else f"Command output: {pending}")
             
             if success:
-                # Truncate output if too long
-                if output and len(output) > 500:
-                    output = output[:500] + "... (output truncated)"
-                
-                self.speaker.speak(f"Command executed successfully.")
-                if output:
-                    self.speaker.speak(f"Command output: {output}")
+                self._speech_q.put(f"Command executed successfully.")
             else:
-                logger.error(f"Command execution failed: {command}")
-                self.speaker.speak(f"Command execution failed. Error: {output}")
+                logger.error("Command execution failed: %s", command)
+                self._speech_q.put(f"Command execution failed. Error: {output}")
         except Exception as e:
-            logger.error(f"Error executing command {command}: {e}")
-            self.speaker.speak(f"I had trouble executing the command. {str(e)}")
+            logger.error("Error executing command %s: %s", command, e)
+            self._speech_q.put(f"I had trouble executing the command. {e}")
             return False
     
     def _get_time_date(self, command_text, **kwargs):
         """Return the current time and/or date"""
-        now = datetime.datetime.now()
+        now = _now()
         
-        if 'time' in command_text.lower():
-            time_str = now.strftime("%I:%M %p")
-            self.speaker.speak(f"The current time is {time_str}")
+        if 'time' in command_text:
+            time_str = now.strftime(_TIME_FMT)
+            self._speech_q.put(f"The current time is {time_str}")
         else:
-            date_str = now.strftime("%A, %B %d, %Y")
-            self.speaker.speak(f"Today is {date_str}")
+            date_str = now.strftime(_DATE_FMT)
+            self._speech_q.put(f"Today is {date_str}")
     
     def _get_weather(self, command_text, location=None, **kwargs):
         """Get weather information"""
         if not location:
-            self.speaker.speak("For which location would you like the weather?")
+            self._speech_q.put("For which location would you like the weather?")
             return
         
         # In a real implementation, you would use a weather API here
-        self.speaker.speak(f"I'm sorry, I don't have access to current weather data for {location}. You would need to integrate a weather API for this functionality.")
+        self._speech_q.put(f"I'm sorry, I don't have access to current weather data for {location}. You would need to integrate a weather API for this functionality.")
     
-    def _answer_question(self, command_text, *args, **kwargs):
+    def _answer_question(self, command_text, **kwargs):
         """Answer general knowledge questions"""
         # Try OpenAI if available
-        if self.openai_enabled and self.openai_client:
+        if self.openai_enabled and self._get_openai_client():
             try:
-                response = self.openai_client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "You are JARVIS, a helpful AI assistant like in Iron Man. Keep responses brief and factual."},
-                        {"role": "user", "content": command_text}
-                    ],
-                    max_tokens=150
-                )
-                answer = response.choices[0].message.content.strip()
-                self.speaker.speak(answer)
-                return
+                if self._openai_reply(command_text, _ANSWER_MSGS_HEAD, 150):
+                    return
             except Exception as e:
-                logger.error(f"OpenAI API error: {e}")
-                self.speaker.speak("I had trouble connecting to my knowledge base. Let me try a different approach.")
+                logger.error("OpenAI API error: %s", e)
+                self._speech_q.put(_OPENAI_ERROR_REPLY)
         
         # Try Wikipedia
         try:
             # Extract the subject from the question
-            subjects = re.findall(r'(what|who|where|when) (?:is|are|was|were) (.*)', command_text, re.IGNORECASE)
-            if subjects:
-                subject = subjects[0][1].strip('?').strip()
-                try:
-                    summary = wikipedia.summary(subject, sentences=2)
-                    self.speaker.speak(summary)
+            match = _Q_SUBJECT_RE.search(command_text)
+            if match:
+                subject = match.group(2).strip('?').strip()
+                summary = self._run_async(asyncio.to_thread(_wiki_summary, subject))
+                if summary:
+                    self._speech_q.put(summary)
                     return
-                except wikipedia.exceptions.DisambiguationError as e:
-                    # If ambiguous, just pick the first option
-                    try:
-                        summary = wikipedia.summary(e.options[0], sentences=2)
-                        self.speaker.speak(summary)
-                        return
-                    except:
-                        pass
-                except wikipedia.exceptions.PageError:
-                    pass
         except Exception as e:
-            logger.error(f"Wikipedia error: {e}")
+            logger.error("Wikipedia error: %s", e)
         
         # Fallback response
-        self.speaker.speak("I'm sorry, I don't have an answer for that question right now. Please try asking something else.")
+        self._speech_q.put("I'm sorry, I don't have an answer for that question right now. Please try asking something else.")
     
-    def _shutdown(self, command_text, *args, **kwargs):
+    def _shutdown(self, command_text, **kwargs):
         """Shutdown Jarvis"""
-        self.speaker.speak("Shutting down. Goodbye, sir.")
-        import sys
+        self._speech_q.put("Shutting down. Goodbye, sir.")
+        
+        # Let the goodbye finish playing, then release the network clients and the app search pool
+        self._speech_q.join()
+        if self._session is not None:
+            self._session.close()
+        if self.system_handler is not None:
+            self.system_handler.app_finder.close()
+        if self.openai_client is not None:
+            try:
+                self._run_async(self.openai_client.close(), timeout=5)
+            except Exception as e:
+                logger.error("Error closing OpenAI client: %s", e)
         sys.exit(0)
     
     def _introduce_self(self, command_text, **kwargs):
         """Jarvis introduces itself"""
         intro = "I am JARVIS, a virtual assistant inspired by Tony Stark's AI in the Iron Man films. I'm here to assist you with information, answer questions, and help with various tasks."
-        self.speaker.speak(intro)
+        self._speech_q.put(intro)
     
     def _mood_response(self, command_text, **kwargs):
         """Respond to questions about how Jarvis is feeling"""
-        responses = [
-            "I'm functioning within normal parameters, thank you for asking.",
-            "All systems are operating at optimal efficiency.",
-            "I'm doing well, sir. How can I assist you today?",
-            "I'm operating at peak performance levels."
-        ]
-        self.speaker.speak(random.choice(responses))
+        self._speech_q.put(next(self._mood_replies))
     
     def _youre_welcome(self, command_text, **kwargs):
         """Respond to thanks"""
-        responses = [
-            "You're welcome, sir.",
-            "Happy to be of service.",
-            "At your service, sir.",
-            "It's my pleasure."
-        ]
-        self.speaker.speak(random.choice(responses))
+        self._speech_q.put(next(self._welcome_replies))
         
     def _help_command(self, command_text, **kwargs):
         """Provide help information about available commands"""
-        help_text = """
-        I can help you with various tasks. Here are some things you can ask me:
-        
-        For time and date: "What time is it?" or "What's today's date?"
-        
-        For information: "Who is Albert Einstein?" or "Tell me about quantum physics"
-        
-        For system operations:
-          - Open applications: "Open VS Code" or "Launch Chrome"
-          - File operations: "Create a file called notes.txt" or "Delete file temp.txt"
-          - Directory operations: "Create a folder called Projects" or "Make directory Documents/Work"
-          - Execute commands: "Run command dir" or "Execute command ipconfig"
-        
-        For system analysis:
-          - System information: "Tell me about my computer" or "What's my system info"
-          - Hardware details: "What's my CPU info" or "Tell me about my memory"
-          - Storage analysis: "What's my disk info" or "Analyze files in C:\\Users"
-          - Process management: "What processes are running" or "List installed applications"
-          - File operations: "Search for *.jpg in Downloads" or "Find documents in C:\\Users"
-        
-        For device monitoring:
-          - Overview: "What devices are connected" or "Tell me about my peripherals"
-          - Display info: "Tell me about my monitors" or "What displays do I have"
-          - Peripheral info: "What USB devices are connected" or "Tell me about my printers"
-          - Audio devices: "What audio devices are connected" or "Tell me about my speakers"
-          - Device detection: "Scan for new devices" or "Check for newly connected devices"
-        
-        For security and privacy:
-          - View settings: "Show privacy settings" or "Is my data secure?"
-          - Manage settings: "Enable file system data collection" or "Disable usage tracking"
-          - Protect data: "Add sensitive directory Documents/Personal" or "Show data access log"
-          - Clear data: "Clear all my data"
-        
-        For weather: "What's the weather like in New York?" (requires API integration)
-        
-        You can also ask about myself: "Who are you?" or "How are you today?"
-        
-        To exit, simply say "Goodbye" or "Exit"
-        """
-        self.speaker.speak(help_text)
+        for sentence in _HELP_SENTENCES:
+            self._speech_q.put(sentence)
     
     def _default_response(self, command_text, **kwargs):
         """Default response for unrecognized commands"""
         # Check if this might be a system operation that wasn't explicitly matched
-        system_operation_keywords = [
-            'create', 'make', 'open', 'launch', 'start', 'run', 'execute',
-            'delete', 'remove', 'folder', 'directory', 'file'
-        ]
-        
-        # Check if this might be a system operation
-        if any(keyword in command_text.lower() for keyword in system_operation_keywords):
+        if _SYS_OP_RE.search(command_text):
             # For folder/directory creation without a specific path
-            if ('create' in command_text.lower() or 'make' in command_text.lower()) and \
-               ('folder' in command_text.lower() or 'directory' in command_text.lower() or 'dir' in command_text.lower()):
+            if _DIR_WORD_RE.search(command_text) and _CREATE_RE.search(command_text):
                 return self._create_directory_prompt(command_text)
             
-            # For folder/directory deletion
-            if ('delete' in command_text.lower() or 'remove' in command_text.lower()) and \
-               ('folder' in command_text.lower() or 'directory' in command_text.lower() or 'dir' in command_text.lower()):
-                self.speaker.speak("Please specify the name of the directory you want to delete.")
-                return
-                
-            # For folder/directory update (rename)
-            if ('update' in command_text.lower() or 'rename' in command_text.lower()) and \
-               ('folder' in command_text.lower() or 'directory' in command_text.lower() or 'dir' in command_text.lower()):
-                self.speaker.speak("Please specify the name of the directory you want to update or rename.")
-                return
-                
-            # For folder/directory insert
-            if ('insert' in command_text.lower()) and \
-               ('folder' in command_text.lower() or 'directory' in command_text.lower() or 'dir' in command_text.lower()):
-                self.speaker.speak("Please specify the directory where you want to insert a file.")
-                return
-            
-            # For file operations
-            if 'file' in command_text.lower() and ('create' in command_text.lower() or 'make' in command_text.lower()):
-                self.speaker.speak("Please specify a name for the file you want to create.")
-                return
+            # Other directory and file operations missing their target get a prompt for it
+            for subject_re, verb_re, prompt in _INCOMPLETE_OP_PROMPTS:
+                if subject_re.search(command_text) and verb_re.search(command_text):
+                    self._speech_q.put(prompt)
+                    return
             
-            # For app launching
-            if any(keyword in command_text.lower() for keyword in ['open', 'launch', 'start', 'run']):
-                # Extract potential app name after the operation keyword
-                for keyword in ['open', 'launch', 'start', 'run']:
-                    if keyword in command_text.lower():
-                        parts = command_text.lower().split(keyword, 1)
-                        if len(parts) > 1 and parts[1].strip():
-                            app_name = parts[1].strip()
-                            return self._open_application(command_text, app_name)
+            # For app launching, take the potential app name after the operation keyword
+            launch = _LAUNCH_RE.search(command_text)
+            if launch:
+                app_name = command_text[launch.end():].strip()
+                if app_name:
+                    return self._open_application(command_text, app_name=app_name)
         
         # If not a system operation or couldn't be handled, try OpenAI
-        if self.openai_enabled and self.openai_client:
+        if self.openai_enabled and self._get_openai_client():
             try:
-                response = self.openai_client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "You are JARVIS, a helpful AI assistant like in Iron Man. Keep responses brief and helpful."},
-                        {"role": "user", "content": command_text}
-                    ],
-                    max_tokens=100
-                )
-                answer = response.choices[0].message.content.strip()
-                self.speaker.speak(answer)
-                return
+                if self._openai_reply(command_text, _DEFAULT_MSGS_HEAD, 100):
+                    return
             except Exception as e:
-                logger.error(f"OpenAI API error: {e}")
-        
-        responses = [
-            "I'm not sure how to help with that. Try asking about the time, weather, or for general information.",
-            "I don't understand that command. Say 'help' for a list of things I can do.",
-            "Could you please rephrase that?",
-            "I'm afraid I don't have a response for that.",
-            "I'm still learning. I don't know how to respond to that yet."
-        ]
-        self.speaker.speak(random.choice(responses))
+                logger.error("OpenAI API error: %s", e)
+        
+        self._speech_q.put(next(self._fallback_replies))
     
     def _handle_enable_privacy_setting(self, command_text, setting=None, **kwargs):
         """Enable a privacy setting."""
-        if not self.security_manager:
-            self.speaker.speak("Security management is not available.")
-            return
-        
-        try:
-            if not setting:
-                # Try to extract from command text
-                match = re.search(r"(?:enable|turn on) (.+?) (?:data collection|tracking|monitoring)", command_text)
-                if match:
-                    setting = match.group(1)
-                else:
-                    self.speaker.speak("Please specify a privacy setting to enable.")
-                    return
-                    
-            setting_name = setting.strip().lower()
-            
-            # Map common phrases to actual setting names
-            setting_map = {
-                "system info": "collect_system_info",
-                "system information": "collect_system_info",
-                "usage": "collect_usage_data",
-                "usage data": "collect_usage_data",
-                "command history": "store_command_history",
-                "network": "allow_network_access",
-                "internet": "allow_network_access",
-                "file system": "allow_file_system_access",
-                "file access": "allow_file_system_access",
-                "file": "allow_file_system_access",
-                "process": "allow_process_management",
-                "application": "allow_process_management"
-            }
-            
-            setting_key = setting_map.get(setting_name)
-            if not setting_key:
-                self.speaker.speak(f"I'm not familiar with the privacy setting '{setting_name}'. Available settings include system info, usage data, command history, network access, file access, and application management.")
-                return
-            
-            # Update the setting
-            self.security_manager.update_privacy_settings({setting_key: True})
-            self.speaker.speak(f"I've enabled {setting_name} data collection.")
-        except Exception as e:
-            logger.error(f"Error updating privacy setting: {e}")
-            self.speaker.speak("I encountered an error while updating privacy settings.")
+        self._set_privacy(command_text, setting, True)
     
     def _handle_disable_privacy_setting(self, command_text, setting=None, **kwargs):
         """Disable a privacy setting."""
+        self._set_privacy(command_text, setting, False)
+    
+    def _set_privacy(self, command_text, setting, enabled):
+        """Enable or disable the privacy setting named in the command."""
         if not self.security_manager:
-            self.speaker.speak("Security management is not available.")
+            self._speech_q.put(_SECURITY_UNAVAILABLE_REPLY)
             return
         
+        action = "enable" if enabled else "disable"
         try:
             if not setting:
                 # Try to extract from command text
-                match = re.search(r"(?:disable|turn off) (.+?) (?:data collection|tracking|monitoring)", command_text)
+                match = (_ENABLE_RE if enabled else _DISABLE_RE).search(command_text)
                 if match:
                     setting = match.group(1)
                 else:
-                    self.speaker.speak("Please specify a privacy setting to disable.")
+                    self._speech_q.put(f"Please specify a privacy setting to {action}.")
                     return
                     
             setting_name = setting.strip().lower()
             
             # Map common phrases to actual setting names
-            setting_map = {
-                "system info": "collect_system_info",
-                "system information": "collect_system_info",
-                "usage": "collect_usage_data",
-                "usage data": "collect_usage_data",
-                "command history": "store_command_history",
-                "network": "allow_network_access",
-                "internet": "allow_network_access",
-                "file system": "allow_file_system_access",
-                "file access": "allow_file_system_access",
-                "file": "allow_file_system_access",
-                "process": "allow_process_management",
-                "application": "allow_process_management"
-            }
-            
-            setting_key = setting_map.get(setting_name)
+            setting_key = _PRIVACY_SETTING_MAP.get(setting_name)
             if not setting_key:
-                self.speaker.speak(f"I'm not familiar with the privacy setting '{setting_name}'. Available settings include system info, usage data, command history, network access, file access, and application management.")
+                self._speech_q.put(f"I'm not familiar with the privacy setting '{setting_name}'. Available settings include system info, usage data, command history, network access, file access, and application management.")
                 return
             
             # Update the setting
-            self.security_manager.update_privacy_settings({setting_key: False})
-            self.speaker.speak(f"I've disabled {setting_name} data collection.")
+            if self.security_manager.update_privacy_settings({setting_key: enabled}):
+                self._speech_q.put(f"I've {action}d {setting_name} data collection.")
+            else:
+                self._speech_q.put(f"I couldn't save the change to {setting_name} data collection.")
         except Exception as e:
-            logger.error(f"Error updating privacy setting: {e}")
-            self.speaker.speak("I encountered an error while updating privacy settings.")
+            logger.error("Error updating privacy setting: %s", e)
+            self._speech_q.put("I encountered an error while updating privacy settings.")
     
     def _handle_show_privacy_settings(self, command_text, **kwargs):
         """Show current privacy settings."""
         if not self.security_manager:
-            self.speaker.speak("Security management is not available.")
+            self._speech_q.put(_SECURITY_UNAVAILABLE_REPLY)
             return
             
         try:
             # Get the current settings
             settings = self.security_manager.privacy_settings
+            flags = tuple(bool(settings.get(key)) for key, _ in _PRIVACY_LABELS)
+            response = _privacy_status(flags, len(settings.get("sensitive_directories", [])))
             
-            # Format settings for display
-            enabled_settings = []
-            disabled_settings = []
-            
-            # Check core settings
-            for key, name in [
-                ("collect_system_info", "System information collection"),
-                ("collect_usage_data", "Usage data collection"),
-                ("store_command_history", "Command history storage"),
-                ("allow_network_access", "Network access"),
-                ("allow_file_system_access", "File system access"),
-                ("allow_process_management", "Application management")
-            ]:
-                if settings.get(key, False):
-                    enabled_settings.append(name)
-                else:
-                    disabled_settings.append(name)
-            
-            response = "Current privacy settings: "
-            
-            if enabled_settings:
-                response += "Enabled: " + ", ".join(enabled_settings) + ". "
-            
-            if disabled_settings:
-                response += "Disabled: " + ", ".join(disabled_settings) + ". "
-            
-            # Count sensitive directories
-            sensitive_dirs = settings.get("sensitive_directories", [])
-            if sensitive_dirs:
-                response += f"Protected directories: {len(sensitive_dirs)}."
-            
-            self.speaker.speak(response)
+            self._speech_q.put(response)
         except Exception as e:
-            logger.error(f"Error showing privacy settings: {e}")
-            self.speaker.speak("I encountered an error while showing privacy settings.")
+            logger.error("Error showing privacy settings: %s", e)
+            self._speech_q.put("I encountered an error while showing privacy settings.")
     
     def _handle_clear_data(self, command_text, **kwargs):
         """Clear all stored data."""
         if not self.security_manager:
-            self.speaker.speak("Security management is not available.")
+            self._speech_q.put(_SECURITY_UNAVAILABLE_REPLY)
             return
             
-        # Ask for confirmation
-        self.speaker.speak("Are you sure you want to clear all your stored data? This cannot be undone. Please say yes or no.")
-        
-        # In a real implementation, you would wait for confirmation here
-        # For now, we'll simulate a confirmed response
-        confirmed = True
-        
-        if confirmed:
-            try:
-                if self.security_manager.clear_all_data():
-                    self.speaker.speak("All your stored data has been cleared, and privacy settings have been reset to defaults.")
-                else:
-                    self.speaker.speak("I had trouble clearing your data. Please try again later.")
-            except Exception as e:
-                logger.error(f"Error clearing data: {e}")
-                self.speaker.speak("I encountered an error while clearing data.")
-        else:
-            self.speaker.speak("Data clearing operation canceled.")
+        # Clearing runs once the user answers, without holding up the command thread
+        confirmation = self._await_yes_no("Are you sure you want to clear all your stored data? This cannot be undone. Please say yes or no.")
+        confirmation.add_done_callback(
+            lambda answer: self._finish_clear_data() if answer.result() else self._speech_q.put("Data clearing operation canceled."))
+    
+    def _finish_clear_data(self):
+        """Clear all stored data once confirmed."""
+        try:
+            if self.security_manager.clear_all_data():
+                self._speech_q.put("All your stored data has been cleared, and privacy settings have been reset to defaults.")
+            else:
+                self._speech_q.put("I had trouble clearing your data. Please try again later.")
+        except Exception as e:
+            logger.error("Error clearing data: %s", e)
+            self._speech_q.put("I encountered an error while clearing data.")
     
     def _handle_add_sensitive_directory(self, command_text, directory=None, **kwargs):
         """Add a sensitive directory to privacy settings."""
         if not self.security_manager:
-            self.speaker.speak("Security management is not available.")
+            self._speech_q.put(_SECURITY_UNAVAILABLE_REPLY)
             return
         
         try:
             if not directory:
                 # Try to extract from command text
-                match = re.search(r"add sensitive directory (.+)", command_text)
+                match = _ADD_SENS_RE.search(command_text)
                 if match:
                     directory = match.group(1)
                 else:
-                    self.speaker.speak("Please specify a directory to protect.")
+                    self._speech_q.put("Please specify a directory to protect.")
                     return
                     
-            directory_path = directory.strip()
-            
             # Resolve the directory path
-            directory_path = str(self.system_handler._resolve_path(directory_path))
+            directory_path = str(self.system_handler._resolve_path(directory.strip()))
             
             # Add to sensitive directories
-            sensitive_dirs = self.security_manager.privacy_settings.get("sensitive_directories", [])
-            if directory_path not in sensitive_dirs:
-                sensitive_dirs.append(directory_path)
-                self.security_manager.update_privacy_settings({"sensitive_directories": sensitive_dirs})
-                self.speaker.speak(f"I've added {directory} to protected directories. Files in this location will be secure.")
+            if directory_path in self.security_manager.privacy_settings.get("sensitive_directories", ()):
+                self._speech_q.put(f"{directory} is already in the list of protected directories.")
+            elif self.security_manager.add_sensitive_directory(directory_path):
+                self._speech_q.put(f"I've added {directory} to protected directories. Files in this location will be secure.")
             else:
-                self.speaker.speak(f"{directory} is already in the list of protected directories.")
+                self._speech_q.put(f"I couldn't save {directory} as a protected directory.")
         except Exception as e:
-            logger.error(f"Error adding sensitive directory: {e}")
-            self.speaker.speak(f"I had trouble adding this directory as a protected directory.")
+            logger.error("Error adding sensitive directory: %s", e)
+            self._speech_q.put(f"I had trouble adding this directory as a protected directory.")
     
     def _handle_show_data_access_log(self, command_text, **kwargs):
         """Show data access log."""
         if not self.security_manager:
-            self.speaker.speak("Security management is not available.")
+            self._speech_q.put(_SECURITY_UNAVAILABLE_REPLY)
             return
             
         try:
             access_log = self.security_manager.get_secure_data("access_log", [])
             
             if not access_log:
-                self.speaker.speak("There is no data access history to display.")
+                self._speech_q.put("There is no data access history to display.")
                 return
             
-            # Limit to the most recent 5 items for voice response
-            recent_logs = access_log[-5:]
-            
-            response = "Recent data access activity: "
-            for entry in recent_logs:
-                # Format timestamp for readability
-                timestamp = entry["timestamp"].split("T")[0]
-                response += f"{timestamp}: {entry['data_type']} - {entry['description']}. "
+            # Limit to the most recent 5 items for voice response; ISO timestamps keep the date in the first 10 chars
+            parts = [f"{entry['timestamp'][:10]}: {entry['data_type']} - {entry['description']}. " for entry in access_log[-5:]]
             
-            response += f"Showing 5 of {len(access_log)} total entries."
-            self.speaker.speak(response)
+            response = f"Recent data access activity: {''.join(parts)}Showing 5 of {len(access_log)} total entries."
+            self._speech_q.put(response)
         except Exception as e:
-            logger.error(f"Error showing data access log: {e}")
-            self.speaker.speak("I encountered an error while showing the data access log.")
+            logger.error("Error showing data access log: %s", e)
+            self._speech_q.put("I encountered an error while showing the data access log.")
     
     def _handle_data_security_status(self, command_text, **kwargs):
         """Show data security status."""
         if not self.security_manager:
-            self.speaker.speak("Security management is not available.")
+            self._speech_q.put(_SECURITY_UNAVAILABLE_REPLY)
             return
             
         try:
@@ -1271,169 +1520,157 @@ class CommandProcessor:
             secure_storage_exists = self.security_manager.secure_storage_file.exists()
             privacy_settings_exist = self.security_manager.privacy_file.exists()
             
-            response = "Data Security Status: "
+            parts = ["Data Security Status: "]
             
             if encryption_enabled and secure_storage_exists and privacy_settings_exist:
-                response += "Your data is secure. Encryption is enabled, secure storage is set up, and privacy settings are configured."
+                parts.append("Your data is secure. Encryption is enabled, secure storage is set up, and privacy settings are configured.")
             else:
-                response += "There may be issues with your data security. "
+                parts.append("There may be issues with your data security. ")
                 if not encryption_enabled:
-                    response += "Encryption is not properly configured. "
+                    parts.append("Encryption is not properly configured. ")
                 if not secure_storage_exists:
-                    response += "Secure storage has not been set up. "
+                    parts.append("Secure storage has not been set up. ")
                 if not privacy_settings_exist:
-                    response += "Privacy settings are not configured. "
+                    parts.append("Privacy settings are not configured. ")
             
-            self.speaker.speak(response)
+            self._speech_q.put("".join(parts))
         except Exception as e:
-            logger.error(f"Error checking security status: {e}")
-            self.speaker.speak("I encountered an error while checking security status.")
+            logger.error("Error checking security status: %s", e)
+            self._speech_q.put("I encountered an error while checking security status.")
     
-    def _create_directory_prompt(self, command_text, *args, **kwargs):
+    def _create_directory_prompt(self, command_text, **kwargs):
         """Prompt for directory path and create a directory."""
         if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
+            self._speech_q.put(_SYSTEM_UNAVAILABLE_REPLY)
             return
         
-        self.speaker.speak("Where would you like to create the folder? Please specify a path.")
+        self._speech_q.put("Where would you like to create the folder? Please specify a path.")
         # In a real implementation, you would wait for the user's response
         # For now, let's use a default path as an example
         dir_path = "Jarvis_Test_Folder"
         
         try:
-            self.speaker.speak(f"Creating directory {dir_path}.")
+            self._speech_q.put(f"Creating directory {dir_path}.")
             success = self.system_handler.create_directory(dir_path)
             
             if success:
-                self.speaker.speak(f"Directory {dir_path} has been created.")
+                self._speech_q.put(f"Directory {dir_path} has been created.")
             else:
-                logger.error(f"Failed to create directory: {dir_path}")
-                self.speaker.speak(f"I couldn't create the directory {dir_path}. Please check the path and try again.")
+                logger.error("Failed to create directory: %s", dir_path)
+                self._speech_q.put(f"I couldn't create the directory {dir_path}. Please check the path and try again.")
         except Exception as e:
-            logger.error(f"Error creating directory {dir_path}: {e}")
-            self.speaker.speak(f"I had trouble creating the directory {dir_path}. {str(e)}")
+            logger.error("Error creating directory %s: %s", dir_path, e)
+            self._speech_q.put(f"I had trouble creating the directory {dir_path}. {e}")
             return False
     
-    def _delete_directory(self, command_text, *args, **kwargs):
+    def _delete_directory(self, command_text, **kwargs):
         """Delete a directory."""
         if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
+            self._speech_q.put(_SYSTEM_UNAVAILABLE_REPLY)
             return
         
-        # Get dir_path from kwargs if available, otherwise use the first argument
+        # Get dir_path from the matched pattern
         dir_path = kwargs.get('dir_path')
-        if not dir_path and args:
-            dir_path = args[0]
             
         if not dir_path:
-            self.speaker.speak("Sorry, I didn't catch which directory to delete.")
+            self._speech_q.put("Sorry, I didn't catch which directory to delete.")
             return
             
         dir_path = dir_path.strip()
         
+        # Deletion runs once the user answers, without holding up the command thread
+        confirmation = self._await_yes_no(f"Are you sure you want to delete the directory {dir_path}? This cannot be undone. Please confirm yes or no.")
+        confirmation.add_done_callback(
+            lambda answer: self._finish_delete_directory(dir_path) if answer.result() else self._speech_q.put("Directory deletion cancelled."))
+    
+    def _finish_delete_directory(self, dir_path):
+        """Delete a directory the user has confirmed."""
         try:
-            # Ask for confirmation
-            self.speaker.speak(f"Are you sure you want to delete the directory {dir_path}? This cannot be undone. Please confirm yes or no.")
-            
-            # Here you would need to listen for confirmation
-            # For now, let's assume it's confirmed
-            confirmation = True  # In real implementation, this would be the result of listening for confirmation
+            self._speech_q.put(f"Deleting directory {dir_path}.")
+            success = self.system_handler.delete_item(dir_path)
             
-            if confirmation:
-                self.speaker.speak(f"Deleting directory {dir_path}.")
-                success = self.system_handler.delete_item(dir_path)
-                
-                if success:
-                    self.speaker.speak(f"Directory {dir_path} has been deleted.")
-                else:
-                    logger.error(f"Failed to delete directory: {dir_path}")
-                    self.speaker.speak(f"I couldn't delete the directory {dir_path}. Please check that it exists and try again.")
+            if success:
+                self._speech_q.put(f"Directory {dir_path} has been deleted.")
             else:
-                self.speaker.speak("Directory deletion cancelled.")
+                logger.error("Failed to delete directory: %s", dir_path)
+                self._speech_q.put(f"I couldn't delete the directory {dir_path}. Please check that it exists and try again.")
         except Exception as e:
-            logger.error(f"Error deleting directory {dir_path}: {e}")
-            self.speaker.speak(f"I had trouble deleting the directory {dir_path}. {str(e)}")
-            return False
+            logger.error("Error deleting directory %s: %s", dir_path, e)
+            self._speech_q.put(f"I had trouble deleting the directory {dir_path}. {e}")
     
-    def _update_directory(self, command_text, *args, **kwargs):
+    def _update_directory(self, command_text, **kwargs):
         """Update a directory (rename)."""
         if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
+            self._speech_q.put(_SYSTEM_UNAVAILABLE_REPLY)
             return
         
-        # Get dir_path from kwargs if available, otherwise use the first argument
+        # Get dir_path from the matched pattern
         dir_path = kwargs.get('dir_path')
-        if not dir_path and args:
-            dir_path = args[0]
             
         if not dir_path:
-            self.speaker.speak("Sorry, I didn't catch which directory to update.")
+            self._speech_q.put("Sorry, I didn't catch which directory to update.")
             return
             
         dir_path = dir_path.strip()
         
         try:
             # In a real implementation, you would ask for the new name
-            self.speaker.speak(f"What would you like to rename the directory {dir_path} to?")
+            self._speech_q.put(f"What would you like to rename the directory {dir_path} to?")
             
             # Here you would need to listen for the new name
             # For now, let's use a default new name as an example
             new_name = f"{dir_path}_updated"
             
             # Use the OS rename operation
-            import os
-            from pathlib import Path
             old_path = self.system_handler._resolve_path(dir_path)
             
-            if not old_path.exists():
-                logger.error(f"Directory does not exist: {dir_path}")
-                self.speaker.speak(f"I couldn't find the directory {dir_path}. Please check the path and try again.")
+            if not self._path_cache.exists(old_path):
+                logger.error("Directory does not exist: %s", dir_path)
+                self._speech_q.put(f"I couldn't find the directory {dir_path}. Please check the path and try again.")
                 return False
                 
             new_path = old_path.parent / new_name
             
             try:
                 os.rename(old_path, new_path)
-                self.speaker.speak(f"Directory {dir_path} has been renamed to {new_name}.")
+                self._path_cache.invalidate(old_path, new_path)
+                self._speech_q.put(f"Directory {dir_path} has been renamed to {new_name}.")
                 return True
             except Exception as rename_e:
-                logger.error(f"Failed to rename directory: {rename_e}")
-                self.speaker.speak(f"I couldn't rename the directory. {str(rename_e)}")
+                logger.error("Failed to rename directory: %s", rename_e)
+                self._speech_q.put(f"I couldn't rename the directory. {rename_e}")
                 return False
                 
         except Exception as e:
-            logger.error(f"Error updating directory {dir_path}: {e}")
-            self.speaker.speak(f"I had trouble updating the directory {dir_path}. {str(e)}")
+            logger.error("Error updating directory %s: %s", dir_path, e)
+            self._speech_q.put(f"I had trouble updating the directory {dir_path}. {e}")
             return False
     
-    def _insert_into_directory(self, command_text, *args, **kwargs):
+    def _insert_into_directory(self, command_text, **kwargs):
         """Insert a file into a directory."""
         if not self.system_handler:
-            self.speaker.speak("I'm sorry, system operations are not available at the moment.")
+            self._speech_q.put(_SYSTEM_UNAVAILABLE_REPLY)
             return
         
-        # Get dir_path from kwargs if available, otherwise use the first argument
+        # Get dir_path from the matched pattern
         dir_path = kwargs.get('dir_path')
-        if not dir_path and args:
-            dir_path = args[0]
             
         if not dir_path:
-            self.speaker.speak("Sorry, I didn't catch which directory to insert into.")
+            self._speech_q.put("Sorry, I didn't catch which directory to insert into.")
             return
             
         dir_path = dir_path.strip()
         
         try:
             # Check if the directory exists
-            from pathlib import Path
             dir_path_obj = self.system_handler._resolve_path(dir_path)
             
-            if not dir_path_obj.exists() or not dir_path_obj.is_dir():
-                self.speaker.speak(f"I couldn't find the directory {dir_path}. Please check the path and try again.")
+            if not self._path_cache.is_dir(dir_path_obj):
+                self._speech_q.put(f"I couldn't find the directory {dir_path}. Please check the path and try again.")
                 return False
             
             # Ask what file to create
-            self.speaker.speak(f"What file would you like to create in {dir_path}?")
+            self._speech_q.put(f"What file would you like to create in {dir_path}?")
             
             # Here you would need to listen for the file name
             # For now, let's use a default file name
@@ -1444,14 +1681,14 @@ class CommandProcessor:
             success = self.system_handler.create_file(str(file_path), content="This file was created by Jarvis.")
             
             if success:
-                self.speaker.speak(f"File {file_name} has been created in {dir_path}.")
+                self._speech_q.put(f"File {file_name} has been created in {dir_path}.")
                 return True
             else:
-                logger.error(f"Failed to create file in directory: {dir_path}")
-                self.speaker.speak(f"I couldn't create the file in {dir_path}. Please check permissions and try again.")
+                logger.error("Failed to create file in directory: %s", dir_path)
+                self._speech_q.put(f"I couldn't create the file in {dir_path}. Please check permissions and try again.")
                 return False
                 
         except Exception as e:
-            logger.error(f"Error inserting into directory {dir_path}: {e}")
-            self.speaker.speak(f"I had trouble inserting into the directory {dir_path}. {str(e)}")
+            logger.error("Error inserting into directory %s: %s", dir_path, e)
+            self._speech_q.put(f"I had trouble inserting into the directory {dir_path}. {e}")
             return False 
\ No newline at end of file
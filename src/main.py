@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import os
+import re
 import sys
 import time
 import logging
@@ -43,30 +44,31 @@ class Jarvis:
     
     def startup_sequence(self):
         """Play a startup greeting"""
-        self.speaker.speak("Initializing JARVIS system. All systems are now online.")
-        self.speaker.speak("At your service, sir. Say my name followed by a command.")
+        self.speaker.speak("Initializing JARVIS system. All systems are now online. At your service, sir. Say my name followed by a command.")
     
     def extract_command(self, text, wake_word):
         """Extract the actual command from text containing the wake word"""
         if not text:
             return None
-            
-        # Convert to lowercase for easier processing
-        text = text.lower()
-        wake_word = wake_word.lower()
         
-        # Check if wake word is in the text
-        if wake_word in text:
-            # Extract the command part (after the wake word)
-            parts = text.split(wake_word, 1)
-            if len(parts) > 1 and parts[1].strip():
-                return parts[1].strip()
-            
-            # If nothing after wake word, it might just be activation
-            return None
-        else:
+        # Matched case-insensitively in the original text, so the slice below lines up with it
+        match = re.search(re.escape(wake_word), text, re.IGNORECASE)
+        if not match:
             # If somehow we got here without wake word, use the whole text
             return text
+        
+        # The command part follows the wake word (original casing kept); nothing after it means plain activation
+        return text[match.end():].lstrip(' ,.!?').strip() or None
+    
+    def process(self, command):
+        """Process a command, then collect any yes/no answer it asks for without the wake word"""
+        self.processor.process_command(command)
+        
+        while self.processor.awaiting_confirmation:
+            reply = self.listener.listen(timeout=10, phrase_time_limit=5)
+            logger.info(f"Confirmation reply: {reply}")
+            # Silence counts as "no" so nothing destructive runs unanswered
+            self.processor.process_command(reply or "no")
     
     def run(self):
         """Main Jarvis execution loop"""
@@ -85,7 +87,7 @@ class Jarvis:
                     if command:
                         # The wake word activation already included a command
                         logger.info(f"Wake word with command detected: {command}")
-                        self.processor.process_command(command)
+                        self.process(command)
                     else:
                         # The wake word was detected alone, wait for a command
                         logger.info("Wake word detected. Listening for command...")
@@ -96,12 +98,10 @@ class Jarvis:
                         if command:
                             logger.info(f"Received command: {command}")
                             # Process command
-                            self.processor.process_command(command)
+                            self.process(command)
                         else:
                             self.speaker.speak("I didn't catch that. Please try speaking clearly and a bit louder, or try direct mode with the --direct flag.")
                 
-                time.sleep(0.1)  # Prevent high CPU usage
-                
         except KeyboardInterrupt:
             logger.info("Shutting down Jarvis...")
             self.speaker.speak("Goodbye, sir.")
@@ -113,8 +113,7 @@ class Jarvis:
     
     def direct_voice_mode(self, num_questions=5):
         """Run in direct voice mode - no wake word needed"""
-        self.speaker.speak("Direct voice mode activated. I'll respond to your questions directly without requiring the wake word.")
-        self.speaker.speak("Please speak clearly after the beep. Say 'exit' to end this mode.")
+        self.speaker.speak("Direct voice mode activated. I'll respond to your questions directly without requiring the wake word. Please speak clearly after the beep. Say 'exit' to end this mode.")
         
         for i in range(num_questions):
             self.speaker.play_activation_sound()
@@ -131,7 +130,7 @@ class Jarvis:
                 break
                 
             # Process command
-            self.processor.process_command(command)
+            self.process(command)
             
             # Wait a moment before listening again
             time.sleep(2)
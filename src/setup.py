@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 import os
 import logging
+import shutil
 import sys
 from pathlib import Path
 
@@ -39,14 +40,12 @@ def setup_resources():
     env_example = project_root / '.env.example'
     
     if not env_file.exists() and env_example.exists():
-        with open(env_example, 'r') as example_file:
-            example_content = example_file.read()
-        
-        with open(env_file, 'w') as env_file_handle:
-            env_file_handle.write(example_content)
-        
-        logger.info(f"Created .env file from .env.example")
-        logger.info("Please edit the .env file with your API keys")
+        try:
+            shutil.copyfile(env_example, env_file)
+            logger.info(f"Created .env file from .env.example")
+            logger.info("Please edit the .env file with your API keys")
+        except OSError as e:
+            logger.error(f"Error creating .env file: {e}")
     
     logger.info("Resource setup complete!")
 
@@ -6,43 +6,91 @@ import wave
 import pyaudio
 import time
 import math
+import array
+import atexit
+import functools
+import hashlib
+import queue
+import re
+import sys
+import threading
+
+# NumPy is optional; beeps fall back to pure Python sample generation without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger("JARVIS.Speaker")
 
-class Speaker:
-    def __init__(self):
-        """Initialize text-to-speech engines"""
-        # Initialize local TTS engine (pyttsx3)
-        self.local_engine = pyttsx3.init()
-        
-        # Configure local TTS properties - adjust for better clarity
+_MALE_VOICE_RE = re.compile(r'male', re.IGNORECASE)
+
+# Rate, volume and voice id resolved by the first Speaker; environment variables are read
+# then rather than at import so values loaded from .env are picked up
+_tts_config = None
+
+def _resolve_tts_config(engine):
+    """Return (rate, volume, voice_id) for the engine, resolving them only once per process"""
+    global _tts_config
+    if _tts_config is None:
         rate = int(os.getenv('TTS_RATE', '150'))  # Slower rate for better understanding
         volume = float(os.getenv('TTS_VOLUME', '1.0'))
         
-        self.local_engine.setProperty('rate', rate)
-        self.local_engine.setProperty('volume', volume)
+        # Try to find a male voice, otherwise use the first available voice
+        voices = engine.getProperty('voices')
+        voice = next((v for v in voices if _MALE_VOICE_RE.search(v.name)), voices[0] if voices else None)
+        if voice is not None:
+            logger.info(f"Selected voice: {voice.name}")
         
-        # Try to find a good voice
-        voices = self.local_engine.getProperty('voices')
-        voice_selected = False
-        
-        for voice in voices:
-            # Try to find a male voice
-            if "male" in voice.name.lower():
-                self.local_engine.setProperty('voice', voice.id)
-                logger.info(f"Selected voice: {voice.name}")
-                voice_selected = True
-                break
-        
-        if not voice_selected and voices:
-            # If no male voice found, use the first available voice
-            self.local_engine.setProperty('voice', voices[0].id)
-            logger.info(f"Selected voice: {voices[0].name}")
+        _tts_config = (rate, volume, voice.id if voice is not None else None)
+    return _tts_config
+
+@functools.lru_cache(maxsize=16)
+def _beep_samples(frequency, duration, volume=0.5, fs=44100):
+    """Return 16-bit mono PCM bytes for a sine beep, memoized per tone"""
+    n = int(fs * duration)
+    if np is not None:
+        t = np.arange(n, dtype=np.float32)
+        return (volume * 32767 * np.sin(2 * np.pi * frequency * t / fs)).astype(np.int16).tobytes()
+    
+    # Without NumPy, fill a contiguous int16 array and copy it out in one go
+    scale = volume * 32767
+    step = 2 * math.pi * frequency / fs
+    samples = array.array('h', (int(scale * math.sin(step * t)) for t in range(n)))
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tobytes()
+
+class Speaker:
+    def __init__(self):
+        """Initialize text-to-speech engines"""
+        # The engine is created and used only on its own thread: with SAPI5 it is a COM object
+        # bound to the thread that created it, while speech is requested from several threads
+        self._tts_q = queue.Queue()
+        self._engine_error = None
+        engine_ready = threading.Event()
+        threading.Thread(target=self._tts_worker, args=(engine_ready,), name="JARVIS-Speaker", daemon=True).start()
+        engine_ready.wait()
+        if self._engine_error is not None:
+            raise self._engine_error
+        rate, volume, _ = _tts_config
         
         # Resources path for sounds
         self.resources_path = Path(__file__).parent / 'resources'
         os.makedirs(self.resources_path, exist_ok=True)
         
+        # Keep one PortAudio instance and its output streams alive, and decode the activation
+        # sound once, so a wake-word activation only has to write the cached frames
+        self._pa = pyaudio.PyAudio()
+        self._streams = {}
+        self._sounds = {}
+        atexit.register(self._close_audio)
+        self._activation = self._load_wav(self.resources_path / 'activation.wav')
+        
+        # Synthesized audio for fixed phrases, keyed by a hash of the text and voice settings
+        self.tts_cache_path = self.resources_path / 'tts_cache'
+        os.makedirs(self.tts_cache_path, exist_ok=True)
+        
         logger.info(f"Speech synthesis initialized with rate={rate}, volume={volume}")
     
     def speak(self, text):
@@ -53,81 +101,160 @@ class Speaker:
             
         logger.info(f"Speaking: {text}")
         
+        # Hand the text to the engine thread and block until it has been spoken
+        self._tts_q.put((text, None))
+        self._tts_q.join()
+    
+    def speak_cached(self, text):
+        """Speak a fixed phrase, synthesizing it to a WAV file the first time and replaying that afterwards"""
+        if not text:
+            logger.warning("Empty text passed to speak_cached method")
+            return
+        
+        # The voice settings are part of the key, so changing them doesn't replay stale audio
+        key = repr((_tts_config, text)).encode('utf-8')
+        path = self.tts_cache_path / f"{hashlib.sha1(key).hexdigest()}.wav"
+        if not path.exists():
+            self._tts_q.put((text, str(path)))
+            self._tts_q.join()
+        
+        if path.exists():
+            logger.info(f"Speaking (cached): {text}")
+            self.play_sound(str(path))
+        else:
+            self.speak(text)
+    
+    def _init_engine(self):
+        """Create the local TTS engine (pyttsx3) and configure it for clarity"""
+        engine = pyttsx3.init()
+        rate, volume, voice_id = _resolve_tts_config(engine)
+        engine.setProperty('rate', rate)
+        engine.setProperty('volume', volume)
+        if voice_id is not None:
+            engine.setProperty('voice', voice_id)
+        return engine
+    
+    def _tts_worker(self, ready):
+        """Own the TTS engine and synthesize queued text in order"""
         try:
-            # Use local TTS engine
-            self.local_engine.say(text)
-            self.local_engine.runAndWait()
+            # COM has to be initialized on every thread that uses a SAPI5 engine
+            if sys.platform == 'win32':
+                import pythoncom
+                pythoncom.CoInitialize()
+            self.local_engine = self._init_engine()
         except Exception as e:
-            logger.error(f"Error during speech synthesis: {e}")
+            self._engine_error = e
+            return
+        finally:
+            ready.set()
+        
+        while True:
+            # Everything queued by now is spoken with a single runAndWait
+            entries = [self._tts_q.get()]
+            while True:
+                try:
+                    entries.append(self._tts_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                # Use local TTS engine; entries with a path are rendered to that file instead of played
+                for text, path in entries:
+                    if path is None:
+                        self.local_engine.say(text)
+                    else:
+                        self.local_engine.save_to_file(text, path)
+                self.local_engine.runAndWait()
+            except Exception as e:
+                logger.error(f"Error during speech synthesis: {e}")
+            finally:
+                for _ in entries:
+                    self._tts_q.task_done()
+    
+    def _output_stream(self, fmt, channels, rate):
+        """Return a started output stream for the given format, reusing one opened earlier"""
+        key = (fmt, channels, rate)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = self._pa.open(format=fmt, channels=channels, rate=rate, output=True)
+        elif stream.is_stopped():
+            stream.start_stream()
+        return stream
+    
+    def _close_audio(self):
+        """Close cached output streams and release PortAudio"""
+        for stream in self._streams.values():
+            try:
+                stream.close()
+            except Exception as e:
+                logger.error(f"Error closing audio stream: {e}")
+        self._streams.clear()
+        self._pa.terminate()
     
     def play_sound(self, sound_file):
         """Play a sound effect from file"""
         try:
-            chunk = 1024
-            wf = wave.open(sound_file, 'rb')
-            p = pyaudio.PyAudio()
+            # Short effects are read whole once and replayed from memory
+            sound = self._sounds.get(sound_file)
+            if sound is None:
+                sound = self._sounds[sound_file] = self._read_wav(sound_file)
             
-            stream = p.open(
-                format=p.get_format_from_width(wf.getsampwidth()),
-                channels=wf.getnchannels(),
-                rate=wf.getframerate(),
-                output=True
-            )
-            
-            data = wf.readframes(chunk)
-            while data:
-                stream.write(data)
-                data = wf.readframes(chunk)
-                
+            frames, fmt, channels, rate = sound
+            stream = self._output_stream(fmt, channels, rate)
+            stream.write(frames)
             stream.stop_stream()
-            stream.close()
-            p.terminate()
             
         except Exception as e:
             logger.error(f"Error playing sound: {e}")
     
+    def _load_wav(self, sound_file):
+        """Read a WAV file into (frames, format, channels, rate), or None if it can't be loaded"""
+        if not sound_file.exists():
+            logger.warning(f"Sound file not found: {sound_file}")
+            return None
+        
+        try:
+            return self._read_wav(sound_file)
+        except Exception as e:
+            logger.error(f"Error loading sound {sound_file}: {e}")
+            return None
+    
+    def _read_wav(self, sound_file):
+        """Read a whole WAV file into (frames, format, channels, rate)"""
+        with wave.open(str(sound_file), 'rb') as wf:
+            return (
+                wf.readframes(wf.getnframes()),
+                self._pa.get_format_from_width(wf.getsampwidth()),
+                wf.getnchannels(),
+                wf.getframerate()
+            )
+    
     def play_activation_sound(self):
         """Play a sound to indicate Jarvis is listening"""
-        # You can add a custom activation sound file
-        activation_sound = self.resources_path / 'activation.wav'
+        # If the activation sound couldn't be loaded at startup, just beep
+        if self._activation is None:
+            self._beep(frequency=1000, duration=0.1)
+            return
         
-        # If the file doesn't exist, just beep
-        if not activation_sound.exists():
-            logger.warning("Activation sound file not found, using beep instead")
+        try:
+            frames, fmt, channels, rate = self._activation
+            stream = self._output_stream(fmt, channels, rate)
+            stream.write(frames)
+            stream.stop_stream()
+        except Exception as e:
+            logger.error(f"Error playing activation sound: {e}")
             self._beep(frequency=1000, duration=0.1)
-        else:
-            try:
-                self.play_sound(str(activation_sound))
-            except Exception as e:
-                logger.error(f"Error playing activation sound: {e}")
-                self._beep(frequency=1000, duration=0.1)
     
     def _beep(self, frequency=1000, duration=0.2):
         """Play a simple beep sound"""
         try:
-            p = pyaudio.PyAudio()
-            volume = 0.5
             fs = 44100  # sampling rate
+            sample_bytes = _beep_samples(frequency, duration, fs=fs)
             
-            # Generate samples
-            samples = (
-                int(volume * 32767 * 
-                    float('{:.9f}'.format(
-                        math.sin(2 * math.pi * frequency * t / fs)
-                    )))
-                for t in range(int(fs * duration))
-            )
-            
-            # Open stream and play
-            stream = p.open(format=pyaudio.paInt16, channels=1, rate=fs, output=True)
-            
-            # Convert the samples to a bytestring
-            sample_bytes = b''.join(s.to_bytes(2, 'little', signed=True) for s in samples)
+            # Play on the shared stream
+            stream = self._output_stream(pyaudio.paInt16, 1, fs)
             stream.write(sample_bytes)
-            
             stream.stop_stream()
-            stream.close()
-            p.terminate()
         except Exception as e:
             logger.error(f"Error playing beep: {e}")
             
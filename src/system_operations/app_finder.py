@@ -1,32 +1,407 @@
 import os
 import sys
+import json
+import time
 import logging
 import subprocess
+import shutil
+import threading
+import atexit
+import itertools
+import functools
 import platform
 from pathlib import Path
-import winreg
 import re
+import glob
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger("JARVIS.AppFinder")
 
+# The registry only exists on Windows, elsewhere the registry lookups are skipped
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+# Makes PowerShell write its output as UTF-8, so it can be decoded without a locale lookup
+_PS_UTF8 = "[Console]::OutputEncoding = [Text.Encoding]::UTF8; "
+
+# Some common applications with their variations
+_APP_VARIATIONS = {
+    'mongodb compass': ('mongodb compass', 'mongodb-compass', 'mongodbcompass', 'compass'),
+    'postman': ('postman',),
+    'mongodb': ('mongodb', 'mongo'),
+    'vscode': ('code', 'vscode', 'visual studio code'),
+    'chrome': ('chrome', 'google chrome'),
+    'firefox': ('firefox', 'mozilla firefox'),
+    'edge': ('edge', 'microsoft edge'),
+    'excel': ('excel', 'microsoft excel'),
+    'word': ('word', 'microsoft word'),
+    'powerpoint': ('powerpoint', 'microsoft powerpoint'),
+    'outlook': ('outlook', 'microsoft outlook'),
+    'access': ('access', 'microsoft access'),
+    'teams': ('teams', 'microsoft teams'),
+    'skype': ('skype',),
+    'steam': ('steam',),
+    'discord': ('discord',),
+    'slack': ('slack',),
+    'zoom': ('zoom',),
+    'photoshop': ('photoshop', 'adobe photoshop'),
+    'illustrator': ('illustrator', 'adobe illustrator'),
+    'android studio': ('android studio', 'androidstudio'),
+    'intellij': ('intellij', 'intellij idea'),
+    'pycharm': ('pycharm',),
+    'webstorm': ('webstorm',),
+    'eclipse': ('eclipse',),
+    'notepad++': ('notepad++', 'notepadplusplus'),
+    'sublime text': ('sublime text', 'sublimetext'),
+    'git': ('git', 'git bash'),
+    'virtualbox': ('virtualbox', 'virtual box'),
+    'vmware': ('vmware', 'vmware workstation'),
+    'docker': ('docker', 'docker desktop'),
+    'obs': ('obs', 'obs studio'),
+    'spotify': ('spotify',),
+    'itunes': ('itunes',),
+    'vlc': ('vlc', 'vlc media player'),
+    'winamp': ('winamp',),
+    'foobar2000': ('foobar2000', 'foobar'),
+    'audacity': ('audacity',),
+    'blender': ('blender',),
+    'gimp': ('gimp',),
+    'paint.net': ('paint.net', 'paintdotnet'),
+    '7zip': ('7zip', '7-zip'),
+    'winrar': ('winrar', 'win-rar'),
+    'telegram': ('telegram',),
+    'whatsapp': ('whatsapp', 'whatsapp desktop'),
+    'signal': ('signal',),
+    'viber': ('viber',),
+    'wechat': ('wechat',),
+    'qbittorrent': ('qbittorrent', 'qbit'),
+    'utorrent': ('utorrent',),
+    'transmission': ('transmission',),
+    'anydesk': ('anydesk',),
+    'teamviewer': ('teamviewer',),
+    'filezilla': ('filezilla',),
+    'putty': ('putty',),
+    'winscp': ('winscp',),
+    'xampp': ('xampp',),
+    'brave': ('brave', 'brave browser'),
+    'opera': ('opera',),
+    'instagram': ('instagram', 'instagram desktop'),
+    'facebook': ('facebook', 'facebook desktop'),
+    'twitter': ('twitter', 'x', 'twitter desktop'),
+    'linkedin': ('linkedin', 'linkedin desktop'),
+    'pinterest': ('pinterest',),
+    'tiktok': ('tiktok',),
+    'youtube': ('youtube',),
+    'netflix': ('netflix',),
+    'amazon': ('amazon', 'amazon shopping'),
+    'prime video': ('prime video', 'amazon prime video')
+}
+
+# Every name and alias mapped to its variations, so lookups are a single probe
+_ALIAS_TO_VARIATIONS = {
+    alias: tuple(dict.fromkeys(variations))
+    for app, variations in _APP_VARIATIONS.items()
+    for alias in (app, *variations)
+}
+
+# Every name and alias mapped back to its main app name
+_ALIAS_TO_APP = {
+    alias: app
+    for app, variations in _APP_VARIATIONS.items()
+    for alias in (app, *variations)
+}
+
+# Usual install locations of popular apps, checked before any search
+_KNOWN_INSTALL_HINTS = {
+    'postman': (r'%LOCALAPPDATA%\Postman\Postman.exe', r'%LOCALAPPDATA%\Postman\app-*\Postman.exe'),
+    'mongodb compass': (
+        r'%LOCALAPPDATA%\MongoDBCompass\MongoDBCompass.exe',
+        r'%LOCALAPPDATA%\Programs\MongoDB Compass\MongoDBCompass.exe',
+        r'%ProgramFiles%\MongoDB Compass\MongoDBCompass.exe'
+    ),
+    'vscode': (r'%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe', r'%ProgramFiles%\Microsoft VS Code\Code.exe'),
+    'chrome': (
+        r'%ProgramFiles%\Google\Chrome\Application\chrome.exe',
+        r'%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe',
+        r'%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe'
+    ),
+    'firefox': (r'%ProgramFiles%\Mozilla Firefox\firefox.exe', r'%ProgramFiles(x86)%\Mozilla Firefox\firefox.exe'),
+    'edge': (r'%ProgramFiles(x86)%\Microsoft\Edge\Application\msedge.exe', r'%ProgramFiles%\Microsoft\Edge\Application\msedge.exe'),
+    'brave': (r'%ProgramFiles%\BraveSoftware\Brave-Browser\Application\brave.exe',),
+    'discord': (r'%LOCALAPPDATA%\Discord\app-*\Discord.exe',),
+    'slack': (r'%LOCALAPPDATA%\slack\app-*\slack.exe',),
+    'spotify': (r'%APPDATA%\Spotify\Spotify.exe',),
+    'zoom': (r'%APPDATA%\Zoom\bin\Zoom.exe',),
+    'telegram': (r'%APPDATA%\Telegram Desktop\Telegram.exe',),
+    'steam': (r'%ProgramFiles(x86)%\Steam\steam.exe',),
+    'notepad++': (r'%ProgramFiles%\Notepad++\notepad++.exe',),
+    'vlc': (r'%ProgramFiles%\VideoLAN\VLC\vlc.exe',),
+    '7zip': (r'%ProgramFiles%\7-Zip\7zFM.exe',),
+    'git': (r'%ProgramFiles%\Git\git-bash.exe',)
+}
+
+# Names worth searching the disk for, as opposed to web-only names
+_KNOWN_LOCAL_APPS = frozenset(_ALIAS_TO_VARIATIONS)
+
+# Built-in Windows commands that can be launched by name
+_DIRECT_COMMANDS = frozenset({"cmd", "powershell", "notepad", "calc", "mspaint", "explorer", "wordpad"})
+
+# Built-in Windows apps launched through their URI scheme
+_STORE_APP_URIS = {
+    'edge': 'microsoft-edge:',
+    'microsoft edge': 'microsoft-edge:',
+    'mail': 'outlookmail:',
+    'outlook': 'outlookmail:',
+    'calendar': 'outlookcal:',
+    'maps': 'bingmaps:',
+    'photos': 'ms-photos:',
+    'settings': 'ms-settings:',
+    'calculator': 'calculator:',
+    'calc': 'calculator:',
+    'weather': 'bingweather:',
+    'news': 'bingnews:',
+    'store': 'ms-windows-store:',
+    'microsoft store': 'ms-windows-store:',
+    'xbox': 'xbox:',
+    'paint': 'ms-paint:',
+    'ms paint': 'ms-paint:'
+}
+
+# Common default-browser ProgIDs (lowercased) mapped to browser names
+_BROWSER_MAP = {
+    'chromehtml': 'chrome',
+    'firefoxurl': 'firefox',
+    'msedgehtm': 'msedge',
+    'ie.http': 'iexplore',
+    'bravehtml': 'brave',
+    'operastable': 'opera'
+}
+
+# Command prefix that opens a URL in the default browser, per OS
+_URL_OPEN_COMMANDS = {'windows': 'start ', 'darwin': 'open '}
+
+# Names treated as bare domains and opened over https
+_DOMAIN_SUFFIXES = ('.com', '.org', '.net')
+
+# Map of web applications to their URLs
+_WEB_APPS = {
+    'google': 'https://www.google.com',
+    'gmail': 'https://mail.google.com',
+    'google drive': 'https://drive.google.com',
+    'google docs': 'https://docs.google.com',
+    'google sheets': 'https://sheets.google.com',
+    'google slides': 'https://slides.google.com',
+    'google maps': 'https://maps.google.com',
+    'google translate': 'https://translate.google.com',
+    'youtube': 'https://www.youtube.com',
+    'facebook': 'https://www.facebook.com',
+    'instagram': 'https://www.instagram.com',
+    'twitter': 'https://twitter.com',
+    'x': 'https://twitter.com',
+    'linkedin': 'https://www.linkedin.com',
+    'github': 'https://github.com',
+    'reddit': 'https://www.reddit.com',
+    'amazon': 'https://www.amazon.com',
+    'ebay': 'https://www.ebay.com',
+    'wikipedia': 'https://www.wikipedia.org',
+    'netflix': 'https://www.netflix.com',
+    'hulu': 'https://www.hulu.com',
+    'disney+': 'https://www.disneyplus.com',
+    'disney plus': 'https://www.disneyplus.com',
+    'spotify': 'https://open.spotify.com',
+    'apple music': 'https://music.apple.com',
+    'soundcloud': 'https://soundcloud.com',
+    'pandora': 'https://www.pandora.com',
+    'twitch': 'https://www.twitch.tv',
+    'espn': 'https://www.espn.com',
+    'nba': 'https://www.nba.com',
+    'nfl': 'https://www.nfl.com',
+    'mlb': 'https://www.mlb.com',
+    'nhl': 'https://www.nhl.com',
+    'weather': 'https://weather.gov',
+    'news': 'https://news.google.com',
+    'cnn': 'https://www.cnn.com',
+    'bbc': 'https://www.bbc.com',
+    'nytimes': 'https://www.nytimes.com',
+    'new york times': 'https://www.nytimes.com',
+    'wsj': 'https://www.wsj.com',
+    'wall street journal': 'https://www.wsj.com',
+    'yahoo': 'https://www.yahoo.com',
+    'bing': 'https://www.bing.com',
+    'duckduckgo': 'https://duckduckgo.com',
+    'outlook.com': 'https://outlook.live.com',
+    'protonmail': 'https://mail.proton.me',
+    'whatsapp web': 'https://web.whatsapp.com',
+    'telegram web': 'https://web.telegram.org',
+    'trello': 'https://trello.com',
+    'asana': 'https://app.asana.com',
+    'notion': 'https://www.notion.so',
+    'evernote': 'https://www.evernote.com',
+    'dropbox': 'https://www.dropbox.com',
+    'onedrive': 'https://onedrive.live.com',
+    'box': 'https://www.box.com',
+    'zoom': 'https://zoom.us',
+    'microsoft teams': 'https://teams.microsoft.com',
+    'google meet': 'https://meet.google.com',
+    'skype': 'https://web.skype.com',
+    'webex': 'https://www.webex.com',
+    'discord': 'https://discord.com/app',
+    'canva': 'https://www.canva.com',
+    'figma': 'https://www.figma.com',
+    'adobe xd': 'https://www.adobe.com/products/xd.html',
+    'photopea': 'https://www.photopea.com',
+    'giphy': 'https://giphy.com',
+    'pinterest': 'https://www.pinterest.com',
+    'imgur': 'https://imgur.com',
+    'flickr': 'https://www.flickr.com',
+    'unsplash': 'https://unsplash.com',
+    'medium': 'https://medium.com',
+}
+
+
+def _version_key(path):
+    """Sort key that orders paths by the version numbers in them (app-1.0.10 after app-1.0.9)."""
+    return [int(n) for n in re.findall(r'\d+', path)]
+
+
+@functools.lru_cache(maxsize=128)
+def _variations_pattern(variations):
+    """Compile a tuple of name variations into one case-insensitive alternation."""
+    return re.compile('|'.join(map(re.escape, variations)), re.IGNORECASE)
+
+
+# ShellLinkHeader LinkFlags bits, see [MS-SHLLINK] 2.1.1
+_LNK_HAS_TARGET_ID_LIST = 0x01
+_LNK_HAS_LINK_INFO = 0x02
+# LinkInfo flag for shortcuts pointing at a local path
+_LNK_VOLUME_ID_AND_LOCAL_BASE_PATH = 0x01
+
+
+def _read_c_string(data, offset, unicode=False):
+    """Read a NUL-terminated string from a byte buffer."""
+    if unicode:
+        end = offset
+        while end + 1 < len(data) and data[end:end + 2] != b'\0\0':
+            end += 2
+        return data[offset:end].decode('utf-16-le')
+    end = data.index(b'\0', offset)
+    return data[offset:end].decode('mbcs' if sys.platform == 'win32' else 'latin-1')
+
+
+def _parse_lnk_target(path):
+    """
+    Read the target path of a shortcut straight from the .lnk file.
+    
+    Only shortcuts to local files carry their target in LinkInfo. Advertised
+    (MSI) and network shortcuts return None and need the shell to resolve them.
+    
+    Args:
+        path (str): Path to the shortcut file
+        
+    Returns:
+        str: Target path, or None if it couldn't be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        
+        header_size, = struct.unpack_from('<I', data, 0)
+        if header_size != 0x4C:
+            return None
+        link_flags, = struct.unpack_from('<I', data, 20)
+        
+        offset = header_size
+        if link_flags & _LNK_HAS_TARGET_ID_LIST:
+            id_list_size, = struct.unpack_from('<H', data, offset)
+            offset += 2 + id_list_size
+        if not link_flags & _LNK_HAS_LINK_INFO:
+            return None
+        
+        (info_header_size, info_flags, _, local_base_path_offset, _,
+         common_suffix_offset) = struct.unpack_from('<6I', data, offset + 4)
+        if not info_flags & _LNK_VOLUME_ID_AND_LOCAL_BASE_PATH:
+            return None
+        
+        # Newer shortcuts also store the strings as UTF-16, prefer those
+        if info_header_size >= 0x24:
+            local_unicode_offset, suffix_unicode_offset = struct.unpack_from('<2I', data, offset + 28)
+            base = _read_c_string(data, offset + local_unicode_offset, unicode=True)
+            suffix = _read_c_string(data, offset + suffix_unicode_offset, unicode=True)
+        else:
+            base = _read_c_string(data, offset + local_base_path_offset)
+            suffix = _read_c_string(data, offset + common_suffix_offset)
+        return base + suffix or None
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+
+
 class AppFinder:
     """
     Finds application paths on the system, even for apps that aren't in standard locations.
     Helps locate executables for applications like Postman, MongoDB Compass, etc.
     """
     
+    # Seconds a found path is trusted before it is checked on disk again
+    CACHE_VERIFY_TTL = 86400
+    # Seconds a failed lookup, command or URI is remembered before searching again, short so new installs show up soon
+    NEGATIVE_CACHE_TTL = 300
+    # Seconds an App Paths registry enumeration is reused
+    REGISTRY_CACHE_TTL = 300
+    # Seconds a Desktop or Start Menu listing is reused
+    LISTING_CACHE_TTL = 60
+    # Seconds an existence check is reused
+    EXISTS_CACHE_TTL = 30
+    # Seconds the Get-StartApps listing is reused
+    START_APPS_CACHE_TTL = 3600
+    
+    # Where per-user installs keep their launcher, relative to the app folder in AppData
+    APPDATA_EXE_LAYOUTS = (
+        "{name}.exe",
+        "current/{name}.exe",
+        "app-*/{name}.exe"  # Squirrel installers (Discord, Slack, Teams, GitHub Desktop)
+    )
+    
+    # Registry keys where installers register their executables
+    APP_PATHS_KEYS = (
+        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"),
+        (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths")
+    ) if winreg else ()
+    
     def __init__(self):
         """Initialize the app finder with system-specific configurations."""
         self.os_type = platform.system().lower()
+        self._url_open_cmd = _URL_OPEN_COMMANDS.get(self.os_type, 'xdg-open ')
         self.user_home = Path.home()
         self.desktop = self.user_home / "Desktop"
         self.common_desktop = Path(os.environ.get('PUBLIC', 'C:/Users/Public')) / "Desktop"
         self.start_menu = self.user_home / "AppData/Roaming/Microsoft/Windows/Start Menu/Programs"
         self.common_start_menu = Path(os.environ.get('PROGRAMDATA', 'C:/ProgramData')) / "Microsoft/Windows/Start Menu/Programs"
-        self.app_cache = {}  # Cache found applications
+        self.cache_file = Path(os.environ.get('LOCALAPPDATA', self.user_home / "AppData/Local")) / "jarvis" / "app_cache.json"
+        self.app_cache = self._load_cache()  # Cache found applications across sessions
+        self._reg_apps_cache = {}  # (root, subkey) -> (timestamp, subkey names)
+        self._listing_cache = {}  # (directory, extensions, recursive) -> (timestamp, files)
+        self._start_menu_index = None  # (timestamp, {shortcut name: path})
+        self._wsh_local = threading.local()  # Per-thread WScript.Shell COM object, created on first use
+        self._wsh_available = True
+        self._lnk_cache = {}  # shortcut path -> (mtime_ns, parsed target)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="JARVIS-AppFinder")
+        atexit.register(self.close)
+        self._exists_cache = {}  # path -> (exists, timestamp)
+        self._start_apps = None  # (timestamp, [(name, app_id), ...]) from Get-StartApps
+        self._start_apps_index = {}  # lowercased name -> (name, app_id)
+        self._default_browser = None  # Browser command, detected on first use
+        self._default_browser_checked = False
         
         logger.info(f"App finder initialized on {self.os_type} system")
     
+    def close(self):
+        """Stop the finder pool, dropping any searches that haven't started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
     def find_application(self, app_name):
         """
         Find the executable path for the given application name.
@@ -43,178 +418,289 @@ class AppFinder:
             
         app_name_lower = app_name.lower()
         
+        # For direct commands, just return the command
+        if app_name_lower in _DIRECT_COMMANDS:
+            return app_name_lower
+        
         # Check if we already found this app
-        if app_name_lower in self.app_cache:
-            return self.app_cache[app_name_lower]
-        
-        # Some common applications with their variations
-        app_variations = {
-            'mongodb compass': ['mongodb compass', 'mongodb-compass', 'mongodbcompass', 'compass'],
-            'postman': ['postman'],
-            'mongodb': ['mongodb', 'mongo'],
-            'vscode': ['code', 'vscode', 'visual studio code'],
-            'chrome': ['chrome', 'google chrome'],
-            'firefox': ['firefox', 'mozilla firefox'],
-            'edge': ['edge', 'microsoft edge'],
-            'excel': ['excel', 'microsoft excel'],
-            'word': ['word', 'microsoft word'],
-            'powerpoint': ['powerpoint', 'microsoft powerpoint'],
-            'outlook': ['outlook', 'microsoft outlook'],
-            'access': ['access', 'microsoft access'],
-            'teams': ['teams', 'microsoft teams'],
-            'skype': ['skype'],
-            'steam': ['steam'],
-            'discord': ['discord'],
-            'slack': ['slack'],
-            'zoom': ['zoom'],
-            'photoshop': ['photoshop', 'adobe photoshop'],
-            'illustrator': ['illustrator', 'adobe illustrator'],
-            'android studio': ['android studio', 'androidstudio'],
-            'intellij': ['intellij', 'intellij idea'],
-            'pycharm': ['pycharm'],
-            'webstorm': ['webstorm'],
-            'eclipse': ['eclipse'],
-            'notepad++': ['notepad++', 'notepadplusplus'],
-            'sublime text': ['sublime text', 'sublimetext'],
-            'git': ['git', 'git bash'],
-            'virtualbox': ['virtualbox', 'virtual box'],
-            'vmware': ['vmware', 'vmware workstation'],
-            'docker': ['docker', 'docker desktop'],
-            'obs': ['obs', 'obs studio'],
-            'spotify': ['spotify'],
-            'itunes': ['itunes'],
-            'vlc': ['vlc', 'vlc media player'],
-            'winamp': ['winamp'],
-            'foobar2000': ['foobar2000', 'foobar'],
-            'audacity': ['audacity'],
-            'blender': ['blender'],
-            'gimp': ['gimp'],
-            'paint.net': ['paint.net', 'paintdotnet'],
-            '7zip': ['7zip', '7-zip'],
-            'winrar': ['winrar', 'win-rar'],
-            'telegram': ['telegram'],
-            'whatsapp': ['whatsapp', 'whatsapp desktop'],
-            'signal': ['signal'],
-            'viber': ['viber'],
-            'wechat': ['wechat'],
-            'qbittorrent': ['qbittorrent', 'qbit'],
-            'utorrent': ['utorrent'],
-            'transmission': ['transmission'],
-            'anydesk': ['anydesk'],
-            'teamviewer': ['teamviewer'],
-            'filezilla': ['filezilla'],
-            'putty': ['putty'],
-            'winscp': ['winscp'],
-            'xampp': ['xampp'],
-            'brave': ['brave', 'brave browser'],
-            'opera': ['opera'],
-            'instagram': ['instagram', 'instagram desktop'],
-            'facebook': ['facebook', 'facebook desktop'],
-            'twitter': ['twitter', 'x', 'twitter desktop'],
-            'linkedin': ['linkedin', 'linkedin desktop'],
-            'pinterest': ['pinterest'],
-            'tiktok': ['tiktok'],
-            'youtube': ['youtube'],
-            'netflix': ['netflix'],
-            'amazon': ['amazon', 'amazon shopping'],
-            'prime video': ['prime video', 'amazon prime video']
-        }
+        hit, cached_path = self._lookup_cache(app_name_lower)
+        if hit:
+            return cached_path
         
         # Find the matching app variations
-        variations = []
-        for app, vars in app_variations.items():
-            if app_name_lower == app or app_name_lower in vars:
-                variations = vars
-                break
-        
-        if not variations:
-            variations = [app_name_lower]
-        
-        # For direct commands, just return the command
-        if app_name_lower in ["cmd", "powershell", "notepad", "calc", "mspaint", "explorer", "wordpad"]:
-            self.app_cache[app_name_lower] = app_name_lower
-            return app_name_lower
+        variations = _ALIAS_TO_VARIATIONS.get(app_name_lower, (app_name_lower,))
         
         # Start with Windows-specific methods
         if self.os_type == 'windows':
-            # Try different methods to find the application
-            path = None
-            try:
-                path = (
-                    self._find_in_program_files(variations) or
-                    self._find_in_appdata(variations) or
-                    self._find_on_desktop(variations) or
-                    self._find_in_start_menu(variations) or
-                    self._find_in_registry(variations) or
-                    self._find_in_windows_apps(variations) or
-                    self._find_with_where_command(variations) or
-                    None
-                )
-            except Exception as e:
-                logger.error(f"Error searching for application {app_name}: {e}")
-                path = None
+            # Web-only names have nothing installed to look for
+            if app_name_lower in _WEB_APPS and app_name_lower not in _KNOWN_LOCAL_APPS:
+                return self._handle_web_app(app_name_lower)
+            
+            # Well-known install locations answer most lookups without a search
+            path = self._find_from_hints(app_name_lower) or self._run_finders(app_name, variations)
             
             if path:
-                self.app_cache[app_name_lower] = path
+                self._remember(app_name_lower, path)
                 return path
             
             # Check if this is a web app that should be opened in a browser
             try:
                 browser_path = self._handle_web_app(app_name_lower)
                 if browser_path:
-                    self.app_cache[app_name_lower] = browser_path
+                    self._remember(app_name_lower, browser_path)
                     return browser_path
             except Exception as e:
                 logger.error(f"Error handling as web app {app_name}: {e}")
         
         # If we get here, we couldn't find the application
         logger.warning(f"Could not find application: {app_name}")
+        self._remember(app_name_lower, None)
+        return None
+    
+    def _find_from_hints(self, app_name):
+        """Check the usual install locations of a well-known application."""
+        for hint in _KNOWN_INSTALL_HINTS.get(_ALIAS_TO_APP.get(app_name), ()):
+            matches = glob.glob(os.path.expandvars(hint))
+            if matches:
+                # Pick the newest version when several are installed
+                path = max(matches, key=_version_key)
+                logger.info(f"Found {app_name} at {path}")
+                return path
         return None
     
+    def _run_finders(self, app_name, variations):
+        """
+        Run the finder methods concurrently and return the best result.
+        
+        Every finder waits on the disk, the registry or a subprocess, so they
+        overlap well on threads. Results are still taken in priority order, so a
+        fast low-priority hit never beats a slower high-priority one.
+        """
+        finders = [
+            self._find_in_program_files,
+            self._find_in_appdata,
+            self._find_on_desktop,
+            self._find_in_start_menu,
+            self._find_in_registry,
+            self._find_in_windows_apps,
+            self._find_on_path
+        ]
+        
+        # Built-in Windows apps like "settings" have no install folder worth walking
+        if app_name.lower() in _STORE_APP_URIS and app_name.lower() not in _KNOWN_LOCAL_APPS:
+            finders = [f for f in finders if f not in (self._find_in_program_files, self._find_in_appdata)]
+        
+        # Start the PowerShell-backed finder first, since it has the longest tail
+        slow_first = sorted(finders, key=lambda f: f != self._find_in_windows_apps)
+        futures = {finder: self._executor.submit(finder, variations) for finder in slow_first}
+        
+        try:
+            for finder in finders:
+                try:
+                    path = futures[finder].result()
+                except Exception as e:
+                    logger.error(f"Error searching for application {app_name} in {finder.__name__}: {e}")
+                    continue
+                if path:
+                    return path
+        finally:
+            # Drop whatever hasn't started yet
+            for future in futures.values():
+                future.cancel()
+        
+        return None
+    
+    def _load_cache(self):
+        """Load previously found applications from the cache file."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                logger.debug(f"Loaded {len(cache)} cached applications")
+                return cache
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading application cache: {e}")
+        return {}
+    
+    def _persist_cache(self):
+        """Write the application cache to disk."""
+        # Write to a temporary file and swap it in so a crash never leaves half a cache file
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(self.app_cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.error(f"Error saving application cache: {e}")
+    
+    def _lookup_cache(self, key):
+        """
+        Look up a cached application path.
+        
+        Args:
+            key (str): Lowercased application name
+            
+        Returns:
+            tuple: (hit, path) where path is None for a remembered miss
+        """
+        entry = self.app_cache.get(key)
+        if not isinstance(entry, dict):
+            return False, None
+        
+        path = entry.get('path')
+        age = time.time() - entry.get('verified_at', 0)
+        
+        # Misses, commands and URIs can't be checked on disk, so they expire quickly
+        # and a later install is still found
+        if path is None or not os.path.isabs(path):
+            if age < self.NEGATIVE_CACHE_TTL:
+                return True, path
+        elif age < self.CACHE_VERIFY_TTL:
+            return True, path
+        elif os.path.exists(path):
+            self._remember(key, path)
+            return True, path
+        
+        # Expired or no longer installed
+        del self.app_cache[key]
+        return False, None
+    
+    def _remember(self, key, path):
+        """Cache a lookup result (None for a miss) and save it to disk."""
+        # Only Windows lookups search anything, elsewhere there is nothing worth saving
+        if self.os_type != 'windows':
+            return
+        self.app_cache[key] = {'path': path, 'verified_at': time.time()}
+        self._persist_cache()
+    
+    def _exists(self, path):
+        """
+        Check whether a path exists, reusing recent answers.
+        
+        The finders probe the same directories and candidate paths over and
+        over, so results are kept for EXISTS_CACHE_TTL seconds.
+        """
+        path = os.fspath(path)
+        cached = self._exists_cache.get(path)
+        now = time.time()
+        if cached and now - cached[1] < self.EXISTS_CACHE_TTL:
+            return cached[0]
+        
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (exists, now)
+        return exists
+    
     def _find_in_program_files(self, app_variations):
         """Find application in Program Files directories."""
         program_dirs = [
             Path(os.environ.get('ProgramFiles', 'C:/Program Files')),
             Path(os.environ.get('ProgramFiles(x86)', 'C:/Program Files (x86)'))
         ]
+        return self._find_in_install_dirs(program_dirs, app_variations)
+    
+    def _find_in_install_dirs(self, install_dirs, app_variations, layouts=(), max_depth=3):
+        """
+        Find an application folder directly under one of the given directories.
+        
+        Each directory is listed once. Exact folder names are tried before partial
+        matches, and every folder is scanned for executables at most once. Known
+        layouts are probed before falling back to a bounded walk.
+        """
+        pattern = _variations_pattern(tuple(app_variations))
         
-        for program_dir in program_dirs:
-            if not program_dir.exists():
+        # LOCALAPPDATA is normally AppData/Local again, so skip repeated roots
+        for install_dir in dict.fromkeys(install_dirs):
+            if not self._exists(install_dir):
                 continue
-                
+            
+            # One pass over the directory picks out every folder any variation could match
+            try:
+                with os.scandir(install_dir) as entries:
+                    candidates = [
+                        (entry.path, entry.name.lower())
+                        for entry in entries
+                        if pattern.search(entry.name) and entry.is_dir()
+                    ]
+            except OSError:
+                continue
+            
             # Look for directories matching the app name
             for app_name in app_variations:
-                # Try exact match first
-                app_dir = program_dir / app_name
-                if app_dir.exists() and app_dir.is_dir():
-                    # Look for .exe files
-                    exes = list(app_dir.glob('**/*.exe'))
-                    if exes:
-                        # Prefer executables with the app name
-                        for exe in exes:
-                            if app_name.lower() in exe.name.lower():
-                                logger.info(f"Found {app_name} at {exe}")
-                                return str(exe)
-                        # Otherwise return the first one
-                        logger.info(f"Found {app_name} at {exes[0]}")
-                        return str(exes[0])
-                
-                # Try partial match
-                potential_dirs = [d for d in program_dir.iterdir() if d.is_dir() and app_name.lower() in d.name.lower()]
-                for pot_dir in potential_dirs:
-                    exes = list(pot_dir.glob('**/*.exe'))
-                    if exes:
-                        # Prefer executables with the app name
-                        for exe in exes:
-                            if app_name.lower() in exe.name.lower():
-                                logger.info(f"Found {app_name} at {exe}")
-                                return str(exe)
-                        # Otherwise return the first one
-                        logger.info(f"Found {app_name} at {exes[0]}")
-                        return str(exes[0])
+                app_name = app_name.lower()
+                # Try exact match first, then partial matches
+                exact = [path for path, name in candidates if name == app_name]
+                partial = [path for path, name in candidates if app_name in name and name != app_name]
+                for app_dir in exact + partial:
+                    exe = self._probe_layouts(app_dir, app_name, layouts) or self._scan_for_exe(app_dir, app_name, max_depth)
+                    if exe:
+                        logger.info(f"Found {app_name} at {exe}")
+                        return exe
+        
+        return None
+    
+    def _probe_layouts(self, app_dir, app_name, layouts):
+        """
+        Look for an executable at well-known places inside an application folder.
         
+        Args:
+            app_dir (str): Application folder
+            app_name (str): Application name used to fill in the layouts
+            layouts (tuple): Glob patterns relative to app_dir, with {name} for the app name
+            
+        Returns:
+            str: Path of the executable, or None if no layout matched
+        """
+        for layout in layouts:
+            pattern = os.path.join(glob.escape(app_dir), layout.format(name=glob.escape(app_name)))
+            matches = glob.glob(pattern)
+            if matches:
+                # Several app-* folders means several versions, the newest is the one to run
+                return max(matches, key=_version_key)
         return None
     
+    def _scan_for_exe(self, root, needle, max_depth=3):
+        """
+        Walk a directory breadth-first looking for an executable.
+        
+        Args:
+            root (Path or str): Directory to search
+            needle (str): Name fragment to prefer in the executable name
+            max_depth (int): How many directory levels below root to descend
+            
+        Returns:
+            str: Path of the first exe whose name contains needle, otherwise the
+                first exe found, or None if there are none
+        """
+        needle = needle.lower()
+        first_exe = None
+        pending = deque([(os.fspath(root), 0)])
+        
+        while pending:
+            current, depth = pending.popleft()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                name = entry.name.lower()
+                                if name.endswith('.exe'):
+                                    # Stop as soon as the name matches
+                                    if needle in name:
+                                        return entry.path
+                                    if first_exe is None:
+                                        first_exe = entry.path
+                            elif depth < max_depth and entry.is_dir(follow_symlinks=False):
+                                pending.append((entry.path, depth + 1))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        
+        return first_exe
+    
     def _find_in_appdata(self, app_variations):
         """Find application in AppData directories."""
         appdata_dirs = [
@@ -222,143 +708,196 @@ class AppFinder:
             self.user_home / "AppData/Roaming",
             Path(os.environ.get('LOCALAPPDATA', 'C:/Users/Default/AppData/Local'))
         ]
-        
-        for appdata_dir in appdata_dirs:
-            if not appdata_dir.exists():
-                continue
-                
-            # Look for directories matching the app name
-            for app_name in app_variations:
-                # Try exact match first
-                app_dir = appdata_dir / app_name
-                if app_dir.exists() and app_dir.is_dir():
-                    # Look for .exe files
-                    exes = list(app_dir.glob('**/*.exe'))
-                    if exes:
-                        # Prefer executables with the app name
-                        for exe in exes:
-                            if app_name.lower() in exe.name.lower():
-                                logger.info(f"Found {app_name} at {exe}")
-                                return str(exe)
-                        # Otherwise return the first one
-                        logger.info(f"Found {app_name} at {exes[0]}")
-                        return str(exes[0])
-                
-                # Try partial match
-                potential_dirs = []
-                try:
-                    potential_dirs = [d for d in appdata_dir.iterdir() if d.is_dir() and app_name.lower() in d.name.lower()]
-                except PermissionError:
-                    continue
-                    
-                for pot_dir in potential_dirs:
-                    exes = list(pot_dir.glob('**/*.exe'))
-                    if exes:
-                        # Prefer executables with the app name
-                        for exe in exes:
-                            if app_name.lower() in exe.name.lower():
-                                logger.info(f"Found {app_name} at {exe}")
-                                return str(exe)
-                        # Otherwise return the first one
-                        logger.info(f"Found {app_name} at {exes[0]}")
-                        return str(exes[0])
-        
-        return None
+        return self._find_in_install_dirs(appdata_dirs, app_variations, self.APPDATA_EXE_LAYOUTS, max_depth=2)
     
     def _find_on_desktop(self, app_variations):
         """Find application shortcuts on Desktop."""
         desktop_dirs = [self.desktop, self.common_desktop]
         
         for desktop_dir in desktop_dirs:
-            if not desktop_dir.exists():
+            if not self._exists(desktop_dir):
                 continue
-                
-            # Look for .lnk files with the app name
+            
+            # List the desktop once and match every variation against it
+            files = self._list_files(desktop_dir, ('.lnk', '.exe'))
             for app_name in app_variations:
-                for lnk in desktop_dir.glob('*.lnk'):
-                    if app_name.lower() in lnk.name.lower():
+                app_name = app_name.lower()
+                
+                # Look for .lnk files with the app name
+                for path, name in files:
+                    if name.endswith('.lnk') and app_name in name:
                         # Try to resolve the shortcut
-                        target = self._resolve_shortcut(lnk)
+                        target = self._resolve_shortcut(path)
                         if target:
-                            logger.info(f"Found {app_name} shortcut at {lnk} pointing to {target}")
+                            logger.info(f"Found {app_name} shortcut at {path} pointing to {target}")
                             return target
                 
                 # Look for .exe files directly on desktop (rare but possible)
-                for exe in desktop_dir.glob('*.exe'):
-                    if app_name.lower() in exe.name.lower():
-                        logger.info(f"Found {app_name} at {exe}")
-                        return str(exe)
+                for path, name in files:
+                    if name.endswith('.exe') and app_name in name:
+                        logger.info(f"Found {app_name} at {path}")
+                        return path
         
         return None
     
     def _find_in_start_menu(self, app_variations):
         """Find application shortcuts in Start Menu."""
-        start_menu_dirs = [self.start_menu, self.common_start_menu]
+        index = self._get_start_menu_index()
+        pattern = _variations_pattern(tuple(app_variations))
+        names = [name for name in index if pattern.search(name)]
         
-        for start_menu_dir in start_menu_dirs:
-            if not start_menu_dir.exists():
-                continue
-                
-            # Look for .lnk files with the app name
-            for app_name in app_variations:
-                for lnk in start_menu_dir.glob('**/*.lnk'):
-                    if app_name.lower() in lnk.name.lower():
-                        # Try to resolve the shortcut
-                        target = self._resolve_shortcut(lnk)
-                        if target:
-                            logger.info(f"Found {app_name} shortcut at {lnk} pointing to {target}")
-                            return target
+        matches = {}
+        for app_name in app_variations:
+            app_name = app_name.lower()
+            # An exactly named shortcut beats one that merely contains the name
+            exact = index.get(f"{app_name}.lnk")
+            if exact:
+                matches.setdefault(exact, app_name)
+            for name in names:
+                if app_name in name:
+                    matches.setdefault(index[name], app_name)
+        
+        # Resolve all candidates together and keep the first in priority order
+        targets = self._resolve_shortcuts_batch(list(matches))
+        for path, app_name in matches.items():
+            target = targets.get(path)
+            if target:
+                logger.info(f"Found {app_name} shortcut at {path} pointing to {target}")
+                return target
         
         return None
     
+    def _get_start_menu_index(self):
+        """
+        Map every Start Menu shortcut name to its path.
+        
+        Built from both Start Menu trees and reused for LISTING_CACHE_TTL seconds,
+        so lookups and searches query one index instead of walking the trees.
+        
+        Returns:
+            dict: Lowercased shortcut file name -> path
+        """
+        if self._start_menu_index and time.time() - self._start_menu_index[0] < self.LISTING_CACHE_TTL:
+            return self._start_menu_index[1]
+        
+        index = {}
+        for start_menu_dir in (self.start_menu, self.common_start_menu):
+            if not self._exists(start_menu_dir):
+                continue
+            for path, name in self._list_files(start_menu_dir, ('.lnk',), recursive=True):
+                # The user's own shortcut wins over an all-users one with the same name
+                index.setdefault(name, path)
+        
+        self._start_menu_index = (time.time(), index)
+        return index
+    
+    def _list_files(self, directory, extensions, recursive=False):
+        """
+        List files with the given extensions, reusing a recent listing.
+        
+        Args:
+            directory (Path): Directory to list
+            extensions (tuple): Lowercase extensions to keep, e.g. ('.lnk',)
+            recursive (bool): Whether to include subdirectories
+            
+        Returns:
+            list: (path, lowercased_name) tuples
+        """
+        key = (str(directory), extensions, recursive)
+        cached = self._listing_cache.get(key)
+        if cached and time.time() - cached[0] < self.LISTING_CACHE_TTL:
+            return cached[1]
+        
+        files = []
+        if recursive:
+            for dirpath, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    name = filename.lower()
+                    if name.endswith(extensions):
+                        files.append((os.path.join(dirpath, filename), name))
+        else:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name.lower()
+                        if name.endswith(extensions):
+                            files.append((entry.path, name))
+            except OSError as e:
+                logger.debug(f"Error listing {directory}: {e}")
+        
+        self._listing_cache[key] = (time.time(), files)
+        return files
+    
     def _find_in_registry(self, app_variations):
         """Find application in Windows Registry."""
         if self.os_type != 'windows':
             return None
             
-        registry_paths = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"),
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths")
-        ]
-        
         for app_name in app_variations:
-            for root, subkey in registry_paths:
-                try:
-                    with winreg.OpenKey(root, subkey) as key:
-                        # Enumerate all subkeys
-                        i = 0
-                        while True:
-                            try:
-                                subkey_name = winreg.EnumKey(key, i)
-                                if app_name.lower() in subkey_name.lower() or f"{app_name}.exe".lower() == subkey_name.lower():
-                                    # Open the specific app key
-                                    with winreg.OpenKey(key, subkey_name) as app_key:
-                                        # Get the default value, which should be the path
-                                        path, _ = winreg.QueryValueEx(app_key, "")
-                                        if path and os.path.exists(path):
-                                            logger.info(f"Found {app_name} in registry at {path}")
-                                            return path
-                                i += 1
-                            except WindowsError:
-                                break
-                except WindowsError:
-                    continue
+            app_name = app_name.lower()
+            exe_name = f"{app_name}.exe"
+            for root, subkey in self.APP_PATHS_KEYS:
+                for subkey_name, name_lower in self._app_paths_subkeys(root, subkey):
+                    if app_name in name_lower or exe_name == name_lower:
+                        path = self._read_app_path(root, subkey, subkey_name)
+                        if path:
+                            logger.info(f"Found {app_name} in registry at {path}")
+                            return path
+        
+        return None
+    
+    def _app_paths_subkeys(self, root, subkey):
+        """
+        List the application entries under an App Paths registry key.
+        
+        The enumeration is cached for REGISTRY_CACHE_TTL seconds so repeated
+        lookups and searches share a single pass over the key.
+        
+        Returns:
+            list: (subkey_name, lowercased_name) tuples
+        """
+        cached = self._reg_apps_cache.get((root, subkey))
+        if cached and time.time() - cached[0] < self.REGISTRY_CACHE_TTL:
+            return cached[1]
         
+        names = []
+        try:
+            with winreg.OpenKey(root, subkey) as key:
+                for i in itertools.count():
+                    try:
+                        name = winreg.EnumKey(key, i)
+                    except OSError:
+                        break
+                    names.append((name, name.lower()))
+        except OSError:
+            pass
+        
+        self._reg_apps_cache[(root, subkey)] = (time.time(), names)
+        return names
+    
+    def _read_app_path(self, root, subkey, subkey_name):
+        """Read the executable path of an App Paths entry, or None if it doesn't exist."""
+        try:
+            with winreg.OpenKey(root, f"{subkey}\\{subkey_name}") as app_key:
+                # Get the default value, which should be the path
+                path, _ = winreg.QueryValueEx(app_key, "")
+        except OSError:
+            return None
+        if path and self._exists(path):
+            return path
         return None
     
-    def _find_with_where_command(self, app_variations):
-        """Find application using the 'where' command."""
+    def _find_on_path(self, app_variations):
+        """Find application executables in the directories on PATH."""
+        path_dirs = [d for d in os.environ.get('PATH', '').split(os.pathsep) if d]
+        
         for app_name in app_variations:
-            try:
-                # Try to find the executable in PATH
-                result = subprocess.run(['where', f"{app_name}.exe"], capture_output=True, text=True)
-                if result.returncode == 0 and result.stdout.strip():
-                    path = result.stdout.strip().split('\n')[0]
-                    if os.path.exists(path):
-                        logger.info(f"Found {app_name} with 'where' command at {path}")
-                        return path
-            except Exception as e:
-                logger.debug(f"Error using 'where' command for {app_name}: {e}")
+            exe_name = f"{app_name}.exe"
+            for path_dir in path_dirs:
+                path = os.path.join(path_dir, exe_name)
+                if os.path.isfile(path):
+                    logger.info(f"Found {app_name} on PATH at {path}")
+                    return path
         
         return None
     
@@ -372,29 +911,110 @@ class AppFinder:
         Returns:
             str: Target path of the shortcut, or None if unsuccessful
         """
+        return self._resolve_shortcuts_batch([shortcut_path]).get(str(shortcut_path))
+    
+    def _resolve_shortcuts_batch(self, shortcut_paths):
+        """
+        Resolve several Windows shortcuts (.lnk) in one go.
+        
+        Targets are read from the .lnk files first. Shortcuts that can't be read
+        that way go through one WScript.Shell COM object, or a single PowerShell
+        process when pywin32 isn't installed.
+        
+        Args:
+            shortcut_paths (list): Paths to the shortcut files
+            
+        Returns:
+            dict: Shortcut path (str) -> existing target path, for the shortcuts that resolved
+        """
+        targets = {}
+        paths = []
+        
+        # Most shortcuts can be read directly, only the rest need the shell
+        for shortcut_path in shortcut_paths:
+            path = str(shortcut_path)
+            target = self._read_shortcut(path)
+            if target and self._exists(target):
+                targets[path] = target
+            else:
+                paths.append(path)
+        if not paths:
+            return targets
+        
+        shell = self._get_wsh_shell()
+        if shell:
+            for path in paths:
+                try:
+                    target = shell.CreateShortCut(path).Targetpath
+                    if target and self._exists(target):
+                        targets[path] = target
+                except Exception as e:
+                    logger.error(f"Error resolving shortcut {path}: {e}")
+            return targets
+        
         try:
-            import win32com.client
-            shell = win32com.client.Dispatch("WScript.Shell")
-            shortcut = shell.CreateShortCut(str(shortcut_path))
-            target = shortcut.Targetpath
-            if target and os.path.exists(target):
-                return target
-        except ImportError:
-            logger.warning("win32com.client not available, using fallback method to resolve shortcuts")
-            try:
-                # Try to use PowerShell as a fallback
-                ps_command = f'(New-Object -ComObject WScript.Shell).CreateShortcut("{shortcut_path}").TargetPath'
-                result = subprocess.run(['powershell', '-Command', ps_command], capture_output=True, text=True)
-                if result.returncode == 0 and result.stdout.strip():
-                    target = result.stdout.strip()
-                    if os.path.exists(target):
-                        return target
-            except Exception as e:
-                logger.error(f"Error resolving shortcut {shortcut_path}: {e}")
+            # Resolve every shortcut in one PowerShell process, one "shortcut|target" line each
+            quoted = ",".join("'" + path.replace("'", "''") + "'" for path in paths)
+            ps_command = (
+                f"{_PS_UTF8}$s = New-Object -ComObject WScript.Shell; "
+                f"foreach ($p in @({quoted})) {{ $p + '|' + $s.CreateShortcut($p).TargetPath }}"
+            )
+            result = subprocess.run(
+                ['powershell', '-Command', ps_command],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                timeout=10
+            )
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    path, _, target = line.partition('|')
+                    target = target.strip()
+                    if target and self._exists(target):
+                        targets[path] = target
+        except subprocess.TimeoutExpired:
+            logger.error("PowerShell shortcut resolution timed out")
         except Exception as e:
-            logger.error(f"Error resolving shortcut {shortcut_path}: {e}")
+            logger.error(f"Error resolving shortcuts with PowerShell: {e}")
         
-        return None
+        return targets
+    
+    def _read_shortcut(self, path):
+        """Parse a shortcut's target, reusing the result until the file changes."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        
+        cached = self._lnk_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        target = _parse_lnk_target(path)
+        self._lnk_cache[path] = (mtime, target)
+        return target
+    
+    def _get_wsh_shell(self):
+        """Return this thread's WScript.Shell COM object, or None if pywin32 isn't available."""
+        if not self._wsh_available:
+            return None
+        
+        # COM objects belong to the thread that created them, so each finder thread gets its own
+        shell = getattr(self._wsh_local, 'shell', None)
+        if shell is None:
+            try:
+                import pythoncom
+                import win32com.client
+                pythoncom.CoInitialize()
+                shell = win32com.client.Dispatch("WScript.Shell")
+                self._wsh_local.shell = shell
+            except ImportError:
+                logger.warning("win32com.client not available, using fallback method to resolve shortcuts")
+                self._wsh_available = False
+            except Exception as e:
+                logger.error(f"Error creating WScript.Shell: {e}")
+        return shell
     
     def search_for_applications(self, search_term):
         """
@@ -409,59 +1029,34 @@ class AppFinder:
         results = []
         
         if self.os_type == 'windows':
-            # Search Start Menu for matching shortcuts
-            start_menu_dirs = [self.start_menu, self.common_start_menu]
-            for start_menu_dir in start_menu_dirs:
-                if not start_menu_dir.exists():
+            # Search Start Menu and Desktop for matching shortcuts
+            search_lower = search_term.lower()
+            # Same index and listings the finders use, so recent scans are shared
+            matches = [path for name, path in self._get_start_menu_index().items() if search_lower in name[:-4]]
+            for desktop_dir in (self.desktop, self.common_desktop):
+                if not self._exists(desktop_dir):
                     continue
                     
-                for lnk in start_menu_dir.glob('**/*.lnk'):
-                    if search_term.lower() in lnk.stem.lower():
-                        target = self._resolve_shortcut(lnk)
-                        if target:
-                            results.append((lnk.stem, target))
+                for path, name in self._list_files(desktop_dir, ('.lnk', '.exe')):
+                    if name.endswith('.lnk') and search_lower in name[:-4]:
+                        matches.append(path)
             
-            # Search Desktop for matching shortcuts
-            desktop_dirs = [self.desktop, self.common_desktop]
-            for desktop_dir in desktop_dirs:
-                if not desktop_dir.exists():
-                    continue
-                    
-                for lnk in desktop_dir.glob('*.lnk'):
-                    if search_term.lower() in lnk.stem.lower():
-                        target = self._resolve_shortcut(lnk)
-                        if target:
-                            results.append((lnk.stem, target))
+            # Resolve every matching shortcut in one batch
+            targets = self._resolve_shortcuts_batch(matches)
+            for path in matches:
+                if path in targets:
+                    results.append((os.path.basename(path)[:-4], targets[path]))
             
             # Search registry for matching entries
-            registry_paths = [
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"),
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths")
-            ]
-            
-            for root, subkey in registry_paths:
-                try:
-                    with winreg.OpenKey(root, subkey) as key:
-                        # Enumerate all subkeys
-                        i = 0
-                        while True:
-                            try:
-                                subkey_name = winreg.EnumKey(key, i)
-                                if search_term.lower() in subkey_name.lower():
-                                    # Open the specific app key
-                                    with winreg.OpenKey(key, subkey_name) as app_key:
-                                        # Get the default value, which should be the path
-                                        path, _ = winreg.QueryValueEx(app_key, "")
-                                        if path and os.path.exists(path):
-                                            app_name = subkey_name
-                                            if app_name.lower().endswith('.exe'):
-                                                app_name = app_name[:-4]
-                                            results.append((app_name, path))
-                                i += 1
-                            except WindowsError:
-                                break
-                except WindowsError:
-                    continue
+            for root, subkey in self.APP_PATHS_KEYS:
+                for subkey_name, name_lower in self._app_paths_subkeys(root, subkey):
+                    if search_lower in name_lower:
+                        path = self._read_app_path(root, subkey, subkey_name)
+                        if path:
+                            app_name = subkey_name
+                            if name_lower.endswith('.exe'):
+                                app_name = app_name[:-4]
+                            results.append((app_name, path))
         
         return results 
 
@@ -471,206 +1066,112 @@ class AppFinder:
             return None
             
         try:
-            # Try using PowerShell to get installed apps
-            powershell_cmd = [
-                'powershell', 
-                '-Command', 
-                "Get-StartApps | ConvertTo-Json"
-            ]
-            
-            try:
-                process = subprocess.run(
-                    powershell_cmd, 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=5
-                )
+            start_apps = self._get_start_apps()
+            if start_apps:
+                # Exact names are a single probe in the index
+                for app_name in app_variations:
+                    entry = self._start_apps_index.get(app_name.lower())
+                    if entry:
+                        return self._start_app_command(*entry)
                 
-                if process.returncode == 0:
-                    import json
-                    try:
-                        apps = json.loads(process.stdout)
-                        if not isinstance(apps, list):
-                            apps = [apps]  # Handle case where only one app is returned
-                            
-                        for app_name in app_variations:
-                            for app in apps:
-                                try:
-                                    if 'Name' in app and app_name.lower() in app['Name'].lower():
-                                        app_id = app.get('AppID', '')
-                                        if app_id:
-                                            logger.info(f"Found Windows Store app: {app['Name']} with ID {app_id}")
-                                            # Return a command to launch the Windows Store app
-                                            return f"explorer.exe shell:AppsFolder\\{app_id}"
-                                except Exception as app_e:
-                                    logger.error(f"Error processing app entry: {app_e}")
-                                    continue
-                                    
-                    except json.JSONDecodeError:
-                        logger.error("Error parsing PowerShell output as JSON")
-            except subprocess.TimeoutExpired:
-                logger.error("PowerShell command timed out")
-            except Exception as e:
-                logger.error(f"Error running PowerShell command: {e}")
+                # Narrow the list with one regex pass, then rank by variation
+                pattern = _variations_pattern(tuple(app_variations))
+                candidates = [entry for entry in start_apps if pattern.search(entry[0])]
+                for app_name in app_variations:
+                    app_name = app_name.lower()
+                    for entry in candidates:
+                        if app_name in entry[0].lower():
+                            return self._start_app_command(*entry)
                 
-            # Fallback to direct command approach
+            # Fallback to the URI schemes of built-in Windows apps
             for app_name in app_variations:
-                for prefix in ["ms-", "ms-windows-store:", ""]:
-                    try:
-                        app_uri = f"{prefix}{app_name.replace(' ', '')}"
-                        if app_name in ["edge", "microsoft edge"]:
-                            return "start microsoft-edge:"
-                        elif app_name in ["mail", "outlook"]:
-                            return "start outlookmail:"
-                        elif app_name in ["calendar"]:
-                            return "start outlookcal:"
-                        elif app_name in ["maps"]:
-                            return "start bingmaps:"
-                        elif app_name in ["photos"]:
-                            return "start ms-photos:"
-                        elif app_name in ["settings"]:
-                            return "start ms-settings:"
-                        elif app_name in ["calculator", "calc"]:
-                            return "start calculator:"
-                        elif app_name in ["weather"]:
-                            return "start bingweather:"
-                        elif app_name in ["news"]:
-                            return "start bingnews:"
-                        elif app_name in ["store", "microsoft store"]:
-                            return "start ms-windows-store:"
-                        elif app_name in ["xbox"]:
-                            return "start xbox:"
-                        elif app_name in ["paint", "ms paint"]:
-                            return "start ms-paint:"
-                    except Exception as uri_e:
-                        logger.error(f"Error creating URI for app {app_name}: {uri_e}")
-                        continue
+                uri = _STORE_APP_URIS.get(app_name)
+                if uri:
+                    return f"start {uri}"
         except Exception as e:
             logger.error(f"Error finding Windows Store apps: {e}")
             
         return None
     
-    def _handle_web_app(self, app_name):
-        """Handle web applications by opening them in the default browser."""
-        # Map of web applications to their URLs
-        web_apps = {
-            'google': 'https://www.google.com',
-            'gmail': 'https://mail.google.com',
-            'google drive': 'https://drive.google.com',
-            'google docs': 'https://docs.google.com',
-            'google sheets': 'https://sheets.google.com',
-            'google slides': 'https://slides.google.com',
-            'google maps': 'https://maps.google.com',
-            'google translate': 'https://translate.google.com',
-            'youtube': 'https://www.youtube.com',
-            'facebook': 'https://www.facebook.com',
-            'instagram': 'https://www.instagram.com',
-            'twitter': 'https://twitter.com',
-            'x': 'https://twitter.com',
-            'linkedin': 'https://www.linkedin.com',
-            'github': 'https://github.com',
-            'reddit': 'https://www.reddit.com',
-            'amazon': 'https://www.amazon.com',
-            'ebay': 'https://www.ebay.com',
-            'wikipedia': 'https://www.wikipedia.org',
-            'netflix': 'https://www.netflix.com',
-            'hulu': 'https://www.hulu.com',
-            'disney+': 'https://www.disneyplus.com',
-            'disney plus': 'https://www.disneyplus.com',
-            'spotify': 'https://open.spotify.com',
-            'apple music': 'https://music.apple.com',
-            'soundcloud': 'https://soundcloud.com',
-            'pandora': 'https://www.pandora.com',
-            'twitch': 'https://www.twitch.tv',
-            'espn': 'https://www.espn.com',
-            'nba': 'https://www.nba.com',
-            'nfl': 'https://www.nfl.com',
-            'mlb': 'https://www.mlb.com',
-            'nhl': 'https://www.nhl.com',
-            'weather': 'https://weather.gov',
-            'news': 'https://news.google.com',
-            'cnn': 'https://www.cnn.com',
-            'bbc': 'https://www.bbc.com',
-            'nytimes': 'https://www.nytimes.com',
-            'new york times': 'https://www.nytimes.com',
-            'wsj': 'https://www.wsj.com',
-            'wall street journal': 'https://www.wsj.com',
-            'yahoo': 'https://www.yahoo.com',
-            'bing': 'https://www.bing.com',
-            'duckduckgo': 'https://duckduckgo.com',
-            'outlook.com': 'https://outlook.live.com',
-            'protonmail': 'https://mail.proton.me',
-            'whatsapp web': 'https://web.whatsapp.com',
-            'telegram web': 'https://web.telegram.org',
-            'trello': 'https://trello.com',
-            'asana': 'https://app.asana.com',
-            'notion': 'https://www.notion.so',
-            'evernote': 'https://www.evernote.com',
-            'dropbox': 'https://www.dropbox.com',
-            'onedrive': 'https://onedrive.live.com',
-            'box': 'https://www.box.com',
-            'zoom': 'https://zoom.us',
-            'microsoft teams': 'https://teams.microsoft.com',
-            'google meet': 'https://meet.google.com',
-            'skype': 'https://web.skype.com',
-            'webex': 'https://www.webex.com',
-            'discord': 'https://discord.com/app',
-            'canva': 'https://www.canva.com',
-            'figma': 'https://www.figma.com',
-            'adobe xd': 'https://www.adobe.com/products/xd.html',
-            'photopea': 'https://www.photopea.com',
-            'giphy': 'https://giphy.com',
-            'pinterest': 'https://www.pinterest.com',
-            'imgur': 'https://imgur.com',
-            'flickr': 'https://www.flickr.com',
-            'unsplash': 'https://unsplash.com',
-            'medium': 'https://medium.com',
-        }
-
-        # Check if app_name is in the web_apps list
+    def _get_start_apps(self):
+        """
+        Get the Start menu apps reported by Get-StartApps.
+        
+        PowerShell is slow to start, so the list is fetched once and reused for
+        START_APPS_CACHE_TTL seconds.
+        
+        Returns:
+            list: (name, app_id) tuples
+        """
+        if self._start_apps is not None and time.time() - self._start_apps[0] < self.START_APPS_CACHE_TTL:
+            return self._start_apps[1]
+        
+        apps = []
         try:
-            # Simple case - direct match in web_apps dictionary
-            if app_name in web_apps:
-                url = web_apps[app_name]
-                # On Windows, just return the start command with URL
-                if self.os_type == 'windows':
-                    return f"start {url}"
-                elif self.os_type == 'darwin':
-                    return f"open {url}"
-                else:
-                    return f"xdg-open {url}"
-            
-            # If app name ends with "website" or "web", try searching for the base name
-            base_name = None
-            if app_name.endswith('website') or app_name.endswith('web'):
-                base_name = app_name.rsplit(' ', 1)[0].strip()
-                if base_name in web_apps:
-                    url = web_apps[base_name]
-                    if self.os_type == 'windows':
-                        return f"start {url}"
-                    elif self.os_type == 'darwin':
-                        return f"open {url}"
-                    else:
-                        return f"xdg-open {url}"
-            
-            # If it's a domain name
-            if app_name.endswith('.com') or app_name.endswith('.org') or app_name.endswith('.net'):
-                if not app_name.startswith('http'):
-                    url = f"https://{app_name}"
-                    if self.os_type == 'windows':
-                        return f"start {url}"
-                    elif self.os_type == 'darwin':
-                        return f"open {url}"
-                    else:
-                        return f"xdg-open {url}"
+            # Try using PowerShell to get installed apps
+            process = subprocess.run(
+                ['powershell', '-Command', f"{_PS_UTF8}Get-StartApps | ConvertTo-Json"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                timeout=5
+            )
             
-            return None
+            if process.returncode == 0:
+                entries = json.loads(process.stdout)
+                if not isinstance(entries, list):
+                    entries = [entries]  # Handle case where only one app is returned
+                for entry in entries:
+                    if isinstance(entry, dict) and entry.get('Name') and entry.get('AppID'):
+                        apps.append((entry['Name'], entry['AppID']))
+        except subprocess.TimeoutExpired:
+            logger.error("PowerShell command timed out")
+        except json.JSONDecodeError:
+            logger.error("Error parsing PowerShell output as JSON")
         except Exception as e:
-            logger.error(f"Error handling web app {app_name}: {str(e)}")
-            return None
+            logger.error(f"Error running PowerShell command: {e}")
+        
+        self._start_apps = (time.time(), apps)
+        self._start_apps_index = {}
+        for name, app_id in apps:
+            self._start_apps_index.setdefault(name.lower(), (name, app_id))
+        return apps
+    
+    def _start_app_command(self, name, app_id):
+        """Build the command that launches a Start menu app by its AppID."""
+        logger.info(f"Found Windows Store app: {name} with ID {app_id}")
+        return f"explorer.exe shell:AppsFolder\\{app_id}"
+    
+    def _handle_web_app(self, app_name):
+        """Handle web applications by opening them in the default browser."""
+        # Simple case - direct match in web apps dictionary
+        url = _WEB_APPS.get(app_name)
+        
+        # If app name ends with "website" or "web", try the base name
+        if url is None and app_name.endswith(('website', 'web')):
+            url = _WEB_APPS.get(app_name.rsplit(' ', 1)[0].strip())
+        
+        # If it's a domain name
+        if url is None and app_name.endswith(_DOMAIN_SUFFIXES) and not app_name.startswith('http'):
+            url = f"https://{app_name}"
+        
+        return self._url_open_cmd + url if url else None
     
     def _get_default_browser(self):
-        """Get the default browser command."""
+        """Get the default browser command, detecting it on first use."""
+        if not self._default_browser_checked:
+            self._default_browser = self._detect_default_browser()
+            self._default_browser_checked = True
+        return self._default_browser
+    
+    def invalidate_default_browser(self):
+        """Forget the detected default browser, e.g. after the user changes it."""
+        self._default_browser = None
+        self._default_browser_checked = False
+    
+    def _detect_default_browser(self):
+        """Detect the default browser command."""
         try:
             if self.os_type == 'windows':
                 try:
@@ -679,21 +1180,14 @@ class AppFinder:
                                          r"Software\Microsoft\Windows\Shell\Associations\UrlAssociations\http\UserChoice") as key:
                         prog_id = winreg.QueryValueEx(key, "ProgId")[0]
                     
-                    # Map common ProgIDs to browser names
-                    browser_map = {
-                        'ChromeHTML': 'chrome',
-                        'FirefoxURL': 'firefox',
-                        'MSEdgeHTM': 'msedge',
-                        'IE.HTTP': 'iexplore',
-                        'BraveHTML': 'brave',
-                        'OperaStable': 'opera'
-                    }
-                    
-                    browser_name = None
-                    for prog_pattern, browser in browser_map.items():
-                        if prog_pattern.lower() in prog_id.lower():
-                            browser_name = browser
-                            break
+                    # Exact ProgIDs are a single lookup, versioned ones like FirefoxURL-308046B0AF4A39CB need the scan
+                    prog_id_lower = prog_id.lower()
+                    browser_name = _BROWSER_MAP.get(prog_id_lower)
+                    if browser_name is None:
+                        for prog_pattern, browser in _BROWSER_MAP.items():
+                            if prog_pattern in prog_id_lower:
+                                browser_name = browser
+                                break
                     
                     if browser_name:
                         # Try to find the browser path
@@ -730,12 +1224,9 @@ class AppFinder:
                 
             elif self.os_type == 'linux':
                 # Try different browser launchers on Linux
-                for cmd in ['xdg-open', 'gnome-open', 'kde-open', 'firefox', 'google-chrome', 'chromium-browser']:
-                    try:
-                        if subprocess.run(['which', cmd], capture_output=True).returncode == 0:
-                            return cmd
-                    except Exception:
-                        continue
+                for cmd in ('xdg-open', 'gnome-open', 'kde-open', 'firefox', 'google-chrome', 'chromium-browser'):
+                    if shutil.which(cmd):
+                        return cmd
                         
             # If we get here, we couldn't determine the default browser
             return None
@@ -4,224 +4,312 @@ import logging
 import platform
 import subprocess
 import re
+import math
 import json
+import time
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from itertools import chain, islice
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("JARVIS.DeviceMonitor")
 
+# A PowerShell session that reads commands from stdin, skipping the user's profile and any prompts
+_PS_SESSION = ('powershell', '-NoLogo', '-NoProfile', '-NonInteractive', '-ExecutionPolicy', 'Bypass', '-Command', '-')
+
+# Printed after each script so the end of its output can be found in the session's stdout
+_PS_END = '---JARVIS-END---'
+
+# PowerShell pipelines for each device category, run together in one process
+_PS_QUERIES = {
+    "usb": "Get-PnpDevice -PresentOnly | Where-Object { $_.Class -eq 'USB' } | Select-Object FriendlyName, Status, Class",
+    "audio": "Get-WmiObject -Class Win32_SoundDevice | Select-Object Name, Status, DeviceID",
+    "monitors": "Get-WmiObject -Namespace root\\wmi -Class WmiMonitorBasicDisplayParams | Select-Object Active, MaxHorizontalImageSize, MaxVerticalImageSize",
+    "video": "Get-WmiObject -Class Win32_VideoController | Select-Object Name, VideoModeDescription, CurrentHorizontalResolution, CurrentVerticalResolution",
+    "printers": "Get-Printer | Select-Object Name, Type, PortName, PrinterStatus, Shared",
+    "bluetooth": "Get-PnpDevice -Class Bluetooth | Select-Object FriendlyName, Status, DeviceID"
+}
+
+_UNKNOWN = "Unknown"
+
+
+def _as_list(data):
+    """Normalize a PowerShell JSON result, which is a bare object when there is only one item."""
+    if data is None:
+        return []
+    if isinstance(data, dict):
+        return [data]
+    return [item for item in data if isinstance(item, dict)]
+
+
+
+# Name fragments that mark an audio device as an input (recording) device
+_MIC_KEYS = ("microphone", "mic array", "mic input")
+
+
+def _is_recording(name):
+    """Guess from its name whether an audio device records rather than plays back."""
+    name = name.lower()
+    return any(key in name for key in _MIC_KEYS)
+
+
+def _plural(count, noun):
+    """Count and noun, pluralized with a trailing 's' unless the count is one."""
+    return f"{count} {noun}" if count == 1 else f"{count} {noun}s"
+
+
+def _names(devices, key="name"):
+    """Set of device names, skipping entries without one."""
+    return {device[key] for device in devices if key in device}
+
+
 class DeviceMonitor:
     """
     Monitors and detects connected devices and peripherals.
     This class helps Jarvis understand what devices are connected to the PC.
     """
     
+    # Seconds a snapshot is considered fresh enough to skip a refresh
+    REFRESH_TTL = 5.0
+    # Seconds a PowerShell query may run before its session is killed and restarted
+    PS_TIMEOUT = 20.0
+    
     def __init__(self):
         """Initialize the device monitor."""
         self.os_type = platform.system().lower()
-        self.usb_devices = self._get_usb_devices()
-        self.audio_devices = self._get_audio_devices()
-        self.monitors = self._get_monitor_info()
-        self.printers = self._get_printer_info()
-        self.bluetooth_devices = self._get_bluetooth_devices()
+        
+        # Raw query results and the categories parsed from them so far
+        self._raw = {}
+        self._parsed = {}
+        
+        # One long-lived PowerShell process serves every query, so only the first pays for startup
+        self._ps = None
+        self._ps_lock = threading.Lock()
+        
+        # Run the first query in the background so startup doesn't wait on PowerShell;
+        # the device attributes block until it finishes
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="JARVIS-Devices")
+        self._pending = self._executor.submit(self._collect_all)
+        self._last_refresh = None
+        atexit.register(self.close)
         
         logger.info(f"Device monitor initialized on {self.os_type} system")
     
-    def _get_usb_devices(self):
-        """Get information about connected USB devices."""
-        usb_devices = []
+    def _category(self, key, parse):
+        """
+        Devices for one category, parsed from the raw snapshot on first access.
+        
+        Handlers usually ask about a single category, so the others are never parsed.
+        """
+        with self._lock:
+            # Apply the result of a background query if one is still outstanding
+            if self._pending is not None:
+                try:
+                    data = self._pending.result(timeout=self.PS_TIMEOUT)
+                except TimeoutError:
+                    logger.error("Timed out waiting for device information")
+                    data = {}
+                self._apply(data)
+                self._pending = None
+            if key not in self._parsed:
+                self._parsed[key] = parse(self._raw)
+            return self._parsed[key]
+    
+    @property
+    def usb_devices(self):
+        """Connected USB devices."""
+        return self._category("usb", lambda raw: self._parse_usb(raw.get("usb")))
+    
+    @property
+    def audio_devices(self):
+        """Audio devices, split into "playback" and "recording"."""
+        return self._category("audio", lambda raw: self._parse_audio(raw.get("audio")))
+    
+    @property
+    def monitors(self):
+        """Connected monitors/displays."""
+        return self._category("monitors", lambda raw: self._parse_monitors(raw.get("monitors"), raw.get("video")))
+    
+    @property
+    def printers(self):
+        """Installed printers."""
+        return self._category("printers", lambda raw: self._parse_printers(raw.get("printers")))
+    
+    @property
+    def bluetooth_devices(self):
+        """Paired Bluetooth devices."""
+        return self._category("bluetooth", lambda raw: self._parse_bluetooth(raw.get("bluetooth")))
+    
+    def _collect_all(self):
+        """
+        Query every device category in a single PowerShell script.
         
-        if self.os_type == 'windows':
-            try:
-                # Use PowerShell to get USB device information
-                ps_command = "Get-PnpDevice -PresentOnly | Where-Object { $_.Class -eq 'USB' } | Select-Object FriendlyName, Status, Class | ConvertTo-Json"
-                result = subprocess.run(['powershell', '-Command', ps_command], capture_output=True, text=True)
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    try:
-                        devices_data = json.loads(result.stdout)
-                        # Check if it's a single device (dictionary) or multiple devices (list)
-                        if isinstance(devices_data, dict):
-                            usb_devices.append(devices_data)
-                        else:
-                            usb_devices = devices_data
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse USB device JSON data")
-            except Exception as e:
-                logger.error(f"Error getting USB devices: {e}")
+        All pipelines run together and return a single JSON object keyed by category.
+        
+        Returns:
+            dict: Raw query results by category, empty if the query failed
+        """
+        if self.os_type != 'windows':
+            return {}
+        
+        # @() keeps every category a JSON array, and try/catch stops one failing cmdlet from sinking the rest
+        fields = "; ".join(f"{name} = @(try {{ {query} }} catch {{ }})" for name, query in _PS_QUERIES.items())
+        # -Compress drops PowerShell's deep indentation, which is most of the output's bytes
+        ps_command = f"[PSCustomObject]@{{ {fields} }} | ConvertTo-Json -Depth 4 -Compress"
+        
+        try:
+            output = self._run_ps(ps_command)
+            if output and output.strip():
+                data = orjson.loads(output) if orjson else json.loads(output)
+                if isinstance(data, dict):
+                    return data
+        except json.JSONDecodeError:
+            logger.error("Failed to parse device JSON data")
+        except Exception as e:
+            logger.error(f"Error querying devices: {e}")
         
-        return usb_devices
+        return {}
     
-    def _get_audio_devices(self):
-        """Get information about audio devices."""
-        audio_devices = {"playback": [], "recording": []}
+    def _run_ps(self, script):
+        """
+        Run a one-line script in the shared PowerShell session.
         
-        if self.os_type == 'windows':
+        Args:
+            script (str): PowerShell script without line breaks
+            
+        Returns:
+            str: Output of the script, or None if the session failed
+        """
+        with self._ps_lock:
             try:
-                # Get audio output devices
-                ps_command = """
-                Get-WmiObject -Class Win32_SoundDevice | 
-                Select-Object Name, Status, DeviceID | 
-                ConvertTo-Json
-                """
-                result = subprocess.run(['powershell', '-Command', ps_command], capture_output=True, text=True)
+                if self._ps is None or self._ps.poll() is not None:
+                    self._ps = subprocess.Popen(
+                        _PS_SESSION,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        encoding='utf-8',
+                        bufsize=1
+                    )
+                    # Match the session's output encoding to the one used to decode it
+                    self._ps.stdin.write("[Console]::OutputEncoding = [Text.Encoding]::UTF8\n")
                 
-                if result.returncode == 0 and result.stdout.strip():
-                    try:
-                        devices_data = json.loads(result.stdout)
-                        # Check if it's a single device (dictionary) or multiple devices (list)
-                        if isinstance(devices_data, dict):
-                            audio_devices["playback"].append({
-                                "name": devices_data.get("Name", "Unknown Audio Device"),
-                                "status": devices_data.get("Status", "Unknown"),
-                                "device_id": devices_data.get("DeviceID", "")
-                            })
-                        else:
-                            for device in devices_data:
-                                # Try to determine if it's an input or output device based on name
-                                device_type = "recording" if "microphone" in device.get("Name", "").lower() else "playback"
-                                audio_devices[device_type].append({
-                                    "name": device.get("Name", "Unknown Audio Device"),
-                                    "status": device.get("Status", "Unknown"),
-                                    "device_id": device.get("DeviceID", "")
-                                })
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse audio device JSON data")
+                # The marker goes on its own line so it is printed even if the script fails
+                self._ps.stdin.write(f"{script}\nWrite-Output '{_PS_END}'\n")
+                self._ps.stdin.flush()
+                
+                # A hung cmdlet would block the read forever; killing the session ends it
+                watchdog = threading.Timer(self.PS_TIMEOUT, self._ps.kill)
+                watchdog.start()
+                try:
+                    lines = []
+                    for line in self._ps.stdout:
+                        if line.rstrip() == _PS_END:
+                            return "".join(lines)
+                        lines.append(line)
+                finally:
+                    watchdog.cancel()
+                logger.error("PowerShell query timed out or the session exited")
+            except Exception as e:
+                logger.error(f"Error running PowerShell: {e}")
+            
+            # Start a fresh session on the next query
+            self._stop_session()
+            return None
+    
+    def _stop_session(self):
+        """Terminate the PowerShell session if one is running."""
+        ps, self._ps = self._ps, None
+        if ps is not None and ps.poll() is None:
+            try:
+                ps.kill()
+                ps.wait()
             except Exception as e:
-                logger.error(f"Error getting audio devices: {e}")
+                logger.error(f"Error stopping PowerShell: {e}")
+    
+    def close(self):
+        """Stop the background query and the PowerShell session."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._stop_session()
+    
+    def _apply(self, data):
+        """Store raw query results; categories are parsed when first read."""
+        self._raw = data
+        self._parsed = {}
+        self._last_refresh = time.monotonic()
+    
+    def _parse_usb(self, devices_data):
+        """Parse connected USB devices."""
+        return _as_list(devices_data)
+    
+    def _parse_audio(self, devices_data):
+        """Parse audio devices into playback and recording lists."""
+        playback, recording = [], []
+        
+        for device in _as_list(devices_data):
+            get = device.get
+            name = get("Name") or "Unknown Audio Device"
+            target = recording if _is_recording(name) else playback
+            target.append({"name": name, "status": get("Status") or _UNKNOWN, "device_id": get("DeviceID") or ""})
         
-        return audio_devices
+        return {"playback": playback, "recording": recording}
     
-    def _get_monitor_info(self):
-        """Get information about connected monitors/displays."""
+    def _parse_monitors(self, monitors_data, display_data):
+        """Parse connected monitors and merge in video controller details."""
         monitors = []
         
-        if self.os_type == 'windows':
-            try:
-                # Get monitor information using PowerShell and WMI
-                ps_command = """
-                Get-WmiObject -Namespace root\\wmi -Class WmiMonitorBasicDisplayParams | 
-                ForEach-Object {
-                    $width = $_.MaxHorizontalImageSize
-                    $height = $_.MaxVerticalImageSize
-                    
-                    # Calculate diagonal size in inches (approximate)
-                    $diagonalCm = [Math]::Sqrt($width * $width + $height * $height)
-                    $diagonalInch = $diagonalCm / 2.54
-                    
-                    # Create custom object with properties
-                    [PSCustomObject]@{
-                        Active = $_.Active
-                        DiagonalSize = [Math]::Round($diagonalInch, 1)
-                        MaxHorizontalImageSize = $width
-                        MaxVerticalImageSize = $height
-                    }
-                } | ConvertTo-Json
-                """
-                result = subprocess.run(['powershell', '-Command', ps_command], capture_output=True, text=True)
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    try:
-                        monitors_data = json.loads(result.stdout)
-                        # Check if it's a single monitor (dictionary) or multiple monitors (list)
-                        if isinstance(monitors_data, dict):
-                            if monitors_data.get("Active", False):
-                                monitors.append({
-                                    "active": True,
-                                    "diagonal_size": f"{monitors_data.get('DiagonalSize', 0)} inches",
-                                    "width_cm": monitors_data.get("MaxHorizontalImageSize", 0),
-                                    "height_cm": monitors_data.get("MaxVerticalImageSize", 0)
-                                })
-                        else:
-                            for monitor in monitors_data:
-                                if monitor.get("Active", False):
-                                    monitors.append({
-                                        "active": True,
-                                        "diagonal_size": f"{monitor.get('DiagonalSize', 0)} inches",
-                                        "width_cm": monitor.get("MaxHorizontalImageSize", 0),
-                                        "height_cm": monitor.get("MaxVerticalImageSize", 0)
-                                    })
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse monitor JSON data")
-                
-                # Get additional display info like resolution
-                ps_command = """
-                Get-WmiObject -Class Win32_VideoController | 
-                Select-Object Name, VideoModeDescription, CurrentHorizontalResolution, CurrentVerticalResolution |
-                ConvertTo-Json
-                """
-                result = subprocess.run(['powershell', '-Command', ps_command], capture_output=True, text=True)
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    try:
-                        display_data = json.loads(result.stdout)
-                        # Check if it's a single display (dictionary) or multiple displays (list)
-                        if isinstance(display_data, dict):
-                            # Add to monitor data if we have it, otherwise create new entry
-                            if monitors and len(monitors) > 0:
-                                monitors[0]["resolution"] = f"{display_data.get('CurrentHorizontalResolution', 0)}x{display_data.get('CurrentVerticalResolution', 0)}"
-                                monitors[0]["name"] = display_data.get("Name", "Unknown Display")
-                            else:
-                                monitors.append({
-                                    "name": display_data.get("Name", "Unknown Display"),
-                                    "resolution": f"{display_data.get('CurrentHorizontalResolution', 0)}x{display_data.get('CurrentVerticalResolution', 0)}",
-                                    "active": True
-                                })
-                        else:
-                            # Match displays to monitors by index (simple approximation)
-                            for i, display in enumerate(display_data):
-                                if i < len(monitors):
-                                    monitors[i]["resolution"] = f"{display.get('CurrentHorizontalResolution', 0)}x{display.get('CurrentVerticalResolution', 0)}"
-                                    monitors[i]["name"] = display.get("Name", "Unknown Display")
-                                else:
-                                    monitors.append({
-                                        "name": display.get("Name", "Unknown Display"),
-                                        "resolution": f"{display.get('CurrentHorizontalResolution', 0)}x{display.get('CurrentVerticalResolution', 0)}",
-                                        "active": True
-                                    })
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse display JSON data")
-            except Exception as e:
-                logger.error(f"Error getting monitor information: {e}")
+        for monitor in _as_list(monitors_data):
+            if monitor.get("Active", False):
+                width = monitor.get("MaxHorizontalImageSize") or 0
+                height = monitor.get("MaxVerticalImageSize") or 0
+                # Diagonal size in inches (approximate)
+                diagonal = round(math.hypot(width, height) / 2.54, 1)
+                monitors.append({
+                    "active": True,
+                    "diagonal_size": f"{diagonal} inches",
+                    "width_cm": width,
+                    "height_cm": height
+                })
+        
+        # Match displays to monitors by index (simple approximation)
+        for i, display in enumerate(_as_list(display_data)):
+            resolution = f"{display.get('CurrentHorizontalResolution', 0)}x{display.get('CurrentVerticalResolution', 0)}"
+            name = display.get("Name", "Unknown Display")
+            if i < len(monitors):
+                monitors[i]["resolution"] = resolution
+                monitors[i]["name"] = name
+            else:
+                monitors.append({
+                    "name": name,
+                    "resolution": resolution,
+                    "active": True
+                })
         
         return monitors
     
-    def _get_printer_info(self):
-        """Get information about installed printers."""
+    def _parse_printers(self, printers_data):
+        """Parse installed printers."""
         printers = []
+        append = printers.append
+        status_of = self._get_printer_status
         
-        if self.os_type == 'windows':
-            try:
-                # Get printer information using PowerShell
-                ps_command = """
-                Get-Printer | Select-Object Name, Type, PortName, PrinterStatus, Shared | ConvertTo-Json
-                """
-                result = subprocess.run(['powershell', '-Command', ps_command], capture_output=True, text=True)
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    try:
-                        printers_data = json.loads(result.stdout)
-                        # Check if it's a single printer (dictionary) or multiple printers (list)
-                        if isinstance(printers_data, dict):
-                            printers.append({
-                                "name": printers_data.get("Name", "Unknown Printer"),
-                                "type": printers_data.get("Type", "Unknown"),
-                                "port": printers_data.get("PortName", "Unknown"),
-                                "status": self._get_printer_status(printers_data.get("PrinterStatus", 0)),
-                                "shared": printers_data.get("Shared", False)
-                            })
-                        else:
-                            for printer in printers_data:
-                                printers.append({
-                                    "name": printer.get("Name", "Unknown Printer"),
-                                    "type": printer.get("Type", "Unknown"),
-                                    "port": printer.get("PortName", "Unknown"),
-                                    "status": self._get_printer_status(printer.get("PrinterStatus", 0)),
-                                    "shared": printer.get("Shared", False)
-                                })
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse printer JSON data")
-            except Exception as e:
-                logger.error(f"Error getting printer information: {e}")
+        for printer in _as_list(printers_data):
+            get = printer.get
+            append({
+                "name": get("Name") or "Unknown Printer",
+                "type": get("Type", _UNKNOWN),
+                "port": get("PortName") or _UNKNOWN,
+                "status": status_of(get("PrinterStatus", 0)),
+                "shared": get("Shared", False)
+            })
         
         return printers
     
@@ -238,41 +326,32 @@ class DeviceMonitor:
         }
         return status_map.get(status_code, "Unknown")
     
-    def _get_bluetooth_devices(self):
-        """Get information about paired Bluetooth devices."""
-        bluetooth_devices = []
-        
-        if self.os_type == 'windows':
-            try:
-                # Get Bluetooth devices using PowerShell
-                ps_command = """
-                Get-PnpDevice -Class Bluetooth | Select-Object FriendlyName, Status, DeviceID | ConvertTo-Json
-                """
-                result = subprocess.run(['powershell', '-Command', ps_command], capture_output=True, text=True)
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    try:
-                        devices_data = json.loads(result.stdout)
-                        # Check if it's a single device (dictionary) or multiple devices (list)
-                        if isinstance(devices_data, dict):
-                            bluetooth_devices.append({
-                                "name": devices_data.get("FriendlyName", "Unknown Bluetooth Device"),
-                                "status": devices_data.get("Status", "Unknown"),
-                                "device_id": devices_data.get("DeviceID", "")
-                            })
-                        else:
-                            for device in devices_data:
-                                bluetooth_devices.append({
-                                    "name": device.get("FriendlyName", "Unknown Bluetooth Device"),
-                                    "status": device.get("Status", "Unknown"),
-                                    "device_id": device.get("DeviceID", "")
-                                })
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse Bluetooth device JSON data")
-            except Exception as e:
-                logger.error(f"Error getting Bluetooth devices: {e}")
-        
-        return bluetooth_devices
+    def _parse_bluetooth(self, devices_data):
+        """Parse paired Bluetooth devices."""
+        return [
+            {
+                "name": get("FriendlyName") or "Unknown Bluetooth Device",
+                "status": get("Status") or _UNKNOWN,
+                "device_id": get("DeviceID") or ""
+            }
+            for get in (device.get for device in _as_list(devices_data))
+        ]
+    
+    def iter_usb_devices(self, limit=None):
+        """Iterate over connected USB devices, stopping after limit entries."""
+        return islice(self.usb_devices, limit)
+    
+    def iter_audio_devices(self, kind, limit=None):
+        """Iterate over 'playback' or 'recording' audio devices, stopping after limit entries."""
+        return islice(self.audio_devices.get(kind, []), limit)
+    
+    def iter_printers(self, limit=None):
+        """Iterate over installed printers, stopping after limit entries."""
+        return islice(self.printers, limit)
+    
+    def iter_bluetooth_devices(self, limit=None):
+        """Iterate over paired Bluetooth devices, stopping after limit entries."""
+        return islice(self.bluetooth_devices, limit)
     
     def get_device_summary(self):
         """Get a human-readable summary of connected devices."""
@@ -281,7 +360,7 @@ class DeviceMonitor:
         # Monitor summary
         if self.monitors:
             monitor_count = len(self.monitors)
-            summary.append(f"You have {monitor_count} display{'s' if monitor_count != 1 else ''} connected.")
+            summary.append(f"You have {_plural(monitor_count, 'display')} connected.")
             for i, monitor in enumerate(self.monitors):
                 if "resolution" in monitor and "name" in monitor:
                     summary.append(f"Display {i+1}: {monitor['name']} ({monitor['resolution']})")
@@ -293,48 +372,61 @@ class DeviceMonitor:
         recording_count = len(self.audio_devices["recording"])
         
         if playback_count > 0:
-            summary.append(f"You have {playback_count} audio output device{'s' if playback_count != 1 else ''}.")
-            for device in self.audio_devices["playback"][:2]:  # Limit to first 2
+            summary.append(f"You have {_plural(playback_count, 'audio output device')}.")
+            for device in self.iter_audio_devices("playback", limit=2):
                 summary.append(f"Audio output: {device['name']}")
         
         if recording_count > 0:
-            summary.append(f"You have {recording_count} audio input device{'s' if recording_count != 1 else ''}.")
-            for device in self.audio_devices["recording"][:2]:  # Limit to first 2
+            summary.append(f"You have {_plural(recording_count, 'audio input device')}.")
+            for device in self.iter_audio_devices("recording", limit=2):
                 summary.append(f"Audio input: {device['name']}")
         
         # Printer summary
         if self.printers:
             printer_count = len(self.printers)
-            summary.append(f"You have {printer_count} printer{'s' if printer_count != 1 else ''} installed.")
-            for printer in self.printers[:2]:  # Limit to first 2
+            summary.append(f"You have {_plural(printer_count, 'printer')} installed.")
+            for printer in self.iter_printers(limit=2):
                 summary.append(f"Printer: {printer['name']} ({printer['status']})")
         
         # USB devices summary
         if self.usb_devices:
             usb_count = len(self.usb_devices)
-            summary.append(f"You have {usb_count} USB device{'s' if usb_count != 1 else ''} connected.")
+            summary.append(f"You have {_plural(usb_count, 'USB device')} connected.")
             # List a few USB devices
-            for device in self.usb_devices[:3]:  # Limit to first 3
+            for device in self.iter_usb_devices(limit=3):
                 if "FriendlyName" in device:
                     summary.append(f"USB device: {device['FriendlyName']}")
         
         # Bluetooth devices summary
         if self.bluetooth_devices:
             bt_count = len(self.bluetooth_devices)
-            summary.append(f"You have {bt_count} Bluetooth device{'s' if bt_count != 1 else ''} paired.")
+            summary.append(f"You have {_plural(bt_count, 'Bluetooth device')} paired.")
             # List a few Bluetooth devices
-            for device in self.bluetooth_devices[:3]:  # Limit to first 3
+            for device in self.iter_bluetooth_devices(limit=3):
                 summary.append(f"Bluetooth device: {device['name']}")
         
         return summary
     
-    def refresh(self):
-        """Refresh all device information."""
-        self.usb_devices = self._get_usb_devices()
-        self.audio_devices = self._get_audio_devices()
-        self.monitors = self._get_monitor_info()
-        self.printers = self._get_printer_info()
-        self.bluetooth_devices = self._get_bluetooth_devices()
+    def refresh(self, force=False):
+        """
+        Refresh all device information.
+        
+        Args:
+            force (bool): Query again even if the last snapshot is still fresh
+            
+        Returns:
+            bool: Success status
+        """
+        if not force and self._last_refresh is not None and time.monotonic() - self._last_refresh < self.REFRESH_TTL:
+            return True
+        
+        data = self._collect_all()
+        with self._lock:
+            # A newer snapshot supersedes any startup query still outstanding
+            if self._pending is not None:
+                self._pending.cancel()
+                self._pending = None
+            self._apply(data)
         
         logger.info("Device information refreshed")
         
@@ -353,38 +445,23 @@ class DeviceMonitor:
         if not previous_state:
             return None
         
-        new_devices = {
-            "usb": [],
-            "audio": [],
-            "bluetooth": [],
-            "printers": []
-        }
+        # Look up each category of the previous state once
+        prev_usb = previous_state.get("usb_devices", ())
+        prev_audio = previous_state.get("audio_devices", {})
+        prev_bluetooth = previous_state.get("bluetooth_devices", ())
+        prev_printers = previous_state.get("printers", ())
         
-        # Compare USB devices
-        current_usb_names = set(device.get("FriendlyName", "") for device in self.usb_devices)
-        previous_usb_names = set(device.get("FriendlyName", "") for device in previous_state.get("usb_devices", []))
-        new_devices["usb"] = list(current_usb_names - previous_usb_names)
+        audio = self.audio_devices
+        current_audio = chain(audio.get("playback", ()), audio.get("recording", ()))
+        previous_audio = chain(prev_audio.get("playback", ()), prev_audio.get("recording", ()))
         
-        # Compare audio devices
-        current_audio_names = set()
-        for device in self.audio_devices.get("playback", []) + self.audio_devices.get("recording", []):
-            current_audio_names.add(device.get("name", ""))
-            
-        previous_audio_names = set()
-        for device in previous_state.get("audio_devices", {}).get("playback", []) + previous_state.get("audio_devices", {}).get("recording", []):
-            previous_audio_names.add(device.get("name", ""))
-            
-        new_devices["audio"] = list(current_audio_names - previous_audio_names)
-        
-        # Compare Bluetooth devices
-        current_bt_names = set(device.get("name", "") for device in self.bluetooth_devices)
-        previous_bt_names = set(device.get("name", "") for device in previous_state.get("bluetooth_devices", []))
-        new_devices["bluetooth"] = list(current_bt_names - previous_bt_names)
-        
-        # Compare printers
-        current_printer_names = set(printer.get("name", "") for printer in self.printers)
-        previous_printer_names = set(printer.get("name", "") for printer in previous_state.get("printers", []))
-        new_devices["printers"] = list(current_printer_names - previous_printer_names)
+        # Each category is a set difference on device names
+        new_devices = {
+            "usb": list(_names(self.usb_devices, "FriendlyName") - _names(prev_usb, "FriendlyName")),
+            "audio": list(_names(current_audio) - _names(previous_audio)),
+            "bluetooth": list(_names(self.bluetooth_devices) - _names(prev_bluetooth)),
+            "printers": list(_names(self.printers) - _names(prev_printers))
+        }
         
         return new_devices
     
@@ -405,4 +482,7 @@ class DeviceMonitor:
     
     def to_json(self):
         """Convert device information to JSON."""
-        return json.dumps(self.get_detailed_report(), indent=2) 
\ No newline at end of file
+        report = self.get_detailed_report()
+        if orjson:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode('utf-8')
+        return json.dumps(report, indent=2) 
\ No newline at end of file
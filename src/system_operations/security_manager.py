@@ -5,11 +5,36 @@ import logging
 import platform
 import base64
 import hashlib
+import threading
+import time
+import atexit
+from concurrent.futures import Future
 from pathlib import Path
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Set up logger if not already configured
 logger = logging.getLogger("JARVIS.SecurityManager")
 if not logger.handlers:
@@ -29,6 +54,9 @@ class SecurityManager:
     Handles encryption, secure storage, and privacy controls.
     """
     
+    # Minimum seconds between privacy settings writes; changes arriving sooner share the next write
+    PRIVACY_FLUSH_DELAY = 0.5
+    
     def __init__(self, data_dir=None):
         """Initialize the security manager."""
         self.os_type = platform.system().lower()
@@ -58,6 +86,13 @@ class SecurityManager:
         # Privacy settings
         self.privacy_file = self.data_dir / "privacy_settings.json"
         self.privacy_settings = self._load_privacy_settings()
+        self._privacy_lock = threading.Lock()
+        self._privacy_flush_timer = None
+        self._privacy_flush = None
+        self._last_privacy_write = float('-inf')
+        # Write anything still waiting for the timer before the process exits
+        atexit.register(self.flush_privacy_settings)
+        self._sensitive_dirs = set(self.privacy_settings.get("sensitive_directories", []))
         
         # Secure storage for sensitive data
         self.secure_storage_file = self.data_dir / "secure_storage.enc"
@@ -110,15 +145,15 @@ class SecurityManager:
         try:
             if not self.privacy_file.exists():
                 # Create default privacy settings
-                with open(self.privacy_file, 'w') as f:
-                    json.dump(default_settings, f, indent=2)
+                with open(self.privacy_file, 'wb') as f:
+                    f.write(_dumps(default_settings, indent=True))
                 logger.info("Created default privacy settings")
                 return default_settings
             else:
                 # Load existing settings
                 try:
-                    with open(self.privacy_file, 'r') as f:
-                        settings = json.load(f)
+                    with open(self.privacy_file, 'rb') as f:
+                        settings = _loads(f.read())
                     
                     # Update with any new default settings
                     updated = False
@@ -128,15 +163,15 @@ class SecurityManager:
                             updated = True
                     
                     if updated:
-                        with open(self.privacy_file, 'w') as f:
-                            json.dump(settings, f, indent=2)
+                        with open(self.privacy_file, 'wb') as f:
+                            f.write(_dumps(settings, indent=True))
                         logger.info("Updated privacy settings with new defaults")
                     
                     return settings
                 except json.JSONDecodeError:
                     logger.error("Privacy settings file is corrupted, creating new one")
-                    with open(self.privacy_file, 'w') as f:
-                        json.dump(default_settings, f, indent=2)
+                    with open(self.privacy_file, 'wb') as f:
+                        f.write(_dumps(default_settings, indent=True))
                     return default_settings
         except Exception as e:
             logger.error(f"Error loading privacy settings: {e}")
@@ -159,7 +194,7 @@ class SecurityManager:
                     
                     decrypted_data = self.cipher_suite.decrypt(encrypted_data)
                     logger.info("Loaded secure storage")
-                    return json.loads(decrypted_data.decode('utf-8'))
+                    return _loads(decrypted_data)
                 except Exception as inner_e:
                     logger.error(f"Error decrypting secure storage: {inner_e}")
                     logger.warning("Creating new secure storage due to decryption error")
@@ -175,7 +210,7 @@ class SecurityManager:
         try:
             # Verify data is serializable
             try:
-                json_data = json.dumps(data).encode('utf-8')
+                json_data = _dumps(data)
             except (TypeError, ValueError) as e:
                 logger.error(f"Data is not JSON serializable: {e}")
                 return False
@@ -216,40 +251,99 @@ class SecurityManager:
             return False
             
         try:
-            # Merge with existing settings
-            updated_settings = self.privacy_settings.copy()
+            with self._privacy_lock:
+                # Merge with existing settings
+                updated_settings = self.privacy_settings.copy()
             
-            # Make sure we don't accept invalid settings
-            valid_keys = [
-                "collect_system_info", "collect_usage_data", "store_command_history",
-                "allow_network_access", "allow_file_system_access", "allow_process_management",
-                "sensitive_directories", "excluded_file_types"
-            ]
+                # Make sure we don't accept invalid settings
+                valid_keys = [
+                    "collect_system_info", "collect_usage_data", "store_command_history",
+                    "allow_network_access", "allow_file_system_access", "allow_process_management",
+                    "sensitive_directories", "excluded_file_types"
+                ]
             
-            # Only update valid settings
-            for key, value in settings.items():
-                if key in valid_keys:
-                    updated_settings[key] = value
-                else:
-                    logger.warning(f"Ignoring invalid setting: {key}")
+                # Only update valid settings
+                for key, value in settings.items():
+                    if key in valid_keys:
+                        updated_settings[key] = value
+                    else:
+                        logger.warning(f"Ignoring invalid setting: {key}")
             
-            # Save to file
-            try:
-                with open(self.privacy_file, 'w') as f:
-                    json.dump(updated_settings, f, indent=2)
-                
-                # Update in-memory settings
+                # Update in-memory settings and coalesce the file write with any changes that follow
                 self.privacy_settings = updated_settings
-                logger.info(f"Updated privacy settings: {list(settings.keys())}")
-                
+                if "sensitive_directories" in settings:
+                    self._sensitive_dirs = set(updated_settings["sensitive_directories"])
+                flush = self._schedule_privacy_flush()
+            
+            logger.info(f"Updated privacy settings: {list(settings.keys())}")
+            
+            # Only report success once the change is actually on disk
+            return flush.result()
+        except Exception as e:
+            logger.error(f"Error updating privacy settings: {e}")
+            return False
+    
+    def _schedule_privacy_flush(self):
+        """
+        Return the Future of the next privacy settings write, scheduling one if none is pending.
+        
+        The write runs right away unless another one happened within PRIVACY_FLUSH_DELAY,
+        in which case it waits out the rest of that window. Caller holds _privacy_lock.
+        """
+        if self._privacy_flush is None:
+            self._privacy_flush = Future()
+            delay = max(0.0, self._last_privacy_write + self.PRIVACY_FLUSH_DELAY - time.monotonic())
+            self._privacy_flush_timer = threading.Timer(delay, self.flush_privacy_settings)
+            self._privacy_flush_timer.start()
+        return self._privacy_flush
+    
+    def flush_privacy_settings(self):
+        """
+        Write pending privacy settings to disk.
+        
+        Returns:
+            bool: Success status, True if nothing was pending
+        """
+        with self._privacy_lock:
+            if self._privacy_flush_timer is not None:
+                self._privacy_flush_timer.cancel()
+                self._privacy_flush_timer = None
+            flush, self._privacy_flush = self._privacy_flush, None
+            if flush is None:
                 return True
+            
+            # Write to a temporary file and swap it in so a crash never leaves half a settings file
+            tmp_file = self.privacy_file.with_suffix(".tmp")
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dumps(self.privacy_settings, indent=True))
+                os.replace(tmp_file, self.privacy_file)
+                logger.debug("Privacy settings saved")
+                success = True
             except (IOError, PermissionError) as e:
                 logger.error(f"Error writing privacy settings file: {e}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error updating privacy settings: {e}")
+                success = False
+            self._last_privacy_write = time.monotonic()
+        
+        # Every update waiting on this write gets its real outcome
+        flush.set_result(success)
+        return success
+    
+    def add_sensitive_directory(self, directory):
+        """
+        Add a directory to the sensitive directories list.
+        
+        Args:
+            directory (str): Resolved directory path
+            
+        Returns:
+            bool: True if added, False if it was already protected or saving failed
+        """
+        if directory in self._sensitive_dirs:
             return False
+        
+        sensitive_dirs = self.privacy_settings.get("sensitive_directories", []) + [directory]
+        return self.update_privacy_settings({"sensitive_directories": sensitive_dirs})
     
     def check_privacy_permission(self, permission_type):
         """
@@ -5,11 +5,16 @@ import subprocess
 import psutil
 import socket
 import logging
+import time
 import json
 from pathlib import Path
 
 logger = logging.getLogger("JARVIS.SystemAnalyzer")
 
+# How long live snapshots stay valid, so a burst of related queries doesn't re-poll the system
+SNAPSHOT_TTL = 2
+APPLICATIONS_TTL = 300
+
 class SystemAnalyzer:
     """
     Analyzes system components and provides detailed information about the PC.
@@ -18,6 +23,7 @@ class SystemAnalyzer:
     
     def __init__(self):
         """Initialize the system analyzer."""
+        self._snapshots = {}
         self.os_type = platform.system().lower()
         self.os_info = self._get_os_info()
         self.cpu_info = self._get_cpu_info()
@@ -193,6 +199,17 @@ class SystemAnalyzer:
         
         return graphics_info
     
+    def _cached(self, key, ttl, compute):
+        """Return the cached snapshot for key, recomputing it once it is older than ttl seconds."""
+        now = time.monotonic()
+        cached = self._snapshots.get(key)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        
+        value = compute()
+        self._snapshots[key] = (now, value)
+        return value
+    
     def _format_bytes(self, bytes_value):
         """Format bytes to a human-readable format."""
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -233,15 +250,21 @@ class SystemAnalyzer:
     
     def get_running_processes(self):
         """Get a list of running processes."""
+        return self._cached("processes", SNAPSHOT_TTL, self._collect_running_processes)
+    
+    def _collect_running_processes(self):
+        """Collect the list of running processes."""
         processes = []
         for proc in psutil.process_iter(['pid', 'name', 'username', 'memory_info']):
             try:
                 process_info = proc.info
+                memory_bytes = process_info['memory_info'].rss if process_info['memory_info'] else 0
                 processes.append({
                     "pid": process_info['pid'],
                     "name": process_info['name'],
                     "username": process_info['username'],
-                    "memory_usage": self._format_bytes(process_info['memory_info'].rss if process_info['memory_info'] else 0)
+                    "memory_bytes": memory_bytes,
+                    "memory_usage": self._format_bytes(memory_bytes)
                 })
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
@@ -250,6 +273,10 @@ class SystemAnalyzer:
     
     def get_installed_applications(self):
         """Get a list of installed applications."""
+        return self._cached("applications", APPLICATIONS_TTL, self._collect_installed_applications)
+    
+    def _collect_installed_applications(self):
+        """Collect the list of installed applications."""
         applications = []
         
         if self.os_type == 'windows':
@@ -279,6 +306,10 @@ class SystemAnalyzer:
     
     def get_system_health(self):
         """Get the current health status of the system."""
+        return self._cached("health", SNAPSHOT_TTL, self._collect_system_health)
+    
+    def _collect_system_health(self):
+        """Collect the current health status of the system."""
         health = {
             "cpu_usage": psutil.cpu_percent(interval=1),
             "memory_usage": psutil.virtual_memory().percent,
@@ -364,28 +395,43 @@ class SystemAnalyzer:
                 logger.error(f"Invalid directory: {dir_path}")
                 return stats
             
-            # Walk through directory
-            for file_path in dir_path.glob("**/*"):
-                if file_path.is_file():
-                    stats["total_files"] += 1
-                    file_size = file_path.stat().st_size
-                    stats["total_size"] += file_size
-                    
-                    # Get extension
-                    ext = file_path.suffix.lower()
-                    if ext:
-                        if ext not in stats["extensions"]:
-                            stats["extensions"][ext] = {"count": 0, "size": 0}
-                        
-                        stats["extensions"][ext]["count"] += 1
-                        stats["extensions"][ext]["size"] += file_size
+            # Tally into flat counters while walking, and build the per-extension dicts once at the end
+            total_files = 0
+            total_size = 0
+            ext_counts = {}
+            ext_sizes = {}
+            pending = [str(dir_path)]
+            while pending:
+                try:
+                    entries = os.scandir(pending.pop())
+                except OSError:
+                    continue
+                
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            # scandir reuses the directory listing's metadata where the OS provides it
+                            file_size = entry.stat().st_size
+                            total_files += 1
+                            total_size += file_size
+                            
+                            # Get extension
+                            ext = os.path.splitext(entry.name)[1].lower()
+                            if ext:
+                                ext_counts[ext] = ext_counts.get(ext, 0) + 1
+                                ext_sizes[ext] = ext_sizes.get(ext, 0) + file_size
             
-            # Format total size
-            stats["total_size_formatted"] = self._format_bytes(stats["total_size"])
+            stats["total_files"] = total_files
+            stats["total_size"] = total_size
+            stats["extensions"] = {
+                ext: {"count": count, "size": ext_sizes[ext], "size_formatted": self._format_bytes(ext_sizes[ext])}
+                for ext, count in ext_counts.items()
+            }
             
-            # Format extension sizes
-            for ext in stats["extensions"]:
-                stats["extensions"][ext]["size_formatted"] = self._format_bytes(stats["extensions"][ext]["size"])
+            # Format total size
+            stats["total_size_formatted"] = self._format_bytes(total_size)
                 
         except Exception as e:
             logger.error(f"Error analyzing file types: {e}")
@@ -4,6 +4,7 @@ import subprocess
 import logging
 import platform
 import shutil
+import threading
 from pathlib import Path
 from src.system_operations.app_finder import AppFinder
 
@@ -437,36 +438,72 @@ class SystemHandler:
             logger.error(f"Failed to delete {path}: {e}")
             return False
     
-    def execute_command(self, command, shell=True):
+    def execute_command(self, command, shell=True, on_output=None):
         """
         Execute a system command.
         
         Args:
             command (str): Command to execute
             shell (bool): Whether to run the command in a shell
+            on_output (callable): Optional callback invoked with each stdout line
+                as soon as the command produces it
             
         Returns:
             tuple: (success status, command output)
         """
         try:
-            result = subprocess.run(
-                command, 
-                shell=shell, 
-                capture_output=True, 
-                text=True,
-                timeout=30
-            )
+            if on_output is None:
+                result = subprocess.run(
+                    command, 
+                    shell=shell, 
+                    capture_output=True, 
+                    text=True,
+                    timeout=30
+                )
+                returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+            else:
+                returncode, stdout, stderr = self._stream_command(command, shell, on_output)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info(f"Command executed successfully: {command}")
-                return True, result.stdout
+                return True, stdout
             else:
-                logger.error(f"Command failed: {command}, Error: {result.stderr}")
-                return False, result.stderr
+                logger.error(f"Command failed: {command}, Error: {stderr}")
+                return False, stderr
         except Exception as e:
             logger.error(f"Failed to execute command {command}: {e}")
             return False, str(e)
     
+    def _stream_command(self, command, shell, on_output, timeout=30):
+        """Run a command and hand each stdout line to on_output while it is still running"""
+        proc = subprocess.Popen(
+            command,
+            shell=shell,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        # Drain stderr on the side so a chatty command can't block on a full pipe,
+        # and kill the command if it outlives the same timeout as the blocking path
+        stderr = []
+        err_reader = threading.Thread(target=lambda: stderr.append(proc.stderr.read()), daemon=True)
+        err_reader.start()
+        killer = threading.Timer(timeout, proc.kill)
+        killer.start()
+        
+        stdout = []
+        try:
+            for line in proc.stdout:
+                stdout.append(line)
+                on_output(line)
+            proc.wait()
+        finally:
+            killer.cancel()
+            err_reader.join(timeout=1)
+        
+        return proc.returncode, "".join(stdout), "".join(stderr)
+    
     def _resolve_path(self, path_str):
         """
         Resolve a path string to an absolute Path object.
@@ -0,0 +1,41 @@
+import os
+import stat
+import time
+
+class PathCache:
+    """Short-lived cache of path existence checks, so repeated commands on the
+    same directory don't stat it again within the TTL."""
+    
+    def __init__(self, ttl=1.0):
+        """Initialize the cache with a time-to-live in seconds."""
+        self.ttl = ttl
+        self._modes = {}
+    
+    def _mode(self, path):
+        """Return the cached st_mode for path (None if it doesn't exist), from a single os.stat"""
+        key = str(path)
+        now = time.monotonic()
+        entry = self._modes.get(key)
+        if entry and now - entry[0] < self.ttl:
+            return entry[1]
+        
+        try:
+            mode = os.stat(key).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            mode = None
+        self._modes[key] = (now, mode)
+        return mode
+    
+    def exists(self, path):
+        """Check whether path exists."""
+        return self._mode(path) is not None
+    
+    def is_dir(self, path):
+        """Check whether path exists and is a directory."""
+        mode = self._mode(path)
+        return mode is not None and stat.S_ISDIR(mode)
+    
+    def invalidate(self, *paths):
+        """Forget cached results for paths that were just changed."""
+        for path in paths:
+            self._modes.pop(str(path), None)